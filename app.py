@@ -3,8 +3,11 @@ import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import io
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 from cpt_processor import CPTProcessor
 from soil_classification import (SoilLayering, RobertsonClassification, 
@@ -13,8 +16,6 @@ from soil_classification import (SoilLayering, RobertsonClassification,
 from correlations import CPTCorrelations
 from settlement_calc import SettlementCalculator
 from export_utils import ExportManager
-from visualization_3d import CPT3DVisualizer
-from soil_database import SoilPropertyDatabase
 
 st.set_page_config(
     page_title="CPT Analysis & Settlement Calculator",
@@ -23,9 +24,438 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Serialize figures with orjson - markedly faster than stdlib json for the
+# wide array payloads in the profile and classification tabs
+pio.json.config.default_engine = 'orjson'
+
 st.title("🏗️ CPT Analysis & Settlement Calculator")
 st.markdown("*Geotechnical analysis tool based on Settle3 correlations*")
 
+@st.cache_resource
+def _processor() -> CPTProcessor:
+    return CPTProcessor()
+
+@st.cache_resource
+def _layering(min_thickness: float) -> SoilLayering:
+    return SoilLayering(min_thickness)
+
+@st.cache_resource
+def _correlator() -> CPTCorrelations:
+    return CPTCorrelations()
+
+@st.cache_resource
+def _exporter() -> ExportManager:
+    return ExportManager()
+
+@st.cache_resource
+def _soil_db():
+    from soil_database import SoilPropertyDatabase
+    return SoilPropertyDatabase()
+
+@st.cache_resource
+def _visualizer():
+    from visualization_3d import CPT3DVisualizer
+    return CPT3DVisualizer()
+
+@st.cache_data(show_spinner=False, max_entries=32, ttl=3600)
+def _process_cpt_cached(file_bytes: bytes, file_name: str, gamma: float,
+                        wt: float, min_thk: float) -> dict:
+    """
+    Run the full parse -> classify -> layer -> correlate pipeline for one file.
+
+    Cached on the raw file bytes plus the analysis parameters so reruns
+    (tab switches, widget changes) skip the heavy processing entirely.
+    """
+    result = _processor().process_cpt_file(io.BytesIO(file_bytes), file_name, gamma, wt)
+
+    layers = _layering(min_thk).process_layering(result['data'])
+
+    layer_params = _correlator().process_all_layers_vec(layers)
+
+    summary = dict(result['summary'])
+    summary['n_layers'] = len(layers)
+    summary['avg_E'] = layer_params['youngs_modulus'].mean() if len(layer_params) > 0 else 0
+    summary['avg_OCR'] = layer_params['OCR'].mean() if len(layer_params) > 0 else 0
+
+    # Contiguous NumPy views of the hot plotting columns, materialized once
+    # so tab renders skip repeated Series -> array conversion.
+    arrays = {col: np.ascontiguousarray(result['data'][col].to_numpy(), dtype=np.float64)
+              for col in ('depth', 'qc', 'fs', 'u2', 'Rf', 'Qt1', 'Fr', 'Ic')}
+
+    return {
+        'data': result['data'],
+        'layers': layers,
+        'parameters': layer_params,
+        'summary': summary,
+        'arrays': arrays,
+        'depth_max': float(arrays['depth'].max())
+    }
+
+def _params_hash(params: pd.DataFrame) -> int:
+    """Stable content hash for a layer-parameters DataFrame, used as a cache key."""
+    return int(pd.util.hash_pandas_object(params).sum())
+
+# Hash DataFrame arguments with the C-backed pandas hash instead of letting
+# Streamlit walk every value in Python.
+_HASH_FUNCS = {pd.DataFrame: _params_hash}
+
+@st.cache_data(show_spinner=False)
+def _compute_settlement(cpt_name: str, load: float, width: float, length: float,
+                        depth: float, wt: float, params_key: int) -> dict:
+    """
+    Cached total-settlement computation; params_key fingerprints the layer
+    parameters so identical footing/CPT inputs reuse the previous result.
+    """
+    params = st.session_state.processed_cpts[cpt_name]['parameters']
+    return SettlementCalculator().calculate_total_settlement(
+        params, load, width, length, depth, wt)
+
+@st.cache_data(show_spinner=False)
+def _compute_time_curve(cpt_name: str, load: float, width: float, length: float,
+                        depth: float, wt: float, max_time: float,
+                        include_secondary: bool, c_alpha: float,
+                        params_key: int) -> dict:
+    """Cached settlement-vs-time curve for one CPT and loading configuration."""
+    params = st.session_state.processed_cpts[cpt_name]['parameters']
+    return SettlementCalculator().generate_time_settlement_curve(
+        params, load, width, length,
+        max_time_years=max_time, num_points=100,
+        footing_depth=depth, water_table_depth=wt,
+        include_secondary=include_secondary, c_alpha=c_alpha)
+
+@st.cache_data(show_spinner=False)
+def _compute_layer_times(cpt_name: str, target_degree: float, params_key: int) -> dict:
+    """Cached per-layer consolidation times for one CPT and target degree."""
+    params = st.session_state.processed_cpts[cpt_name]['parameters']
+    return SettlementCalculator().calculate_consolidation_time(
+        params, target_degree=target_degree)
+
+@st.cache_data(show_spinner=False)
+def _prep_param_views(cpt_name: str, params_key: int):
+    """
+    Derive the tab5 display table (renamed columns, rounded) and the
+    clay-layer view once per parameter set instead of on every rerun.
+    """
+    params = st.session_state.processed_cpts[cpt_name]['parameters']
+
+    display_params = params[[
+        'layer_number', 'soil_type', 'thickness', 'Ic',
+        'youngs_modulus', 'constrained_modulus',
+        'compression_index', 'recompression_index',
+        'OCR', 'friction_angle', 'undrained_shear_strength'
+    ]].copy()
+    display_params.columns = [
+        'Layer', 'Soil Type', 'H (m)', 'Ic',
+        'E (kPa)', 'M (kPa)', 'Cc', 'Cr',
+        'OCR', 'φ (°)', 'Su (kPa)'
+    ]
+    clay_layers = params[params['Ic'] > 2.6]
+    return _downcast_floats(display_params), clay_layers
+
+def _downcast_floats(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcast float64 columns to float32 before display; parameter tables
+    carry no precision beyond a few digits and the Arrow payload halves.
+    """
+    f64 = df.select_dtypes(include='float64').columns
+    if len(f64):
+        df = df.astype({c: np.float32 for c in f64})
+    return df
+
+def _float_format(df: pd.DataFrame, fmt: str = "%.2f") -> dict:
+    """
+    column_config that formats float columns in the frontend, avoiding
+    the rounded DataFrame copy that df.round() would allocate per rerun.
+    """
+    return {c: st.column_config.NumberColumn(format=fmt)
+            for c in df.select_dtypes('float').columns}
+
+@st.cache_data(show_spinner=False)
+def _param_fig_dict(cpt_name: str, params_key: int) -> dict:
+    """
+    Build the tab5 parameter charts as a single 2x2 subplot figure,
+    cached per parameter set and returned as a plain dict; one chart
+    means one frontend payload and one Plotly initialization instead
+    of four.
+    """
+    params = st.session_state.processed_cpts[cpt_name]['parameters']
+    _, clay_layers = _prep_param_views(cpt_name, params_key)
+
+    fig = make_subplots(
+        rows=2, cols=2,
+        subplot_titles=(
+            "Young's Modulus (E) by Layer",
+            "Compression Indices (Cc, Cr) for Clay Layers",
+            "Over-Consolidation Ratio (OCR) by Layer",
+            "Permeability (k) by Layer"
+        )
+    )
+
+    fig.add_trace(go.Bar(
+        x=params['layer_number'],
+        y=params['youngs_modulus'],
+        name="Young's Modulus",
+        marker_color='lightblue'
+    ), row=1, col=1)
+
+    if len(clay_layers) > 0:
+        fig.add_trace(go.Bar(
+            x=clay_layers['layer_number'],
+            y=clay_layers['compression_index'],
+            name="Cc",
+            marker_color='coral'
+        ), row=1, col=2)
+        fig.add_trace(go.Bar(
+            x=clay_layers['layer_number'],
+            y=clay_layers['recompression_index'],
+            name="Cr",
+            marker_color='lightcoral'
+        ), row=1, col=2)
+
+    fig.add_trace(go.Bar(
+        x=params['layer_number'],
+        y=params['OCR'],
+        name="OCR",
+        marker_color='lightgreen'
+    ), row=2, col=1)
+
+    fig.add_trace(go.Bar(
+        x=params['layer_number'],
+        y=params['permeability'],
+        name="Permeability",
+        marker_color='purple'
+    ), row=2, col=2)
+
+    fig.update_xaxes(title_text="Layer Number")
+    fig.update_yaxes(title_text="E (kPa)", row=1, col=1)
+    fig.update_yaxes(title_text="Index", row=1, col=2)
+    fig.update_yaxes(title_text="OCR", row=2, col=1)
+    fig.update_yaxes(title_text="k (m/s)", type="log", row=2, col=2)
+    fig.update_layout(height=600, showlegend=False)
+
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False, hash_funcs=_HASH_FUNCS)
+def _settlement_fig_dicts(immediate_df: pd.DataFrame,
+                          consolidation_df: pd.DataFrame) -> tuple:
+    """Per-layer settlement bar charts as dicts, cached on the detail frames."""
+    fig_imm = go.Figure()
+    fig_imm.add_trace(go.Bar(
+        x=immediate_df['layer_number'],
+        y=immediate_df['settlement_mm'],
+        marker_color='skyblue',
+        text=immediate_df['settlement_mm'].round(1),
+        textposition='outside'
+    ))
+    fig_imm.update_layout(
+        title="Immediate Settlement by Layer",
+        xaxis_title="Layer Number",
+        yaxis_title="Settlement (mm)",
+        height=400
+    )
+
+    fig_cons = go.Figure()
+    fig_cons.add_trace(go.Bar(
+        x=consolidation_df['layer_number'],
+        y=consolidation_df['settlement_mm'],
+        marker_color='coral',
+        text=consolidation_df['settlement_mm'].round(1),
+        textposition='outside'
+    ))
+    fig_cons.update_layout(
+        title="Consolidation Settlement by Layer",
+        xaxis_title="Layer Number",
+        yaxis_title="Settlement (mm)",
+        height=400
+    )
+
+    return fig_imm.to_dict(), fig_cons.to_dict()
+
+@st.cache_data(show_spinner=False)
+def _time_fig_dict(time_curve_data: dict) -> dict:
+    """Settlement-vs-time figure as a dict, cached on the curve data."""
+    fig_time = go.Figure()
+
+    # Primary consolidation curve
+    fig_time.add_trace(go.Scattergl(
+        x=time_curve_data['time_years'],
+        y=time_curve_data['settlement_primary_mm'],
+        mode='lines',
+        name='Primary Consolidation',
+        line=dict(color='blue', width=2),
+        hovertemplate='Time: %{x:.2f} years<br>Settlement: %{y:.1f} mm<extra></extra>'
+    ))
+
+    # Total settlement (with secondary compression if included)
+    if time_curve_data['secondary_compression_included']:
+        fig_time.add_trace(go.Scattergl(
+            x=time_curve_data['time_years'],
+            y=time_curve_data['settlement_total_mm'],
+            mode='lines',
+            name='Total (Primary + Secondary)',
+            line=dict(color='red', width=2, dash='dash'),
+            hovertemplate='Time: %{x:.2f} years<br>Settlement: %{y:.1f} mm<extra></extra>'
+        ))
+
+    # Add horizontal line for immediate settlement
+    fig_time.add_hline(
+        y=time_curve_data['immediate_settlement_mm'],
+        line_dash="dot",
+        line_color="green",
+        annotation_text=f"Immediate: {time_curve_data['immediate_settlement_mm']:.1f} mm"
+    )
+
+    fig_time.update_xaxes(
+        title="Time (years)",
+        type='log',
+        showgrid=True
+    )
+    fig_time.update_yaxes(
+        title="Settlement (mm)",
+        showgrid=True
+    )
+    fig_time.update_layout(
+        title="Settlement vs Time",
+        height=500,
+        hovermode='x unified',
+        legend=dict(
+            yanchor="top",
+            y=0.99,
+            xanchor="right",
+            x=0.99
+        )
+    )
+
+    return fig_time.to_dict()
+
+@st.cache_data(show_spinner=False)
+def _export_excel_bytes(cpt_name: str, params_key: int) -> bytes:
+    """
+    Cached Excel export; download_button materializes data eagerly on every
+    rerun, so reruns reuse the rendered workbook bytes.
+    """
+    processed = st.session_state.processed_cpts[cpt_name]
+    return _exporter().export_to_excel(
+        processed, processed['layers'], processed['parameters'],
+        f"{cpt_name}_analysis.xlsx")
+
+@st.cache_data(show_spinner=False)
+def _export_settlement_bytes(cpt_name: str, load_config_key: tuple,
+                             params_key: int) -> bytes:
+    """Cached settlement-results Excel export for one CPT and loading configuration."""
+    params = st.session_state.processed_cpts[cpt_name]['parameters']
+    load_config = dict(zip(('load', 'width', 'length', 'depth'), load_config_key))
+    return _exporter().export_settlement_results(
+        st.session_state['settlement_results'], params, load_config)
+
+@st.cache_data(show_spinner=False)
+def _export_pdf_bytes(cpt_name: str, load_config_key: tuple,
+                      params_key: int) -> bytes:
+    """Cached PDF report for one CPT and loading configuration."""
+    processed = st.session_state.processed_cpts[cpt_name]
+    load_config = dict(zip(('load', 'width', 'length', 'depth'), load_config_key))
+    return _exporter().generate_pdf_report(
+        cpt_name, processed['summary'], processed['layers'],
+        processed['parameters'], st.session_state['settlement_results'],
+        load_config)
+
+@st.cache_data(show_spinner=False)
+def _build_comparison_df(cpt_fingerprint: tuple) -> pd.DataFrame:
+    """
+    Build the multi-CPT comparison table from the per-CPT summaries.
+
+    Cached against the tuple of loaded CPT names so reruns reuse the
+    DataFrame until the set of CPTs changes.
+    """
+    comparison_data = []
+    for cpt_name in cpt_fingerprint:
+        summary = st.session_state.processed_cpts[cpt_name]['summary']
+        comparison_data.append({
+            'CPT Name': cpt_name,
+            'Max Depth (m)': summary['depth_range'][1],
+            'Avg qc (kPa)': summary['avg_qc'],
+            'Avg Ic': summary['avg_Ic'],
+            'Number of Layers': summary['n_layers'],
+            'Dominant Soil': summary['predominant_soil'],
+            'Avg E (kPa)': summary['avg_E'],
+            'Avg OCR': summary['avg_OCR']
+        })
+    df = pd.DataFrame(comparison_data)
+    # Round once here so display doesn't re-copy the frame every rerun
+    float_cols = df.select_dtypes(include='float').columns
+    df[float_cols] = df[float_cols].round(2).astype(np.float32)
+    return df
+
+@st.cache_data(show_spinner=False)
+def _build_cpt_locations(cpt_fingerprint: tuple, coords_tuple: tuple) -> dict:
+    """
+    Assemble the tab7 location dict once per (CPT set, coordinates)
+    combination. The per-CPT layers .to_dict('records') conversion is
+    the costly part and only needs to rerun when either input changes.
+    """
+    coords_by_name = {name: (x, y) for name, x, y in coords_tuple}
+    cpt_locations = {}
+    for cpt_name in cpt_fingerprint:
+        cpt_info = st.session_state.processed_cpts[cpt_name]
+        x, y = coords_by_name.get(cpt_name, (0.0, 0.0))
+        layers = cpt_info['layers']
+        cpt_locations[cpt_name] = {
+            'x': x,
+            'y': y,
+            'data': cpt_info['data'],
+            'layers': layers.to_dict('records') if hasattr(layers, 'to_dict') else layers
+        }
+    return cpt_locations
+
+def _downsample_profile(x, y, max_points: int = 2000):
+    """
+    Stride-downsample a depth profile so at most max_points samples are
+    sent to the browser. Long soundings plot identically at screen
+    resolution but with a fraction of the figure JSON.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if len(x) <= max_points:
+        return x, y
+    step = int(np.ceil(len(x) / max_points))
+    return x[::step], y[::step]
+
+@st.cache_data(show_spinner=False)
+def _soil_type_counts(cpt_name: str, method: str) -> pd.Series:
+    """
+    Classify (if needed) and count soil types for one CPT and method.
+
+    Cached per (CPT, method) pair so the pie-chart aggregation is done
+    once instead of on every tab3 interaction.
+    """
+    cpt_info = st.session_state.processed_cpts[cpt_name]
+    if method == 'Robertson2009':
+        return cpt_info['data']['soil_type'].value_counts()
+
+    arrays = cpt_info['arrays']
+    if method == 'Robertson1990':
+        types = Robertson1990Classification.classify_soil_type_vec(
+            arrays['Qt1'], arrays['Fr'], arrays['Ic'])
+    else:
+        types = Schneider2008Classification.classify_soil_type_vec(
+            arrays['Qt1'], arrays['Fr'])
+    return pd.Series(pd.Categorical(types)).value_counts()
+
+@st.cache_data(show_spinner=False)
+def _robertson2009_contours():
+    """Ic contour geometry for the Robertson (2009) chart; fixed per process."""
+    return RobertsonClassification.calculate_Ic_contours((1, 1000))
+
+@st.cache_data(show_spinner=False)
+def _robertson1990_contours():
+    """Ic contour geometry for the Robertson (1990) chart; fixed per process."""
+    return Robertson1990Classification.calculate_Ic_contours((1, 1000))
+
+@st.cache_data(show_spinner=False)
+def _schneider2008_boundaries():
+    """Zone boundary lines for the Schneider (2008) Q-F chart; fixed per process."""
+    return Schneider2008Classification.calculate_zone_boundaries()
+
 if 'cpt_data' not in st.session_state:
     st.session_state.cpt_data = {}
 if 'processed_cpts' not in st.session_state:
@@ -82,35 +512,45 @@ with tab1:
     )
     
     if uploaded_files:
-        processor = CPTProcessor()
-        
-        for file in uploaded_files:
-            file_name = file.name.replace('.xlsx', '').replace('.xls', '').replace('.txt', '').replace('.csv', '')
-            
-            if file_name not in st.session_state.cpt_data:
+        processed_names = st.session_state.setdefault('_processed_names', set())
+
+        # file_uploader re-serves the same files on every rerun;
+        # skip anything already processed before touching its bytes
+        pending = [
+            file for file in uploaded_files
+            if os.path.splitext(file.name)[0] not in processed_names
+        ]
+
+        if pending:
+            # Files are independent, so fan the heavy parse+normalize work
+            # out across threads; pandas/numpy release the GIL for the
+            # bulk of it. Session state is only touched on this thread.
+            with st.spinner(f"Processing {len(pending)} file(s)..."), \
+                    ThreadPoolExecutor(max_workers=min(len(pending), os.cpu_count() or 4)) as pool:
+                futures = [
+                    (file, pool.submit(
+                        _process_cpt_cached,
+                        file.getvalue(),
+                        file.name,
+                        gamma_soil,
+                        water_table_depth,
+                        min_layer_thickness
+                    ))
+                    for file in pending
+                ]
+
+            for file, future in futures:
+                file_name = os.path.splitext(file.name)[0]
                 try:
-                    with st.spinner(f"Processing {file_name}..."):
-                        result = processor.process_cpt_file(
-                            file, 
-                            file_name, 
-                            gamma_soil, 
-                            water_table_depth
-                        )
-                        st.session_state.cpt_data[file_name] = result
-                        
-                        layering = SoilLayering(min_layer_thickness)
-                        layers = layering.process_layering(result['data'])
-                        
-                        correlator = CPTCorrelations()
-                        layer_params = correlator.process_all_layers(layers)
-                        
-                        st.session_state.processed_cpts[file_name] = {
-                            'data': result['data'],
-                            'layers': layers,
-                            'parameters': layer_params,
-                            'summary': result['summary']
-                        }
-                    
+                    processed = future.result()
+                    st.session_state.cpt_data[file_name] = {
+                        'name': file_name,
+                        'data': processed['data'],
+                        'summary': processed['summary']
+                    }
+                    st.session_state.processed_cpts[file_name] = processed
+                    processed_names.add(file_name)
+
                     st.success(f"✅ Successfully processed: {file_name}")
                 except Exception as e:
                     st.error(f"❌ Error processing {file_name}: {str(e)}")
@@ -127,6 +567,8 @@ with tab1:
                 with col3:
                     st.metric("Predominant Soil", summary['predominant_soil'])
 
+cpt_keys = tuple(st.session_state.processed_cpts.keys())
+
 with tab2:
     st.header("CPT Profiles")
     
@@ -135,8 +577,8 @@ with tab2:
     else:
         selected_cpts = st.multiselect(
             "Select CPTs to display",
-            options=list(st.session_state.processed_cpts.keys()),
-            default=list(st.session_state.processed_cpts.keys())
+            options=cpt_keys,
+            default=cpt_keys
         )
         
         if selected_cpts:
@@ -152,43 +594,48 @@ with tab2:
             )
             
             for cpt_name in selected_cpts:
-                data = st.session_state.processed_cpts[cpt_name]['data']
+                arrays = st.session_state.processed_cpts[cpt_name]['arrays']
                 
                 if "Cone Resistance" in profile_type:
-                    fig.add_trace(go.Scatter(
-                        x=data['qc'], y=data['depth'],
+                    x_vals, y_vals = _downsample_profile(arrays['qc'], arrays['depth'])
+                    fig.add_trace(go.Scattergl(
+                        x=x_vals, y=y_vals,
                         mode='lines', name=f"{cpt_name} - qc",
                         line=dict(width=2)
                     ))
                     fig.update_xaxes(title_text="Cone Resistance qc (kPa)")
                 
                 elif "Friction Ratio" in profile_type:
-                    fig.add_trace(go.Scatter(
-                        x=data['Rf'], y=data['depth'],
+                    x_vals, y_vals = _downsample_profile(arrays['Rf'], arrays['depth'])
+                    fig.add_trace(go.Scattergl(
+                        x=x_vals, y=y_vals,
                         mode='lines', name=f"{cpt_name} - Rf",
                         line=dict(width=2)
                     ))
                     fig.update_xaxes(title_text="Friction Ratio Rf (%)")
                 
                 elif "Pore Pressure" in profile_type:
-                    fig.add_trace(go.Scatter(
-                        x=data['u2'], y=data['depth'],
+                    x_vals, y_vals = _downsample_profile(arrays['u2'], arrays['depth'])
+                    fig.add_trace(go.Scattergl(
+                        x=x_vals, y=y_vals,
                         mode='lines', name=f"{cpt_name} - u2",
                         line=dict(width=2)
                     ))
                     fig.update_xaxes(title_text="Pore Pressure u2 (kPa)")
                 
                 elif "Normalized" in profile_type:
-                    fig.add_trace(go.Scatter(
-                        x=data['Qt1'], y=data['depth'],
+                    x_vals, y_vals = _downsample_profile(arrays['Qt1'], arrays['depth'])
+                    fig.add_trace(go.Scattergl(
+                        x=x_vals, y=y_vals,
                         mode='lines', name=f"{cpt_name} - Qt",
                         line=dict(width=2)
                     ))
                     fig.update_xaxes(title_text="Normalized Cone Resistance Qt", type='log')
                 
                 elif "Soil Behavior" in profile_type:
-                    fig.add_trace(go.Scatter(
-                        x=data['Ic'], y=data['depth'],
+                    x_vals, y_vals = _downsample_profile(arrays['Ic'], arrays['depth'])
+                    fig.add_trace(go.Scattergl(
+                        x=x_vals, y=y_vals,
                         mode='lines', name=f"{cpt_name} - Ic",
                         line=dict(width=2)
                     ))
@@ -203,25 +650,8 @@ with tab2:
                 st.markdown("---")
                 st.subheader("📊 Multi-CPT Comparison & Batch Export")
                 
-                comparison_data = []
-                for cpt_name, cpt_info in st.session_state.processed_cpts.items():
-                    summary = cpt_info['summary']
-                    layers = cpt_info['layers']
-                    params = cpt_info['parameters']
-                    
-                    comparison_data.append({
-                        'CPT Name': cpt_name,
-                        'Max Depth (m)': summary['depth_range'][1],
-                        'Avg qc (kPa)': summary['avg_qc'],
-                        'Avg Ic': summary['avg_Ic'],
-                        'Number of Layers': len(layers),
-                        'Dominant Soil': summary['predominant_soil'],
-                        'Avg E (kPa)': params['youngs_modulus'].mean() if len(params) > 0 else 0,
-                        'Avg OCR': params['OCR'].mean() if len(params) > 0 else 0
-                    })
-                
-                comparison_df = pd.DataFrame(comparison_data)
-                st.dataframe(comparison_df.round(2), hide_index=True, use_container_width=True)
+                comparison_df = _build_comparison_df(cpt_keys)
+                st.dataframe(comparison_df, hide_index=True, use_container_width=True)
                 
                 col_batch1, col_batch2 = st.columns(2)
                 
@@ -230,10 +660,9 @@ with tab2:
                     if st.button("📦 Generate Batch Report", key="batch_report"):
                         with st.spinner("Generating batch report for all CPTs..."):
                             # Create a combined Excel workbook with all CPTs
-                            exporter = ExportManager()
                             output = io.BytesIO()
-                            
-                            with pd.ExcelWriter(output, engine='openpyxl') as writer:
+
+                            with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
                                 # Summary sheet
                                 comparison_df.to_excel(writer, sheet_name='Summary', index=False)
                                 
@@ -245,12 +674,12 @@ with tab2:
                                     layers = cpt_info['layers']
                                     params = cpt_info['parameters']
                                     
-                                    # Combine layers and params
-                                    combined = pd.merge(
-                                        layers[['layer_number', 'soil_type', 'top_depth', 'bottom_depth', 'thickness']],
-                                        params[['layer_number', 'youngs_modulus', 'compression_index', 'OCR']],
-                                        on='layer_number',
-                                        how='left'
+                                    # Combine layers and params via index-aligned join
+                                    # (both share the monotonic layer_number key)
+                                    combined = (
+                                        layers.set_index('layer_number')[['soil_type', 'top_depth', 'bottom_depth', 'thickness']]
+                                        .join(params.set_index('layer_number')[['youngs_modulus', 'compression_index', 'OCR']])
+                                        .reset_index()
                                     )
                                     
                                     combined.to_excel(writer, sheet_name=sheet_name, index=False)
@@ -282,7 +711,7 @@ with tab3:
         with col1:
             selected_cpt = st.selectbox(
                 "Select CPT for classification",
-                options=list(st.session_state.processed_cpts.keys())
+                options=cpt_keys
             )
         
         with col2:
@@ -293,6 +722,7 @@ with tab3:
         
         if selected_cpt:
             data = st.session_state.processed_cpts[selected_cpt]['data']
+            arrays = st.session_state.processed_cpts[selected_cpt]['arrays']
             
             if classification_method == "Robertson 2009":
                 st.subheader("Robertson (2009) Classification Chart")
@@ -300,9 +730,7 @@ with tab3:
                 
                 fig = go.Figure()
                 
-                Qt_range = (1, 1000)
-                classification = RobertsonClassification()
-                contours = classification.calculate_Ic_contours(Qt_range)
+                contours = _robertson2009_contours()
                 
                 for Ic_value, contour_data in contours.items():
                     fig.add_trace(go.Scatter(
@@ -314,20 +742,20 @@ with tab3:
                         showlegend=True
                     ))
                 
-                fig.add_trace(go.Scatter(
-                    x=data['Qt1'],
-                    y=data['Fr'],
+                fig.add_trace(go.Scattergl(
+                    x=arrays['Qt1'],
+                    y=arrays['Fr'],
                     mode='markers',
                     name=selected_cpt,
                     marker=dict(
                         size=6,
-                        color=data['Ic'],
+                        color=arrays['Ic'],
                         colorscale='RdYlBu_r',
                         showscale=True,
                         colorbar=dict(title="Ic"),
                         line=dict(width=0.5, color='white')
                     ),
-                    text=data['depth'],
+                    text=arrays['depth'],
                     hovertemplate='<b>Depth: %{text:.1f} m</b><br>Qt: %{x:.1f}<br>Fr: %{y:.2f}%<extra></extra>'
                 ))
                 
@@ -342,7 +770,7 @@ with tab3:
                 st.plotly_chart(fig, use_container_width=True)
                 
                 st.subheader("Soil Type Distribution")
-                soil_type_counts = data['soil_type'].value_counts()
+                soil_type_counts = _soil_type_counts(selected_cpt, 'Robertson2009')
                 
                 fig_pie = go.Figure(data=[go.Pie(
                     labels=soil_type_counts.index,
@@ -356,18 +784,9 @@ with tab3:
                 st.subheader("Robertson (1990) Classification Chart")
                 st.markdown("*Normalized CPT soil behavior type with 9 zones*")
                 
-                # Calculate Robertson 1990 classifications
-                data_r1990 = data.copy()
-                data_r1990['soil_type_r1990'] = data_r1990.apply(
-                    lambda row: Robertson1990Classification.classify_soil_type(
-                        row['Qt1'], row['Fr'], row['Ic']
-                    ), axis=1
-                )
-                
                 fig = go.Figure()
                 
-                Qt_range = (1, 1000)
-                contours = Robertson1990Classification.calculate_Ic_contours(Qt_range)
+                contours = _robertson1990_contours()
                 
                 for Ic_value, contour_data in contours.items():
                     fig.add_trace(go.Scatter(
@@ -379,20 +798,20 @@ with tab3:
                         showlegend=True
                     ))
                 
-                fig.add_trace(go.Scatter(
-                    x=data_r1990['Qt1'],
-                    y=data_r1990['Fr'],
+                fig.add_trace(go.Scattergl(
+                    x=arrays['Qt1'],
+                    y=arrays['Fr'],
                     mode='markers',
                     name=selected_cpt,
                     marker=dict(
                         size=6,
-                        color=data_r1990['Ic'],
+                        color=arrays['Ic'],
                         colorscale='Viridis',
                         showscale=True,
                         colorbar=dict(title="Ic"),
                         line=dict(width=0.5, color='white')
                     ),
-                    text=data_r1990['depth'],
+                    text=arrays['depth'],
                     hovertemplate='<b>Depth: %{text:.1f} m</b><br>Qt: %{x:.1f}<br>Fr: %{y:.2f}%<extra></extra>'
                 ))
                 
@@ -407,7 +826,7 @@ with tab3:
                 st.plotly_chart(fig, use_container_width=True)
                 
                 st.subheader("Soil Type Distribution")
-                soil_type_counts = data_r1990['soil_type_r1990'].value_counts()
+                soil_type_counts = _soil_type_counts(selected_cpt, 'Robertson1990')
                 
                 fig_pie = go.Figure(data=[go.Pie(
                     labels=soil_type_counts.index,
@@ -421,18 +840,10 @@ with tab3:
                 st.subheader("Schneider et al. (2008) Classification Chart")
                 st.markdown("*Piezocone classification focusing on drainage conditions*")
                 
-                # Calculate Schneider 2008 classifications
-                data_s2008 = data.copy()
-                data_s2008['soil_type_s2008'] = data_s2008.apply(
-                    lambda row: Schneider2008Classification.classify_soil_type(
-                        row['Qt1'], row['Fr']
-                    ), axis=1
-                )
-                
                 fig = go.Figure()
                 
                 # Add zone boundaries
-                boundaries = Schneider2008Classification.calculate_zone_boundaries()
+                boundaries = _schneider2008_boundaries()
                 
                 for boundary_name, boundary_data in boundaries.items():
                     fig.add_trace(go.Scatter(
@@ -445,20 +856,20 @@ with tab3:
                     ))
                 
                 # Add data points
-                fig.add_trace(go.Scatter(
-                    x=data_s2008['Qt1'],
-                    y=data_s2008['Fr'],
+                fig.add_trace(go.Scattergl(
+                    x=arrays['Qt1'],
+                    y=arrays['Fr'],
                     mode='markers',
                     name=selected_cpt,
                     marker=dict(
                         size=6,
-                        color=data_s2008['Ic'],
+                        color=arrays['Ic'],
                         colorscale='Plasma',
                         showscale=True,
                         colorbar=dict(title="Ic"),
                         line=dict(width=0.5, color='white')
                     ),
-                    text=data_s2008['depth'],
+                    text=arrays['depth'],
                     hovertemplate='<b>Depth: %{text:.1f} m</b><br>Q: %{x:.1f}<br>F: %{y:.2f}%<extra></extra>'
                 ))
                 
@@ -473,7 +884,7 @@ with tab3:
                 st.plotly_chart(fig, use_container_width=True)
                 
                 st.subheader("Soil Type Distribution")
-                soil_type_counts = data_s2008['soil_type_s2008'].value_counts()
+                soil_type_counts = _soil_type_counts(selected_cpt, 'Schneider2008')
                 
                 fig_pie = go.Figure(data=[go.Pie(
                     labels=soil_type_counts.index,
@@ -523,9 +934,9 @@ with tab3:
                 fig_comp = go.Figure()
                 
                 # Color code by agreement
-                colors = ['green' if agree else 'red' for agree in comparison_data['agreement']]
-                
-                fig_comp.add_trace(go.Scatter(
+                colors = np.where(comparison_data['agreement'].to_numpy(), 'green', 'red')
+
+                fig_comp.add_trace(go.Scattergl(
                     x=comparison_data['Qt1'],
                     y=comparison_data['Fr'],
                     mode='markers',
@@ -534,11 +945,14 @@ with tab3:
                         color=colors,
                         line=dict(width=0.5, color='white')
                     ),
-                    text=[f"Depth: {d:.1f}m<br>{method1}: {s1}<br>{method2}: {s2}" 
-                          for d, s1, s2 in zip(comparison_data['depth'], 
-                                               comparison_data['method1_soil_type'],
-                                               comparison_data['method2_soil_type'])],
-                    hovertemplate='%{text}<extra></extra>',
+                    customdata=np.column_stack([
+                        comparison_data['depth'],
+                        comparison_data['method1_soil_type'],
+                        comparison_data['method2_soil_type']
+                    ]),
+                    hovertemplate=('Depth: %{customdata[0]:.1f}m<br>' +
+                                   f'{method1}: %{{customdata[1]}}<br>' +
+                                   f'{method2}: %{{customdata[2]}}<extra></extra>'),
                     name='CPT Data'
                 ))
                 
@@ -566,7 +980,9 @@ with tab3:
                 })
                 
                 if len(disagreed) > 0:
-                    st.dataframe(disagreed.round(2), hide_index=True, use_container_width=True)
+                    float_cols = disagreed.select_dtypes(include='float').columns
+                    disagreed[float_cols] = disagreed[float_cols].round(2).astype(np.float32)
+                    st.dataframe(disagreed, hide_index=True, use_container_width=True)
                 else:
                     st.success("✅ All classifications agree between the two methods!")
 
@@ -578,7 +994,7 @@ with tab4:
     else:
         selected_cpt = st.selectbox(
             "Select CPT for layer profile",
-            options=list(st.session_state.processed_cpts.keys()),
+            options=cpt_keys,
             key="layer_select"
         )
         
@@ -590,23 +1006,32 @@ with tab4:
                 
                 with col1:
                     fig = go.Figure()
-                    
-                    for _, layer in layers.iterrows():
-                        mid_depth = (layer['top_depth'] + layer['bottom_depth']) / 2
-                        
-                        fig.add_trace(go.Bar(
-                            x=[layer['thickness']],
-                            y=[f"Layer {layer['layer_number']}"],
-                            orientation='h',
-                            name=layer['soil_type'],
-                            text=f"{layer['soil_type']}<br>{layer['thickness']:.2f}m",
-                            textposition='inside',
-                            hovertemplate=f"<b>Layer {layer['layer_number']}</b><br>" +
-                                        f"Depth: {layer['top_depth']:.2f} - {layer['bottom_depth']:.2f} m<br>" +
-                                        f"Thickness: {layer['thickness']:.2f} m<br>" +
-                                        f"Soil: {layer['soil_type']}<br>" +
-                                        f"Ic: {layer['avg_Ic']:.2f}<extra></extra>"
-                        ))
+
+                    labels = 'Layer ' + layers['layer_number'].astype(str)
+                    bar_text = []
+                    hover_text = []
+                    for l in layers.itertuples(index=False):
+                        bar_text.append(f"{l.soil_type}<br>{l.thickness:.2f}m")
+                        hover_text.append(
+                            f"<b>Layer {l.layer_number}</b><br>"
+                            f"Depth: {l.top_depth:.2f} - {l.bottom_depth:.2f} m<br>"
+                            f"Thickness: {l.thickness:.2f} m<br>"
+                            f"Soil: {l.soil_type}<br>"
+                            f"Ic: {l.avg_Ic:.2f}"
+                        )
+                    soil_palette = {soil: px.colors.qualitative.Set3[i % len(px.colors.qualitative.Set3)]
+                                    for i, soil in enumerate(layers['soil_type'].unique())}
+
+                    fig.add_trace(go.Bar(
+                        x=layers['thickness'],
+                        y=labels,
+                        orientation='h',
+                        text=bar_text,
+                        textposition='inside',
+                        hovertext=hover_text,
+                        hovertemplate='%{hovertext}<extra></extra>',
+                        marker_color=layers['soil_type'].map(soil_palette)
+                    ))
                     
                     fig.update_xaxes(title_text="Thickness (m)")
                     fig.update_yaxes(title_text="Layer")
@@ -628,7 +1053,7 @@ with tab4:
                     )
                     
                     st.subheader("Export Layers")
-                    exporter = ExportManager()
+                    exporter = _exporter()
                     csv_data = exporter.export_layers_to_csv(layers)
                     st.download_button(
                         label="📥 Download Layers (CSV)",
@@ -641,125 +1066,39 @@ with tab4:
 
 with tab5:
     st.header("CPT Correlations for Settlement Parameters")
-    
-    if not st.session_state.processed_cpts:
+
+    # Bind once: every session-state lookup goes through the proxy's
+    # __getitem__, which adds up inside the tab bodies.
+    _processed = st.session_state.processed_cpts
+
+    if not _processed:
         st.info("📌 Please upload CPT data files in the 'Upload CPT Data' tab first.")
     else:
         selected_cpt = st.selectbox(
             "Select CPT for correlations",
-            options=list(st.session_state.processed_cpts.keys()),
+            options=cpt_keys,
             key="corr_select"
         )
-        
+
         if selected_cpt:
-            params = st.session_state.processed_cpts[selected_cpt]['parameters']
+            params = _processed[selected_cpt]['parameters']
             
             if len(params) > 0:
                 st.subheader("Settlement Parameters by Layer")
                 
-                display_params = params[[
-                    'layer_number', 'soil_type', 'thickness', 'Ic',
-                    'youngs_modulus', 'constrained_modulus',
-                    'compression_index', 'recompression_index',
-                    'OCR', 'friction_angle', 'undrained_shear_strength'
-                ]].copy()
-                
-                display_params.columns = [
-                    'Layer', 'Soil Type', 'H (m)', 'Ic',
-                    'E (kPa)', 'M (kPa)', 'Cc', 'Cr',
-                    'OCR', 'φ (°)', 'Su (kPa)'
-                ]
-                
-                st.dataframe(display_params.round(2), hide_index=True, use_container_width=True)
+                display_params, clay_layers = _prep_param_views(
+                    selected_cpt, _params_hash(params))
+
+                st.dataframe(display_params, column_config=_float_format(display_params),
+                             hide_index=True, use_container_width=True)
                 
                 st.subheader("Parameter Visualizations")
-                
-                param_cols = st.columns(2)
-                
-                with param_cols[0]:
-                    fig_e = go.Figure()
-                    fig_e.add_trace(go.Bar(
-                        x=params['layer_number'],
-                        y=params['youngs_modulus'],
-                        name="Young's Modulus",
-                        marker_color='lightblue'
-                    ))
-                    fig_e.update_layout(
-                        title="Young's Modulus (E) by Layer",
-                        xaxis_title="Layer Number",
-                        yaxis_title="E (kPa)",
-                        height=300
-                    )
-                    st.plotly_chart(fig_e, use_container_width=True)
-                
-                with param_cols[1]:
-                    fig_cc = go.Figure()
-                    clay_layers = params[params['Ic'] > 2.6]
-                    if len(clay_layers) > 0:
-                        fig_cc.add_trace(go.Bar(
-                            x=clay_layers['layer_number'],
-                            y=clay_layers['compression_index'],
-                            name="Cc",
-                            marker_color='coral'
-                        ))
-                        fig_cc.add_trace(go.Bar(
-                            x=clay_layers['layer_number'],
-                            y=clay_layers['recompression_index'],
-                            name="Cr",
-                            marker_color='lightcoral'
-                        ))
-                    fig_cc.update_layout(
-                        title="Compression Indices (Cc, Cr) for Clay Layers",
-                        xaxis_title="Layer Number",
-                        yaxis_title="Index",
-                        height=300
-                    )
-                    st.plotly_chart(fig_cc, use_container_width=True)
-                
-                param_cols2 = st.columns(2)
-                
-                with param_cols2[0]:
-                    fig_ocr = go.Figure()
-                    fig_ocr.add_trace(go.Bar(
-                        x=params['layer_number'],
-                        y=params['OCR'],
-                        name="OCR",
-                        marker_color='lightgreen'
-                    ))
-                    fig_ocr.update_layout(
-                        title="Over-Consolidation Ratio (OCR) by Layer",
-                        xaxis_title="Layer Number",
-                        yaxis_title="OCR",
-                        height=300
-                    )
-                    st.plotly_chart(fig_ocr, use_container_width=True)
-                
-                with param_cols2[1]:
-                    fig_perm = go.Figure()
-                    fig_perm.add_trace(go.Bar(
-                        x=params['layer_number'],
-                        y=params['permeability'],
-                        name="Permeability",
-                        marker_color='purple'
-                    ))
-                    fig_perm.update_layout(
-                        title="Permeability (k) by Layer",
-                        xaxis_title="Layer Number",
-                        yaxis_title="k (m/s)",
-                        yaxis_type="log",
-                        height=300
-                    )
-                    st.plotly_chart(fig_perm, use_container_width=True)
+
+                fig_params = _param_fig_dict(selected_cpt, _params_hash(params))
+                st.plotly_chart(fig_params, use_container_width=True)
                 
                 st.subheader("Export Data")
-                exporter = ExportManager()
-                layers = st.session_state.processed_cpts[selected_cpt]['layers']
-                excel_data = exporter.export_to_excel(
-                    st.session_state.processed_cpts[selected_cpt],
-                    layers,
-                    params,
-                    f"{selected_cpt}_analysis.xlsx"
-                )
+                excel_data = _export_excel_bytes(selected_cpt, _params_hash(params))
                 st.download_button(
                     label="📥 Download Complete Analysis (Excel)",
                     data=excel_data,
@@ -771,19 +1110,19 @@ with tab5:
                 
                 st.subheader("📚 Soil Property Database & Validation")
                 
-                soil_db = SoilPropertyDatabase()
+                soil_db = _soil_db()
                 
                 tab_db1, tab_db2 = st.tabs(["Parameter Validation", "Reference Database"])
                 
                 with tab_db1:
                     st.markdown("*Compare calculated parameters against typical ranges for soil types*")
                     
-                    warnings = soil_db.compare_layer_properties(params)
-                    
-                    if len(warnings) > 0:
-                        st.warning(f"⚠️ Found {len(warnings)} parameter(s) outside typical ranges:")
-                        
-                        warning_df = pd.DataFrame(warnings)
+                    flags = soil_db.validate_all_parameters(params)
+
+                    if len(flags) > 0:
+                        st.warning(f"⚠️ Found {len(flags)} parameter(s) outside typical ranges:")
+
+                        warning_df = flags[['layer_number', 'soil_type', 'parameter', 'value', 'message']].copy()
                         warning_df.columns = ['Layer', 'Soil Type', 'Parameter', 'Value', 'Message']
                         st.dataframe(warning_df, hide_index=True, use_container_width=True)
                         
@@ -803,8 +1142,10 @@ with tab5:
 
 with tab6:
     st.header("Settlement Analysis")
-    
-    if not st.session_state.processed_cpts:
+
+    _processed = st.session_state.processed_cpts
+
+    if not _processed:
         st.info("📌 Please upload CPT data files in the 'Upload CPT Data' tab first.")
     else:
         st.subheader("Loading Configuration")
@@ -825,18 +1166,16 @@ with tab6:
         
         selected_cpt_settle = st.selectbox(
             "Select CPT for settlement analysis",
-            options=list(st.session_state.processed_cpts.keys()),
+            options=cpt_keys,
             key="settle_select"
         )
         
         if selected_cpt_settle and st.button("Calculate Settlement", type="primary"):
-            params = st.session_state.processed_cpts[selected_cpt_settle]['parameters']
-            
-            calculator = SettlementCalculator()
-            
-            settlement_results = calculator.calculate_total_settlement(
-                params, load_kN, footing_width, footing_length,
-                footing_depth, water_table_depth
+            params = _processed[selected_cpt_settle]['parameters']
+
+            settlement_results = _compute_settlement(
+                selected_cpt_settle, load_kN, footing_width, footing_length,
+                footing_depth, water_table_depth, _params_hash(params)
             )
             
             # Store in session state
@@ -849,7 +1188,7 @@ with tab6:
                 'water_table': water_table_depth,
                 'cpt_name': selected_cpt_settle
             }
-            st.session_state['settlement_calculator'] = calculator
+            st.session_state['settlement_calculator'] = SettlementCalculator()
             
             st.success("✅ Settlement calculation complete!")
         
@@ -869,256 +1208,189 @@ with tab6:
             
             st.subheader("Settlement by Layer")
             
-            immediate_df = pd.DataFrame(settlement_results['immediate_details'])
-            consolidation_df = pd.DataFrame(settlement_results['consolidation_details'])
-            
+            immediate_df = _downcast_floats(settlement_results['immediate_details_df'])
+            consolidation_df = _downcast_floats(settlement_results['consolidation_details_df'])
+
+            fig_imm, fig_cons = _settlement_fig_dicts(immediate_df, consolidation_df)
+
             tabs_settle = st.tabs(["Immediate Settlement", "Consolidation Settlement"])
-            
+
             with tabs_settle[0]:
-                st.dataframe(immediate_df.round(2), hide_index=True, use_container_width=True)
-                
-                fig_imm = go.Figure()
-                fig_imm.add_trace(go.Bar(
-                    x=immediate_df['layer_number'],
-                    y=immediate_df['settlement_mm'],
-                    marker_color='skyblue',
-                    text=immediate_df['settlement_mm'].round(1),
-                    textposition='outside'
-                ))
-                fig_imm.update_layout(
-                    title="Immediate Settlement by Layer",
-                    xaxis_title="Layer Number",
-                    yaxis_title="Settlement (mm)",
-                    height=400
-                )
+                st.dataframe(immediate_df, column_config=_float_format(immediate_df),
+                             hide_index=True, use_container_width=True)
                 st.plotly_chart(fig_imm, use_container_width=True)
-            
+
             with tabs_settle[1]:
-                st.dataframe(consolidation_df.round(2), hide_index=True, use_container_width=True)
-                
-                fig_cons = go.Figure()
-                fig_cons.add_trace(go.Bar(
-                    x=consolidation_df['layer_number'],
-                    y=consolidation_df['settlement_mm'],
-                    marker_color='coral',
-                    text=consolidation_df['settlement_mm'].round(1),
-                    textposition='outside'
-                ))
-                fig_cons.update_layout(
-                    title="Consolidation Settlement by Layer",
-                    xaxis_title="Layer Number",
-                    yaxis_title="Settlement (mm)",
-                    height=400
-                )
+                st.dataframe(consolidation_df, column_config=_float_format(consolidation_df),
+                             hide_index=True, use_container_width=True)
                 st.plotly_chart(fig_cons, use_container_width=True)
             
             st.markdown("---")
             
-            st.subheader("⏱️ Time-Consolidation Analysis")
-            st.markdown("*Analyze settlement progression over time including secondary compression (creep)*")
-            
-            col_time1, col_time2, col_time3 = st.columns(3)
+            @st.fragment
+            def _time_consolidation_section():
+                """
+                Fragment: the time inputs and consolidation slider only
+                rerun this subtree, leaving the rest of tab6 untouched.
+                """
+                st.subheader("⏱️ Time-Consolidation Analysis")
+                st.markdown("*Analyze settlement progression over time including secondary compression (creep)*")
             
-            with col_time1:
-                max_time = st.number_input(
-                    "Maximum Time (years)",
-                    min_value=1.0,
-                    max_value=100.0,
-                    value=50.0,
-                    step=5.0,
-                    help="Time period for consolidation analysis"
-                )
+                col_time1, col_time2, col_time3 = st.columns(3)
             
-            with col_time2:
-                include_secondary = st.checkbox(
-                    "Include Secondary Compression",
-                    value=True,
-                    help="Add long-term creep effects"
-                )
+                with col_time1:
+                    max_time = st.number_input(
+                        "Maximum Time (years)",
+                        min_value=1.0,
+                        max_value=100.0,
+                        value=50.0,
+                        step=5.0,
+                        help="Time period for consolidation analysis"
+                    )
             
-            with col_time3:
-                c_alpha_ratio = st.number_input(
-                    "C_α/Cc Ratio",
-                    min_value=0.01,
-                    max_value=0.10,
-                    value=0.02,
-                    step=0.01,
-                    help="Secondary compression index ratio (typical 0.02-0.05)"
-                )
+                with col_time2:
+                    include_secondary = st.checkbox(
+                        "Include Secondary Compression",
+                        value=True,
+                        help="Add long-term creep effects"
+                    )
             
-            if st.button("Generate Time-Settlement Curve", key="time_curve_btn"):
-                with st.spinner("Calculating time-dependent settlement..."):
-                    # Get stored calculator and params
-                    calculator_stored = st.session_state.get('settlement_calculator', SettlementCalculator())
-                    cpt_name_stored = settlement_params_stored.get('cpt_name', selected_cpt_settle)
-                    params_stored = st.session_state.processed_cpts[cpt_name_stored]['parameters']
-                    
-                    time_curve_data = calculator_stored.generate_time_settlement_curve(
-                        params_stored, 
-                        settlement_params_stored.get('load', load_kN), 
-                        settlement_params_stored.get('width', footing_width), 
-                        settlement_params_stored.get('length', footing_length),
-                        max_time_years=max_time,
-                        num_points=100,
-                        footing_depth=settlement_params_stored.get('depth', footing_depth),
-                        water_table_depth=settlement_params_stored.get('water_table', water_table_depth),
-                        include_secondary=include_secondary,
-                        c_alpha=c_alpha_ratio
+                with col_time3:
+                    c_alpha_ratio = st.number_input(
+                        "C_α/Cc Ratio",
+                        min_value=0.01,
+                        max_value=0.10,
+                        value=0.02,
+                        step=0.01,
+                        help="Secondary compression index ratio (typical 0.02-0.05)"
                     )
+            
+                if st.button("Generate Time-Settlement Curve", key="time_curve_btn"):
+                    with st.spinner("Calculating time-dependent settlement..."):
+                        cpt_name_stored = settlement_params_stored.get('cpt_name', selected_cpt_settle)
+                        params_stored = _processed[cpt_name_stored]['parameters']
+
+                        time_curve_data = _compute_time_curve(
+                            cpt_name_stored,
+                            settlement_params_stored.get('load', load_kN),
+                            settlement_params_stored.get('width', footing_width),
+                            settlement_params_stored.get('length', footing_length),
+                            settlement_params_stored.get('depth', footing_depth),
+                            settlement_params_stored.get('water_table', water_table_depth),
+                            max_time,
+                            include_secondary,
+                            c_alpha_ratio,
+                            _params_hash(params_stored)
+                        )
                     
-                    # Store in session state for persistence
-                    st.session_state['time_curve_data'] = time_curve_data
-                    st.success("✅ Time-consolidation curve generated!")
+                        # Store in session state for persistence
+                        st.session_state['time_curve_data'] = time_curve_data
+                        st.success("✅ Time-consolidation curve generated!")
             
-            if 'time_curve_data' in st.session_state:
-                time_curve_data = st.session_state['time_curve_data']
-                
-                # Main time-settlement curve
-                fig_time = go.Figure()
-                
-                # Primary consolidation curve
-                fig_time.add_trace(go.Scatter(
-                    x=time_curve_data['time_years'],
-                    y=time_curve_data['settlement_primary_mm'],
-                    mode='lines',
-                    name='Primary Consolidation',
-                    line=dict(color='blue', width=2),
-                    hovertemplate='Time: %{x:.2f} years<br>Settlement: %{y:.1f} mm<extra></extra>'
-                ))
+                if 'time_curve_data' in st.session_state:
+                    time_curve_data = st.session_state['time_curve_data']
                 
-                # Total settlement (with secondary compression if included)
-                if time_curve_data['secondary_compression_included']:
-                    fig_time.add_trace(go.Scatter(
-                        x=time_curve_data['time_years'],
-                        y=time_curve_data['settlement_total_mm'],
-                        mode='lines',
-                        name='Total (Primary + Secondary)',
-                        line=dict(color='red', width=2, dash='dash'),
-                        hovertemplate='Time: %{x:.2f} years<br>Settlement: %{y:.1f} mm<extra></extra>'
-                    ))
+                    # Main time-settlement curve
+                    fig_time = _time_fig_dict(time_curve_data)
+                    st.plotly_chart(fig_time, use_container_width=True)
                 
-                # Add horizontal line for immediate settlement
-                fig_time.add_hline(
-                    y=time_curve_data['immediate_settlement_mm'],
-                    line_dash="dot",
-                    line_color="green",
-                    annotation_text=f"Immediate: {time_curve_data['immediate_settlement_mm']:.1f} mm"
-                )
-                
-                fig_time.update_xaxes(
-                    title="Time (years)",
-                    type='log',
-                    showgrid=True
-                )
-                fig_time.update_yaxes(
-                    title="Settlement (mm)",
-                    showgrid=True
-                )
-                fig_time.update_layout(
-                    title="Settlement vs Time",
-                    height=500,
-                    hovermode='x unified',
-                    legend=dict(
-                        yanchor="top",
-                        y=0.99,
-                        xanchor="right",
-                        x=0.99
-                    )
-                )
+                    # Settlement milestones
+                    st.subheader("Settlement Milestones")
                 
-                st.plotly_chart(fig_time, use_container_width=True)
-                
-                # Settlement milestones
-                st.subheader("Settlement Milestones")
-                
-                milestones_time = [0.1, 0.5, 1.0, 5.0, 10.0, 25.0, 50.0]
-                milestone_data = []
-                
-                for t in milestones_time:
-                    if t <= max_time:
-                        idx = min(range(len(time_curve_data['time_years'])), 
-                                 key=lambda i: abs(time_curve_data['time_years'][i] - t))
-                        primary_settlement = time_curve_data['settlement_primary_mm'][idx]
-                        total_settlement = time_curve_data['settlement_total_mm'][idx]
-                        
-                        percent_complete = (primary_settlement / 
-                                          (time_curve_data['immediate_settlement_mm'] + 
-                                           time_curve_data['final_consolidation_mm'])) * 100 if time_curve_data['final_consolidation_mm'] > 0 else 100
-                        
-                        milestone_data.append({
-                            'Time (years)': t,
-                            'Primary (mm)': round(primary_settlement, 2),
-                            'Total (mm)': round(total_settlement, 2),
-                            '% Complete': round(percent_complete, 1)
-                        })
-                
-                milestone_df = pd.DataFrame(milestone_data)
-                st.dataframe(milestone_df, hide_index=True, use_container_width=True)
-                
-                # Consolidation time analysis
-                st.subheader("Consolidation Time by Layer")
-                
-                col_time_a, col_time_b = st.columns(2)
-                
-                with col_time_a:
-                    target_degree = st.slider(
-                        "Target Degree of Consolidation",
-                        min_value=50,
-                        max_value=99,
-                        value=90,
-                        step=5,
-                        help="Percentage of consolidation to calculate time for"
-                    ) / 100.0
-                
-                with col_time_b:
-                    if st.button("Calculate Layer Times", key="layer_time_btn"):
-                        # Get stored calculator and params
-                        calculator_stored = st.session_state.get('settlement_calculator', SettlementCalculator())
-                        cpt_name_stored = settlement_params_stored.get('cpt_name', selected_cpt_settle)
-                        params_stored = st.session_state.processed_cpts[cpt_name_stored]['parameters']
-                        
-                        layer_times = calculator_stored.calculate_consolidation_time(
-                            params_stored,
-                            target_degree=target_degree
-                        )
-                        st.session_state['layer_times'] = layer_times
-                
-                if 'layer_times' in st.session_state:
-                    layer_times = st.session_state['layer_times']
-                    layer_times_df = pd.DataFrame(layer_times['layer_times'])
+                    milestones_time = np.array([0.1, 0.5, 1.0, 5.0, 10.0, 25.0, 50.0])
+                    milestones_time = milestones_time[milestones_time <= max_time]
+
+                    # time_years is sorted, so nearest milestone indices come from
+                    # one searchsorted call instead of a Python linear scan per milestone
+                    ty = np.asarray(time_curve_data['time_years'])
+                    pos = np.clip(np.searchsorted(ty, milestones_time), 1, len(ty) - 1)
+                    idx = np.where(np.abs(ty[pos] - milestones_time) < np.abs(ty[pos - 1] - milestones_time),
+                                   pos, pos - 1)
+
+                    primary_settlement = np.asarray(time_curve_data['settlement_primary_mm'])[idx]
+                    total_settlement = np.asarray(time_curve_data['settlement_total_mm'])[idx]
+
+                    final_consolidation = time_curve_data['final_consolidation_mm']
+                    if final_consolidation > 0:
+                        percent_complete = primary_settlement / (
+                            time_curve_data['immediate_settlement_mm'] + final_consolidation) * 100
+                    else:
+                        percent_complete = np.full_like(primary_settlement, 100.0)
+
+                    milestone_df = _downcast_floats(pd.DataFrame({
+                        'Time (years)': milestones_time,
+                        'Primary (mm)': primary_settlement,
+                        'Total (mm)': total_settlement,
+                        '% Complete': percent_complete
+                    }))
+                    milestone_config = _float_format(milestone_df)
+                    milestone_config['% Complete'] = st.column_config.NumberColumn(format="%.1f")
+                    st.dataframe(milestone_df, column_config=milestone_config,
+                                 hide_index=True, use_container_width=True)
+                
+                    # Consolidation time analysis
+                    st.subheader("Consolidation Time by Layer")
+                
+                    col_time_a, col_time_b = st.columns(2)
+                
+                    with col_time_a:
+                        target_degree = st.slider(
+                            "Target Degree of Consolidation",
+                            min_value=50,
+                            max_value=99,
+                            value=90,
+                            step=5,
+                            help="Percentage of consolidation to calculate time for"
+                        ) / 100.0
+                
+                    with col_time_b:
+                        if st.button("Calculate Layer Times", key="layer_time_btn"):
+                            cpt_name_stored = settlement_params_stored.get('cpt_name', selected_cpt_settle)
+                            params_stored = _processed[cpt_name_stored]['parameters']
+
+                            layer_times = _compute_layer_times(
+                                cpt_name_stored, target_degree, _params_hash(params_stored)
+                            )
+                            st.session_state['layer_times'] = layer_times
+                
+                    if 'layer_times' in st.session_state:
+                        layer_times = st.session_state['layer_times']
+                        layer_times_df = pd.DataFrame(layer_times['layer_times'])
                     
-                    if len(layer_times_df) > 0:
-                        display_cols = ['layer_number', 'soil_type', 'thickness_m', 'time_days', 'time_years']
-                        available_cols = [col for col in display_cols if col in layer_times_df.columns]
+                        if len(layer_times_df) > 0:
+                            rename_map = {
+                                'layer_number': 'Layer',
+                                'soil_type': 'Soil Type',
+                                'thickness_m': 'Thickness (m)',
+                                'time_days': 'Time (days)',
+                                'time_years': 'Time (years)'
+                            }
+                            layer_times_display = _downcast_floats(
+                                layer_times_df.reindex(columns=rename_map.keys())
+                                              .rename(columns=rename_map))
+                            st.dataframe(layer_times_display,
+                                         column_config=_float_format(layer_times_display),
+                                         hide_index=True, use_container_width=True)
                         
-                        if available_cols:
-                            layer_times_display = layer_times_df[available_cols].copy()
-                            layer_times_display.columns = ['Layer', 'Soil Type', 'Thickness (m)', 'Time (days)', 'Time (years)']
-                            st.dataframe(layer_times_display.round(2), hide_index=True, use_container_width=True)
-                        else:
-                            st.dataframe(layer_times_df, hide_index=True, use_container_width=True)
-                        
-                        st.info(f"💡 Time required for {int(target_degree*100)}% consolidation varies by layer based on drainage properties and permeability.")
+                            st.info(f"💡 Time required for {int(target_degree*100)}% consolidation varies by layer based on drainage properties and permeability.")
+
+            _time_consolidation_section()
             
             st.markdown("---")
             
             st.subheader("Export Settlement Results")
-            exporter = ExportManager()
-            load_config = {
-                'load': settlement_params_stored.get('load', load_kN),
-                'width': settlement_params_stored.get('width', footing_width),
-                'length': settlement_params_stored.get('length', footing_length),
-                'depth': settlement_params_stored.get('depth', footing_depth)
-            }
-            
+            load_config_key = (
+                settlement_params_stored.get('load', load_kN),
+                settlement_params_stored.get('width', footing_width),
+                settlement_params_stored.get('length', footing_length),
+                settlement_params_stored.get('depth', footing_depth)
+            )
+
             col_export1, col_export2 = st.columns(2)
-            
+
             with col_export1:
-                excel_settle = exporter.export_settlement_results(
-                    settlement_results,
-                    params,
-                    load_config
-                )
+                excel_settle = _export_settlement_bytes(
+                    selected_cpt_settle, load_config_key, _params_hash(params))
                 st.download_button(
                     label="📥 Download Settlement Results (Excel)",
                     data=excel_settle,
@@ -1127,27 +1399,27 @@ with tab6:
                 )
             
             with col_export2:
-                pdf_report = exporter.generate_pdf_report(
-                    selected_cpt_settle,
-                    st.session_state.processed_cpts[selected_cpt_settle]['summary'],
-                    st.session_state.processed_cpts[selected_cpt_settle]['layers'],
-                    params,
-                    settlement_results,
-                    load_config
-                )
-                st.download_button(
-                    label="📄 Download Full Report (PDF)",
-                    data=pdf_report,
-                    file_name=f"{selected_cpt_settle}_report.pdf",
-                    mime="application/pdf"
-                )
+                # PDF generation is the slowest export; build it only on
+                # request instead of on every rerun of the tab
+                if st.button("📄 Prepare Full Report (PDF)", key="prepare_pdf_btn"):
+                    st.session_state['pdf_bytes'] = _export_pdf_bytes(
+                        selected_cpt_settle, load_config_key, _params_hash(params))
+                if 'pdf_bytes' in st.session_state:
+                    st.download_button(
+                        label="📄 Download Full Report (PDF)",
+                        data=st.session_state['pdf_bytes'],
+                        file_name=f"{selected_cpt_settle}_report.pdf",
+                        mime="application/pdf"
+                    )
 
 with tab7:
     st.header("3D Spatial Visualization")
-    
-    if not st.session_state.processed_cpts:
+
+    _processed = st.session_state.processed_cpts
+
+    if not _processed:
         st.info("📌 Please upload CPT data files in the 'Upload CPT Data' tab first.")
-    elif len(st.session_state.processed_cpts) < 2:
+    elif len(_processed) < 2:
         st.warning("⚠️ 3D visualization requires at least 2 CPT datasets. Please upload more CPT files.")
     else:
         st.markdown("""
@@ -1158,9 +1430,9 @@ with tab7:
         st.subheader("📍 CPT Location Setup")
         
         with st.expander("Set CPT Coordinates", expanded=True):
-            coord_cols = st.columns(min(3, len(st.session_state.processed_cpts)))
-            
-            for idx, cpt_name in enumerate(st.session_state.processed_cpts.keys()):
+            coord_cols = st.columns(min(3, len(_processed)))
+
+            for idx, cpt_name in enumerate(_processed.keys()):
                 col = coord_cols[idx % len(coord_cols)]
                 
                 with col:
@@ -1196,17 +1468,13 @@ with tab7:
             ]
         )
         
-        visualizer = CPT3DVisualizer()
+        visualizer = _visualizer()
         
-        cpt_locations = {}
-        for cpt_name, cpt_info in st.session_state.processed_cpts.items():
-            coords = st.session_state.cpt_coordinates.get(cpt_name, {'x': 0, 'y': 0})
-            cpt_locations[cpt_name] = {
-                'x': coords['x'],
-                'y': coords['y'],
-                'data': cpt_info['data'],
-                'layers': cpt_info['layers'].to_dict('records') if hasattr(cpt_info['layers'], 'to_dict') else cpt_info['layers']
-            }
+        coords_tuple = tuple(sorted(
+            (name, coords['x'], coords['y'])
+            for name, coords in st.session_state.cpt_coordinates.items()
+        ))
+        cpt_locations = _build_cpt_locations(cpt_keys, coords_tuple)
         
         if viz_type == "3D Soil Profile Scatter":
             st.subheader("3D Soil Profile Scatter Plot")
@@ -1271,7 +1539,7 @@ with tab7:
             st.subheader("Plan View at Specific Depth")
             st.markdown("Top-down view showing how soil types vary horizontally at a given depth.")
             
-            max_depth = max([cpt_info['data']['depth'].max() for cpt_info in st.session_state.processed_cpts.values()])
+            max_depth = max(cpt_info['depth_max'] for cpt_info in _processed.values())
             depth_slice = st.slider(
                 "Select Depth (m)",
                 min_value=0.0,
@@ -1301,7 +1569,7 @@ with tab7:
             area = (max(x_coords) - min(x_coords)) * (max(y_coords) - min(y_coords))
             st.metric("Survey Area", f"{area:.1f} m²")
         with col3:
-            avg_depth = np.mean([cpt_info['data']['depth'].max() for cpt_info in st.session_state.processed_cpts.values()])
+            avg_depth = np.mean([cpt_info['depth_max'] for cpt_info in _processed.values()])
             st.metric("Average CPT Depth", f"{avg_depth:.1f} m")
 
 st.sidebar.markdown("---")
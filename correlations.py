@@ -1,3 +1,5 @@
+import math
+
 import numpy as np
 import pandas as pd
 from typing import Dict
@@ -8,8 +10,23 @@ class CPTCorrelations:
     Includes correlations for E, Cc, Cr, M, OCR and other parameters.
     """
     
+    # Resolution of the precomputed alpha_E(Ic) lookup table
+    _IC_STEP = 0.001
+
     def __init__(self):
         self.Pa = 100.0  # Atmospheric pressure in kPa
+
+        # Tabulate alpha_E on a fine Ic grid once; the vectorized pipeline
+        # replaces a pow per element with an integer-bucket table lookup.
+        # (alpha_M is a plain clipped linear term, so no table is needed.)
+        ic_grid = np.arange(0.0, 5.0 + self._IC_STEP, self._IC_STEP)
+        self._alpha_E_tab = 0.015 * 10 ** (0.55 * ic_grid + 1.68)
+
+    def _alpha_E_lookup(self, Ic: np.ndarray) -> np.ndarray:
+        """alpha_E(Ic) from the precomputed table (nearest grid point)."""
+        idx = np.clip(np.rint(Ic / self._IC_STEP).astype(np.int64),
+                      0, self._alpha_E_tab.size - 1)
+        return self._alpha_E_tab[idx]
     
     def calculate_youngs_modulus(self, qt: float, sigma_vo: float, Ic: float) -> float:
         """
@@ -77,7 +94,20 @@ class CPTCorrelations:
                 Cc = max(Cc, Cc_alt)
         
         return max(Cc, 0.01)
-    
+
+    def _compression_index_vec(self, Ic: np.ndarray, qt: np.ndarray) -> np.ndarray:
+        """
+        Branchless array form of calculate_compression_index (PI estimated
+        from Ic). All candidate values are computed unconditionally and
+        combined with masks so the sand/clay and soft-clay branches stay
+        inside NumPy's C loops.
+        """
+        Cc_sand = np.clip(0.01 + 0.05 * (Ic - 1.5), 0.01, 0.1)
+        PI = np.minimum((Ic - 2.6) * 15, 60)
+        Cc_clay = 0.007 * (PI + 5)
+        Cc_clay = np.where(qt < 1000, np.maximum(Cc_clay, 0.5 - 0.0003 * qt), Cc_clay)
+        return np.maximum(np.where(Ic < 2.6, Cc_sand, Cc_clay), 0.01)
+
     def calculate_recompression_index(self, Cc: float, LL: float = None, 
                                      Ic: float = None) -> float:
         """
@@ -143,9 +173,9 @@ class CPTCorrelations:
         
         # Robertson & Campanella correlation
         if Qtn < 300:
-            phi = 17.6 + 11.0 * np.log10(Qtn)
+            phi = 17.6 + 11.0 * math.log10(Qtn)
         else:
-            phi = 17.6 + 11.0 * np.log10(300)  # Cap at Qtn = 300
+            phi = 17.6 + 11.0 * math.log10(300)  # Cap at Qtn = 300
         
         phi = max(25, min(phi, 45))  # Reasonable bounds
         
@@ -195,11 +225,11 @@ class CPTCorrelations:
         Based on Robertson & Cabal (2010)
         """
         if Ic < 2.05:  # Sand
-            gamma = 17.0 + 3.0 * np.log10(qt / 100)
+            gamma = 17.0 + 3.0 * math.log10(qt / 100)
         elif Ic < 2.6:  # Silty sand
-            gamma = 16.5 + 2.0 * np.log10(qt / 100)
+            gamma = 16.5 + 2.0 * math.log10(qt / 100)
         else:  # Clay
-            gamma = 15.0 + 2.5 * np.log10(qt / 100)
+            gamma = 15.0 + 2.5 * math.log10(qt / 100)
         
         gamma = max(14.0, min(gamma, 22.0))  # Reasonable bounds
         
@@ -208,22 +238,26 @@ class CPTCorrelations:
     def calculate_all_parameters(self, layer: Dict) -> Dict:
         """
         Calculate all settlement parameters for a soil layer.
-        
+
         Input: layer dictionary from soil layering
         Output: dictionary with all calculated parameters
         """
-        qt = layer['avg_qt']
-        sigma_vo_prime = layer['avg_sigma_vo_prime']
-        Ic = layer['avg_Ic']
-        Qtn = layer['avg_Qt']
-        
+        return self._layer_parameters(
+            layer['layer_number'], layer['soil_type'], layer['thickness'],
+            layer['avg_qt'], layer['avg_sigma_vo_prime'],
+            layer['avg_Ic'], layer['avg_Qt']
+        )
+
+    def _layer_parameters(self, layer_number, soil_type, thickness,
+                          qt, sigma_vo_prime, Ic, Qtn) -> Dict:
+        """Positional-argument core of calculate_all_parameters."""
         # Calculate stress at mid-depth of layer
         sigma_vo = sigma_vo_prime * 1.2  # Approximate (assumes some pore pressure)
         
         parameters = {
-            'layer_number': layer['layer_number'],
-            'soil_type': layer['soil_type'],
-            'thickness': layer['thickness'],
+            'layer_number': layer_number,
+            'soil_type': soil_type,
+            'thickness': thickness,
             'Ic': Ic,
             
             # Strength parameters
@@ -259,10 +293,96 @@ class CPTCorrelations:
         """
         if len(layers_df) == 0:
             return pd.DataFrame()
-        
-        results = []
-        for _, layer in layers_df.iterrows():
-            params = self.calculate_all_parameters(layer.to_dict())
-            results.append(params)
-        
+
+        # itertuples with attribute access skips the per-row Series and
+        # to_dict allocations that iterrows incurs
+        results = [
+            self._layer_parameters(
+                row.layer_number, row.soil_type, row.thickness,
+                row.avg_qt, row.avg_sigma_vo_prime, row.avg_Ic, row.avg_Qt
+            )
+            for row in layers_df.itertuples(index=False)
+        ]
+
         return pd.DataFrame(results)
+
+    def process_all_layers_vec(self, layers_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Vectorized equivalent of process_all_layers.
+
+        Evaluates every correlation as array expressions over the layer
+        columns, expressing the Ic-banded branches with np.where/np.select
+        instead of per-row Python dispatch. Produces the same values and
+        column order as the scalar path.
+        """
+        if len(layers_df) == 0:
+            return pd.DataFrame()
+
+        qt = layers_df['avg_qt'].to_numpy(dtype=np.float64)
+        sigma_vo_prime = layers_df['avg_sigma_vo_prime'].to_numpy(dtype=np.float64)
+        Ic = layers_df['avg_Ic'].to_numpy(dtype=np.float64)
+        Qtn = layers_df['avg_Qt'].to_numpy(dtype=np.float64)
+
+        # Stress at mid-depth of layer (same approximation as scalar path)
+        sigma_vo = sigma_vo_prime * 1.2
+
+        # Friction angle: Robertson & Campanella, sands only, capped at Qtn=300
+        phi = np.where(
+            Ic > 2.6, 0.0,
+            np.clip(17.6 + 11.0 * np.log10(np.minimum(Qtn, 300)), 25, 45)
+        )
+
+        # Undrained shear strength: clays only, Nkt from plasticity
+        Nkt = np.minimum(10 + (Ic - 2.6) * 5, 20)
+        Su = np.where(Ic < 2.6, 0.0, np.maximum((qt - sigma_vo) / Nkt, 0))
+
+        # Young's modulus: Robertson (2009), alpha_E from the lookup table
+        alpha_E = self._alpha_E_lookup(Ic)
+        E = np.maximum(alpha_E * (qt - sigma_vo), 100)
+
+        # Constrained modulus: alpha_M limited to [2, 8]
+        alpha_M = np.clip(np.where(Qtn < 14, Qtn * 0.5, 8.0), 2.0, 8.0)
+        M = np.maximum(alpha_M * qt, 100)
+
+        # Compression index: sandy vs clay-like branches, branchless
+        Cc = self._compression_index_vec(Ic, qt)
+
+        # Recompression index from Ic bands
+        Cr = np.maximum(
+            np.select([Ic > 2.95, Ic > 2.60], [Cc / 6.0, Cc / 8.0], default=Cc / 10.0),
+            0.001
+        )
+
+        # OCR: Chen & Mayne k factor by soil type
+        k_ocr = np.select([Ic < 2.2, Ic < 2.6, Ic < 3.0], [0.33, 0.30, 0.25], default=0.20)
+        OCR = np.clip(k_ocr * (qt - sigma_vo) / sigma_vo_prime, 1.0, 20.0)
+
+        # Permeability: Robertson (2010)
+        permeability = np.clip(10 ** (0.952 - 3.04 * Ic), 1e-10, 1e-3)
+
+        # Unit weight: Robertson & Cabal (2010)
+        log_q = np.log10(qt / 100)
+        gamma = np.clip(
+            np.select(
+                [Ic < 2.05, Ic < 2.6],
+                [17.0 + 3.0 * log_q, 16.5 + 2.0 * log_q],
+                default=15.0 + 2.5 * log_q
+            ),
+            14.0, 22.0
+        )
+
+        return pd.DataFrame({
+            'layer_number': layers_df['layer_number'].to_numpy(),
+            'soil_type': layers_df['soil_type'].to_numpy(),
+            'thickness': layers_df['thickness'].to_numpy(),
+            'Ic': Ic,
+            'friction_angle': phi,
+            'undrained_shear_strength': Su,
+            'youngs_modulus': E,
+            'constrained_modulus': M,
+            'compression_index': Cc,
+            'recompression_index': Cr,
+            'OCR': OCR,
+            'permeability': permeability,
+            'unit_weight': gamma
+        })
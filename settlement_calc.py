@@ -1,7 +1,17 @@
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple
 
+# Loop-invariant constants shared by the consolidation-time math
+_LN10 = math.log(10.0)  # natural log of 10, used in every mv back-calculation
+_SEC_PER_YEAR = 365.25 * 86400.0
+_PI2 = math.pi ** 2
+_EIGHT_OVER_PI2 = 8.0 / _PI2
+
 class SettlementCalculator:
     """
     Settlement calculation engine for immediate and consolidation settlement.
@@ -9,7 +19,10 @@ class SettlementCalculator:
     """
     
     def __init__(self):
-        pass
+        # Small content-keyed memo: the total-settlement and time-curve
+        # paths call calculate_consolidation_settlement with identical
+        # arguments back to back
+        self._consolidation_cache = {}
     
     def calculate_stress_increase(self, load: float, footing_width: float, 
                                  footing_length: float, depth_below_footing: float,
@@ -55,9 +68,35 @@ class SettlementCalculator:
         
         # Average stress over the layer
         delta_sigma_avg = (delta_sigma_top + delta_sigma_bottom) / 2
-        
+
         return delta_sigma_avg
-    
+
+    def _stress_increase_vec(self, load: float, footing_width: float,
+                             footing_length: float,
+                             depth_below_footing: np.ndarray,
+                             layer_thickness: np.ndarray) -> np.ndarray:
+        """
+        Array form of calculate_stress_increase: 2:1 stress distribution
+        evaluated for every layer at once. Layers whose top is at or above
+        the footing base get zero stress increase.
+        """
+        q0 = load / (footing_width * footing_length)
+        area = footing_width * footing_length
+
+        depth_to_top = depth_below_footing - layer_thickness / 2
+        depth_to_bottom = depth_below_footing + layer_thickness / 2
+
+        # Masked-out rows (top above footing base) may divide through
+        # degenerate geometry; their values are discarded by the mask
+        with np.errstate(divide='ignore', invalid='ignore'):
+            delta_sigma_top = q0 * area / ((footing_width + depth_to_top) *
+                                           (footing_length + depth_to_top))
+            delta_sigma_bottom = q0 * area / ((footing_width + depth_to_bottom) *
+                                              (footing_length + depth_to_bottom))
+
+        return np.where(depth_to_top <= 0, 0.0,
+                        (delta_sigma_top + delta_sigma_bottom) / 2)
+
     def calculate_immediate_settlement(self, layers_params: pd.DataFrame, 
                                       load: float, footing_width: float,
                                       footing_length: float,
@@ -75,49 +114,37 @@ class SettlementCalculator:
         - E = Young's modulus
         """
         if len(layers_params) == 0:
-            return {'total_settlement': 0, 'layer_settlements': []}
-        
-        layer_settlements = []
-        total_settlement = 0
-        
-        # Cumulative depth from ground surface
-        cumulative_depth = footing_depth
-        
-        for _, layer in layers_params.iterrows():
-            # Depth to center of layer from ground surface
-            layer_mid_depth_from_surface = cumulative_depth + layer['thickness'] / 2
-            
-            # Depth below footing base (measured from footing base, not surface)
-            depth_below_footing = layer_mid_depth_from_surface - footing_depth
-            
-            # Stress increase (using depth below footing)
-            delta_sigma = self.calculate_stress_increase(
-                load, footing_width, footing_length, 
-                depth_below_footing, layer['thickness']
-            )
-            
-            # Young's modulus
-            E = layer['youngs_modulus']
-            
-            # Settlement of this layer (elastic) with Poisson's ratio correction
-            # S = Δσ * H * (1 - ν²) / E
-            elastic_correction = 1 - poisson_ratio**2
-            layer_settlement = (delta_sigma * layer['thickness'] * elastic_correction * 1000) / E  # in mm
-            
-            layer_settlements.append({
-                'layer_number': layer['layer_number'],
-                'soil_type': layer['soil_type'],
-                'settlement_mm': layer_settlement,
-                'stress_increase_kPa': delta_sigma,
-                'E_kPa': E
-            })
-            
-            total_settlement += layer_settlement
-            cumulative_depth += layer['thickness']
-        
+            return {'total_settlement': 0, 'layer_settlements': [],
+                    'layer_settlements_df': pd.DataFrame()}
+        
+        # Depth below footing base to each layer's midpoint, then the
+        # stress increase for all layers in one vectorized call
+        H = layers_params['thickness'].to_numpy(dtype=np.float64)
+        depth_below_footing = np.cumsum(H) - H / 2
+        delta_sigma = self._stress_increase_vec(
+            load, footing_width, footing_length, depth_below_footing, H
+        )
+
+        # Settlement of each layer (elastic) with Poisson's ratio correction
+        # S = Δσ * H * (1 - ν²) / E
+        E = layers_params['youngs_modulus'].to_numpy(dtype=np.float64)
+        elastic_correction = 1 - poisson_ratio**2
+        settlement_mm = (delta_sigma * H * elastic_correction * 1000) / E
+
+        # One frame straight from the column arrays; the records list is
+        # derived from it for callers that iterate per layer
+        layer_settlements_df = pd.DataFrame({
+            'layer_number': layers_params['layer_number'].to_numpy(),
+            'soil_type': layers_params['soil_type'].to_numpy(),
+            'settlement_mm': settlement_mm,
+            'stress_increase_kPa': delta_sigma,
+            'E_kPa': E,
+        }, copy=False)
+
         return {
-            'total_settlement_mm': total_settlement,
-            'layer_settlements': layer_settlements
+            'total_settlement_mm': float(settlement_mm.sum()),
+            'layer_settlements': layer_settlements_df.to_dict('records'),
+            'layer_settlements_df': layer_settlements_df
         }
     
     def calculate_consolidation_settlement(self, layers_params: pd.DataFrame,
@@ -145,106 +172,145 @@ class SettlementCalculator:
         - Δσ = stress increase
         """
         if len(layers_params) == 0:
-            return {'total_settlement': 0, 'layer_settlements': []}
-        
+            return {'total_settlement': 0, 'layer_settlements': [],
+                    'layer_settlements_df': pd.DataFrame()}
+
+        # Key on content, not identity, so edited layer tables recompute
+        cache_key = (int(pd.util.hash_pandas_object(layers_params, index=False).sum()),
+                     load, footing_width, footing_length,
+                     footing_depth, water_table_depth)
+        cached = self._consolidation_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         layer_settlements = []
-        total_settlement = 0
-        
-        cumulative_depth = footing_depth
+
         gamma_soil = 18.0  # kN/m³
         gamma_water = 9.81  # kN/m³
-        
-        for _, layer in layers_params.iterrows():
-            # Only calculate for clay-like soils (Ic > 2.6)
-            if layer['Ic'] < 2.6:
+
+        # Pull every needed column out once; per-row Series boxing via
+        # iterrows dwarfs the actual arithmetic here
+        H_all = layers_params['thickness'].to_numpy(dtype=np.float64)
+        Ic_all = layers_params['Ic'].to_numpy(dtype=np.float64)
+        OCR_all = layers_params['OCR'].to_numpy(dtype=np.float64)
+        Cc_all = layers_params['compression_index'].to_numpy(dtype=np.float64)
+        Cr_all = layers_params['recompression_index'].to_numpy(dtype=np.float64)
+        layer_numbers = layers_params['layer_number'].to_numpy()
+        soil_types = layers_params['soil_type'].to_numpy()
+
+        # Layer midpoints from the surface and stress increase for all
+        # layers up front (2:1 method, vectorized)
+        mid_depths = footing_depth + np.cumsum(H_all) - H_all / 2
+        delta_sigma_all = self._stress_increase_vec(
+            load, footing_width, footing_length, np.cumsum(H_all) - H_all / 2, H_all
+        )
+
+        # Granular layers (Ic < 2.6) take no consolidation settlement:
+        # restrict the math to the clay rows and scatter back afterwards
+        n = len(H_all)
+        clay_mask = Ic_all >= 2.6
+        idx_clay = np.where(clay_mask)[0]
+
+        Ic_c = Ic_all[idx_clay]
+        H_c = H_all[idx_clay]
+        delta_c = delta_sigma_all[idx_clay]
+
+        # Initial effective stress at each clay mid-depth
+        mid_c = mid_depths[idx_clay]
+        sigma_v0 = gamma_soil * mid_c
+        u0 = gamma_water * np.maximum(0.0, mid_c - water_table_depth)
+        s0_c = sigma_v0 - u0
+
+        # Preconsolidation pressure from OCR
+        sp_c = s0_c * OCR_all[idx_clay]
+
+        # Estimate void ratio from Ic and soil type
+        # Higher Ic (clay) typically has higher void ratio
+        e0 = np.where(Ic_c > 3.5, 1.0,        # Soft clay
+             np.where(Ic_c > 3.0, 0.8, 0.6))  # Medium clay / stiff silt-clay
+
+        # Evaluate all three stress-state formulas on whole arrays and
+        # mask-select; evaluating the two or three that don't apply to a
+        # layer is cheaper than branching per row in the interpreter
+        Cr_term = Cr_all[idx_clay] * H_c / (1 + e0)
+        Cc_term = Cc_all[idx_clay] * H_c / (1 + e0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_total = np.log10((s0_c + delta_c) / s0_c)
+            S_oc = Cr_term * log_total
+            S_nc = Cc_term * log_total
+            S_mix = (Cr_term * np.log10(sp_c / s0_c)
+                     + Cc_term * np.log10((s0_c + delta_c) / sp_c))
+
+        oc_mask = s0_c + delta_c <= sp_c
+        mix_mask = s0_c < sp_c
+        S_clay_mm = np.where(oc_mask, S_oc, np.where(mix_mask, S_mix, S_nc)) * 1000
+
+        # Scatter the clay results back into full-length arrays; the
+        # granular positions keep zero settlement and NaN stress fields
+        S_c_mm = np.zeros(n)
+        S_c_mm[idx_clay] = S_clay_mm
+        delta_sigma_full = np.full(n, np.nan)
+        delta_sigma_full[idx_clay] = delta_c
+        sigma_v0_prime = np.full(n, np.nan)
+        sigma_v0_prime[idx_clay] = s0_c
+        sigma_p = np.full(n, np.nan)
+        sigma_p[idx_clay] = sp_c
+
+        conditions = np.full(n, '', dtype=object)
+        conditions[idx_clay] = np.where(
+            oc_mask, "Overconsolidated (recompression only)",
+            np.where(mix_mask, "Overconsolidated to normally consolidated",
+                     "Normally consolidated"))
+
+        for i in range(len(H_all)):
+            if not clay_mask[i]:
                 layer_settlements.append({
-                    'layer_number': layer['layer_number'],
-                    'soil_type': layer['soil_type'],
+                    'layer_number': layer_numbers[i],
+                    'soil_type': soil_types[i],
                     'settlement_mm': 0.0,
                     'note': 'Granular soil - no consolidation settlement'
                 })
-                cumulative_depth += layer['thickness']
                 continue
-            
-            # Depth to center of layer from ground surface
-            layer_mid_depth_from_surface = cumulative_depth + layer['thickness'] / 2
-            
-            # Initial effective stress at mid-depth
-            sigma_v0 = gamma_soil * layer_mid_depth_from_surface
-            if layer_mid_depth_from_surface > water_table_depth:
-                u0 = gamma_water * (layer_mid_depth_from_surface - water_table_depth)
-            else:
-                u0 = 0
-            sigma_v0_prime = sigma_v0 - u0
-            
-            # Depth below footing base (measured from footing base, not surface)
-            depth_below_footing = layer_mid_depth_from_surface - footing_depth
-            
-            # Stress increase (using depth below footing)
-            delta_sigma = self.calculate_stress_increase(
-                load, footing_width, footing_length,
-                depth_below_footing, layer['thickness']
-            )
-            
-            # Preconsolidation pressure from OCR
-            OCR = layer['OCR']
-            sigma_p = sigma_v0_prime * OCR
-            
-            # Compression and recompression indices
-            Cc = layer['compression_index']
-            Cr = layer['recompression_index']
-            
-            # Estimate void ratio from Ic and soil type
-            # Higher Ic (clay) typically has higher void ratio
-            if layer['Ic'] > 3.5:
-                e0 = 1.0  # Soft clay
-            elif layer['Ic'] > 3.0:
-                e0 = 0.8  # Medium clay
-            else:
-                e0 = 0.6  # Stiff silt/clay
-            
-            # Calculate settlement based on stress state
-            H_meters = layer['thickness']
-            
-            if sigma_v0_prime + delta_sigma <= sigma_p:
-                # Overconsolidated - all in recompression range
-                S_c = (Cr * H_meters / (1 + e0)) * np.log10((sigma_v0_prime + delta_sigma) / sigma_v0_prime)
-                condition = "Overconsolidated (recompression only)"
-            else:
-                if sigma_v0_prime < sigma_p:
-                    # Starts overconsolidated, becomes normally consolidated
-                    S_c_recomp = (Cr * H_meters / (1 + e0)) * np.log10(sigma_p / sigma_v0_prime)
-                    S_c_virgin = (Cc * H_meters / (1 + e0)) * np.log10((sigma_v0_prime + delta_sigma) / sigma_p)
-                    S_c = S_c_recomp + S_c_virgin
-                    condition = "Overconsolidated to normally consolidated"
-                else:
-                    # Normally consolidated
-                    S_c = (Cc * H_meters / (1 + e0)) * np.log10((sigma_v0_prime + delta_sigma) / sigma_v0_prime)
-                    condition = "Normally consolidated"
-            
-            # Convert to mm
-            S_c_mm = S_c * 1000
-            
+
             layer_settlements.append({
-                'layer_number': layer['layer_number'],
-                'soil_type': layer['soil_type'],
-                'settlement_mm': S_c_mm,
-                'stress_increase_kPa': delta_sigma,
-                'initial_stress_kPa': sigma_v0_prime,
-                'preconsolidation_kPa': sigma_p,
-                'OCR': OCR,
-                'Cc': Cc,
-                'Cr': Cr,
-                'condition': condition
+                'layer_number': layer_numbers[i],
+                'soil_type': soil_types[i],
+                'settlement_mm': S_c_mm[i],
+                'stress_increase_kPa': delta_sigma_full[i],
+                'initial_stress_kPa': sigma_v0_prime[i],
+                'preconsolidation_kPa': sigma_p[i],
+                'OCR': OCR_all[i],
+                'Cc': Cc_all[i],
+                'Cr': Cr_all[i],
+                'condition': conditions[i]
             })
-            
-            total_settlement += S_c_mm
-            cumulative_depth += layer['thickness']
-        
-        return {
-            'total_settlement_mm': total_settlement,
-            'layer_settlements': layer_settlements
+
+        # Parallel frame built once from the column arrays for display/
+        # export consumers; granular rows carry NaN stress fields and a
+        # note instead of a condition
+        layer_settlements_df = pd.DataFrame({
+            'layer_number': layer_numbers,
+            'soil_type': soil_types,
+            'settlement_mm': S_c_mm,
+            'stress_increase_kPa': delta_sigma_full,
+            'initial_stress_kPa': sigma_v0_prime,
+            'preconsolidation_kPa': sigma_p,
+            'OCR': np.where(clay_mask, OCR_all, np.nan),
+            'Cc': np.where(clay_mask, Cc_all, np.nan),
+            'Cr': np.where(clay_mask, Cr_all, np.nan),
+            'condition': conditions,
+            'note': np.where(clay_mask, '', 'Granular soil - no consolidation settlement'),
+        }, copy=False)
+
+        result = {
+            'total_settlement_mm': float(S_c_mm.sum()),
+            'layer_settlements': layer_settlements,
+            'layer_settlements_df': layer_settlements_df
         }
+        if len(self._consolidation_cache) >= 8:
+            self._consolidation_cache.pop(next(iter(self._consolidation_cache)))
+        self._consolidation_cache[cache_key] = result
+        return result
     
     def calculate_total_settlement(self, layers_params: pd.DataFrame,
                                   load: float, footing_width: float,
@@ -270,9 +336,117 @@ class SettlementCalculator:
             'consolidation_settlement_mm': consolidation['total_settlement_mm'],
             'total_settlement_mm': total,
             'immediate_details': immediate['layer_settlements'],
-            'consolidation_details': consolidation['layer_settlements']
+            'consolidation_details': consolidation['layer_settlements'],
+            # Pre-built frames so callers don't redo the list-of-dicts
+            # conversion every time they display the details
+            'immediate_details_df': immediate['layer_settlements_df'],
+            'consolidation_details_df': consolidation['layer_settlements_df']
         }
     
+    def calculate_total_settlement_grid(self, layers_params: pd.DataFrame,
+                                        loads, footing_widths, footing_lengths,
+                                        footing_depth: float = 0.0,
+                                        water_table_depth: float = 2.0,
+                                        poisson_ratio: float = 0.3) -> pd.DataFrame:
+        """
+        Evaluate total settlement for a whole sweep of footing designs.
+
+        loads, footing_widths and footing_lengths are broadcast together
+        into one design axis, and the settlement formulas are evaluated
+        on a (design, layer) grid in a single pass instead of re-running
+        the calculator per design.
+
+        Returns a DataFrame with one row per design: load, width, length,
+        immediate/consolidation/total settlement in mm.
+        """
+        loads, widths, lengths = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(loads, dtype=np.float64)),
+            np.atleast_1d(np.asarray(footing_widths, dtype=np.float64)),
+            np.atleast_1d(np.asarray(footing_lengths, dtype=np.float64)))
+
+        if len(layers_params) == 0:
+            return pd.DataFrame({
+                'load': loads, 'width': widths, 'length': lengths,
+                'immediate_settlement_mm': 0.0,
+                'consolidation_settlement_mm': 0.0,
+                'total_settlement_mm': 0.0,
+            })
+
+        # Design axis as a column vector so every per-layer expression
+        # broadcasts to shape (n_designs, n_layers)
+        load_col = loads[:, None]
+        width_col = widths[:, None]
+        length_col = lengths[:, None]
+
+        H = layers_params['thickness'].to_numpy(dtype=np.float64)
+        depth_below_footing = np.cumsum(H) - H / 2
+        delta_sigma = self._stress_increase_vec(
+            load_col, width_col, length_col, depth_below_footing, H
+        )
+
+        # Immediate (elastic) settlement, summed over the layer axis
+        E = layers_params['youngs_modulus'].to_numpy(dtype=np.float64)
+        immediate_mm = (delta_sigma * H * (1 - poisson_ratio**2) * 1000 / E).sum(axis=1)
+
+        # Consolidation settlement: the stress state is design-independent
+        # per layer except for the stress increase itself
+        Ic = layers_params['Ic'].to_numpy(dtype=np.float64)
+        OCR = layers_params['OCR'].to_numpy(dtype=np.float64)
+        Cc = layers_params['compression_index'].to_numpy(dtype=np.float64)
+        Cr = layers_params['recompression_index'].to_numpy(dtype=np.float64)
+
+        mid_depths = footing_depth + np.cumsum(H) - H / 2
+        sigma_v0_prime = 18.0 * mid_depths - 9.81 * np.maximum(0.0, mid_depths - water_table_depth)
+        sigma_p = sigma_v0_prime * OCR
+        e0 = np.where(Ic > 3.5, 1.0, np.where(Ic > 3.0, 0.8, 0.6))
+
+        Cr_term = Cr * H / (1 + e0)
+        Cc_term = Cc * H / (1 + e0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_total = np.log10((sigma_v0_prime + delta_sigma) / sigma_v0_prime)
+            S_oc = Cr_term * log_total
+            S_nc = Cc_term * log_total
+            S_mix = (Cr_term * np.log10(sigma_p / sigma_v0_prime)
+                     + Cc_term * np.log10((sigma_v0_prime + delta_sigma) / sigma_p))
+
+        oc_mask = sigma_v0_prime + delta_sigma <= sigma_p
+        S_c = np.where(oc_mask, S_oc, np.where(sigma_v0_prime < sigma_p, S_mix, S_nc))
+        consolidation_mm = (np.where(Ic >= 2.6, S_c, 0.0) * 1000).sum(axis=1)
+
+        return pd.DataFrame({
+            'load': loads,
+            'width': widths,
+            'length': lengths,
+            'immediate_settlement_mm': immediate_mm,
+            'consolidation_settlement_mm': consolidation_mm,
+            'total_settlement_mm': immediate_mm + consolidation_mm,
+        })
+
+    def calculate_total_settlement_batch(self, profiles, load: float,
+                                         footing_width: float,
+                                         footing_length: float,
+                                         footing_depth: float = 0.0,
+                                         water_table_depth: float = 2.0,
+                                         max_workers: int = None) -> List[Dict]:
+        """
+        Evaluate total settlement for many independent layer profiles
+        (e.g. every CPT on a site, or Monte Carlo realizations).
+
+        Profiles don't interact, so they run on a thread pool; the NumPy
+        kernels release the GIL for the heavy arithmetic. Results come
+        back in input order.
+        """
+        profiles = list(profiles)
+        if not profiles:
+            return []
+        workers = max_workers or min(len(profiles), os.cpu_count() or 4)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(
+                lambda lp: self.calculate_total_settlement(
+                    lp, load, footing_width, footing_length,
+                    footing_depth, water_table_depth),
+                profiles))
+
     def estimate_time_settlement(self, layers_params: pd.DataFrame,
                                 load: float, footing_width: float,
                                 footing_length: float,
@@ -289,10 +463,44 @@ class SettlementCalculator:
             footing_depth, water_table_depth
         )
         
-        total_time_settlement = 0
+        # Time-independent consolidation properties for the clay layers,
+        # built once as arrays (same hoisting as the curve generator)
+        cons_records = consolidation['layer_settlements']
+        clay_idx = np.array([idx for idx, d in enumerate(cons_records) if 'Cc' in d],
+                            dtype=np.intp)
+        cons_arr = np.array([cons_records[idx]['settlement_mm'] for idx in clay_idx])
+        Cc_arr = np.array([cons_records[idx]['Cc'] for idx in clay_idx])
+        sig_arr = np.array([cons_records[idx]['initial_stress_kPa'] for idx in clay_idx])
+        H_drainage = layers_params['thickness'].to_numpy(dtype=np.float64)[clay_idx] / 2  # Double drainage
+        k_arr = layers_params['permeability'].to_numpy(dtype=np.float64)[clay_idx]  # m/s
+
+        # Coefficient of consolidation
+        # cv = k / (gamma_w * mv)
+        # mv = (1 + e0) / (Cc * sigma_v')  approximation
+        gamma_w = 9.81  # kN/m³
+        e0 = 0.8  # Assumed
+        # Clamp away pathological zero stresses rather than branching;
+        # degenerate layers then consolidate instantly instead of NaN-ing
+        mv = Cc_arr / ((1 + e0) * np.clip(sig_arr, 1e-6, None) * _LN10)  # m²/kN
+        cv = k_arr / (gamma_w * mv)  # m²/s
+
+        # Time factor for every clay layer at once
+        time_seconds = time_years * _SEC_PER_YEAR
+        with np.errstate(divide='ignore', invalid='ignore'):
+            Tv = cv * time_seconds / (H_drainage ** 2)
+
+        # Degree of consolidation (Terzaghi theory)
+        # Correct formula: U = 1 - (8/π²) * exp(-π²*Tv/4)
+        U = np.where(Tv < 0.217,
+                     np.sqrt(4 * Tv / np.pi),
+                     1 - _EIGHT_OVER_PI2 * np.exp(-_PI2 * Tv / 4))
+        np.minimum(U, 1.0, out=U)
+
+        settlement_at_time = cons_arr * U
+
         layer_time_settlements = []
-        
-        for layer_detail in consolidation['layer_settlements']:
+        clay_pos = 0
+        for layer_detail in cons_records:
             if 'Cc' not in layer_detail:
                 # Granular layer - immediate settlement only
                 layer_time_settlements.append({
@@ -301,52 +509,18 @@ class SettlementCalculator:
                     'degree_consolidation': 1.0
                 })
                 continue
-            
-            # Get layer info
-            layer_idx = int(layer_detail['layer_number']) - 1
-            layer = layers_params.iloc[layer_idx]
-            
-            # Permeability and thickness
-            k = layer['permeability']  # m/s
-            H_drainage = layer['thickness'] / 2  # Assume double drainage
-            
-            # Coefficient of consolidation
-            # cv = k / (gamma_w * mv)
-            # mv = (1 + e0) / (Cc * sigma_v')  approximation
-            gamma_w = 9.81  # kN/m³
-            Cc = layer_detail['Cc']
-            sigma_v_prime = layer_detail['initial_stress_kPa']
-            e0 = 0.8  # Assumed
-            
-            mv = Cc / ((1 + e0) * sigma_v_prime * np.log(10))  # m²/kN
-            cv = k / (gamma_w * mv)  # m²/s
-            
-            # Time factor
-            time_seconds = time_years * 365.25 * 24 * 3600
-            Tv = cv * time_seconds / (H_drainage ** 2)
-            
-            # Degree of consolidation (Terzaghi theory)
-            # Correct formula: U = 1 - (8/π²) * exp(-π²*Tv/4)
-            if Tv < 0.217:
-                U = np.sqrt(4 * Tv / np.pi)
-            else:
-                U = 1 - (8 / (np.pi ** 2)) * np.exp(-np.pi ** 2 * Tv / 4)
-            
-            U = min(U, 1.0)
-            
-            settlement_at_time = layer_detail['settlement_mm'] * U
-            total_time_settlement += settlement_at_time
-            
+
             layer_time_settlements.append({
                 'layer_number': layer_detail['layer_number'],
-                'settlement_mm': settlement_at_time,
-                'degree_consolidation': U,
-                'time_factor': Tv
+                'settlement_mm': settlement_at_time[clay_pos],
+                'degree_consolidation': U[clay_pos],
+                'time_factor': Tv[clay_pos]
             })
-        
+            clay_pos += 1
+
         return {
             'time_years': time_years,
-            'total_settlement_mm': total_time_settlement,
+            'total_settlement_mm': float(settlement_at_time.sum()),
             'layer_settlements': layer_time_settlements
         }
     
@@ -384,104 +558,88 @@ class SettlementCalculator:
         
         # Generate time points (logarithmic spacing for better resolution)
         time_points = np.logspace(-3, np.log10(max_time_years), num_points)  # From 0.001 to max_time_years
-        
-        # Arrays to store results
-        settlement_primary = []
-        settlement_with_secondary = []
-        layer_contributions = {i: [] for i in range(len(layers_params))}
-        
-        for time_years in time_points:
-            # Calculate total settlement at this time (immediate + time-dependent consolidation)
-            # Start at 0 and add each layer's contribution once
-            total_primary = 0
-            
-            for idx, layer_detail in enumerate(consolidation['layer_settlements']):
-                # Get immediate settlement for this layer
-                layer_immediate = 0
-                if idx < len(immediate['layer_settlements']):
-                    layer_immediate = immediate['layer_settlements'][idx]['settlement_mm']
-                
-                if 'Cc' not in layer_detail:
-                    # Granular layer - only immediate settlement (no consolidation)
-                    layer_settlement = layer_immediate
-                else:
-                    # Clay layer - calculate time-dependent consolidation
-                    layer_idx = int(layer_detail['layer_number']) - 1
-                    layer = layers_params.iloc[layer_idx]
-                    
-                    # Permeability and drainage conditions
-                    k = layer['permeability']  # m/s
-                    H_drainage = layer['thickness'] / 2  # Assume double drainage
-                    
-                    # Coefficient of consolidation
-                    gamma_w = 9.81  # kN/m³
-                    Cc = layer_detail['Cc']
-                    sigma_v_prime = layer_detail['initial_stress_kPa']
-                    e0 = 0.8  # Assumed
-                    
-                    mv = Cc / ((1 + e0) * sigma_v_prime * np.log(10))  # m²/kN
-                    cv = k / (gamma_w * mv)  # m²/s
-                    
-                    # Time factor
-                    time_seconds = time_years * 365.25 * 24 * 3600
-                    Tv = cv * time_seconds / (H_drainage ** 2)
-                    
-                    # Degree of consolidation (Terzaghi theory)
-                    # Correct formula: U = 1 - (8/π²) * exp(-π²*Tv/4)
-                    if Tv < 0.217:
-                        U = np.sqrt(4 * Tv / np.pi)
-                    else:
-                        U = 1 - (8 / (np.pi ** 2)) * np.exp(-np.pi ** 2 * Tv / 4)
-                    U = min(U, 1.0)
-                    
-                    # Layer settlement = immediate + (consolidation settlement * degree of consolidation)
-                    layer_settlement = layer_immediate + layer_detail['settlement_mm'] * U
-                
-                total_primary += layer_settlement
-                layer_contributions[idx].append(layer_settlement)
-            
-            settlement_primary.append(total_primary)
-            
-            # Add secondary compression (creep) if requested
-            if include_secondary:
-                # Secondary compression starts after primary consolidation
-                # S_secondary = C_alpha * H * log10(t/t_p)
-                # where t_p is time for primary consolidation (typically at U = 90%)
-                
-                secondary_settlement = 0
-                for layer_detail in consolidation['layer_settlements']:
-                    if 'Cc' not in layer_detail:
-                        continue
-                    
-                    layer_idx = int(layer_detail['layer_number']) - 1
-                    layer = layers_params.iloc[layer_idx]
-                    
-                    # Estimate time for 90% consolidation
-                    k = layer['permeability']
-                    H_drainage = layer['thickness'] / 2
-                    Cc = layer_detail['Cc']
-                    sigma_v_prime = layer_detail['initial_stress_kPa']
-                    e0 = 0.8
-                    mv = Cc / ((1 + e0) * sigma_v_prime * np.log(10))
-                    cv = k / (9.81 * mv)
-                    
-                    # Tv for 90% consolidation ≈ 0.848
-                    t_p_seconds = 0.848 * (H_drainage ** 2) / cv
-                    t_p_years = t_p_seconds / (365.25 * 24 * 3600)
-                    
-                    # Secondary compression only occurs after primary
-                    if time_years > t_p_years:
-                        C_alpha = c_alpha * Cc  # Secondary compression index
-                        H_meters = layer['thickness']
-                        S_secondary = (C_alpha * H_meters / (1 + e0)) * np.log10(time_years / t_p_years)
-                        secondary_settlement += S_secondary * 1000  # Convert to mm
-                
-                settlement_with_secondary.append(total_primary + secondary_settlement)
-            else:
-                settlement_with_secondary.append(total_primary)
-        
+        time_seconds = time_points * _SEC_PER_YEAR
+
+        n_layers = len(layers_params)
+
+        # Per-layer immediate settlement (constant over time)
+        imm_arr = np.zeros(n_layers)
+        for idx, detail in enumerate(immediate['layer_settlements'][:n_layers]):
+            imm_arr[idx] = detail['settlement_mm']
+
+        # Everything below is time-independent per layer: hoist it out of
+        # the time grid entirely and compute it once
+        cons_records = consolidation['layer_settlements']
+        clay_idx = np.array([idx for idx, d in enumerate(cons_records) if 'Cc' in d],
+                            dtype=np.intp)
+        cons_arr = np.array([cons_records[idx]['settlement_mm'] for idx in clay_idx])
+        Cc_arr = np.array([cons_records[idx]['Cc'] for idx in clay_idx])
+        sig_arr = np.array([cons_records[idx]['initial_stress_kPa'] for idx in clay_idx])
+        H_arr = layers_params['thickness'].to_numpy(dtype=np.float64)[clay_idx]
+        k_arr = layers_params['permeability'].to_numpy(dtype=np.float64)[clay_idx]
+
+        # Coefficient of consolidation per clay layer
+        # cv = k / (gamma_w * mv), mv = Cc / ((1 + e0) * sigma_v' * ln10)
+        gamma_w = 9.81  # kN/m³
+        e0 = 0.8  # Assumed
+        # Clamp away pathological zero stresses rather than branching;
+        # degenerate layers then consolidate instantly instead of NaN-ing
+        mv = Cc_arr / ((1 + e0) * np.clip(sig_arr, 1e-6, None) * _LN10)  # m²/kN
+        cv = k_arr / (gamma_w * mv)  # m²/s
+        H_drainage = H_arr / 2  # Assume double drainage
+
+        # Fold the layer-dependent factors into one rate per layer, then
+        # the (num_points, n_clay) grid is a single outer product
+        with np.errstate(divide='ignore', invalid='ignore'):
+            alpha = cv / H_drainage ** 2  # 1/s
+            Tv = np.multiply.outer(time_seconds, alpha)
+
+        # Degree of consolidation (Terzaghi theory)
+        # Correct formula: U = 1 - (8/π²) * exp(-π²*Tv/4)
+        U = np.where(Tv < 0.217,
+                     np.sqrt(4 * Tv / np.pi),
+                     1 - _EIGHT_OVER_PI2 * np.exp(-_PI2 * Tv / 4))
+        np.minimum(U, 1.0, out=U)
+
+        # Layer settlement = immediate + (consolidation settlement * degree
+        # of consolidation); granular columns stay at their immediate value
+        contributions = np.broadcast_to(imm_arr, (num_points, n_layers)).copy()
+        contributions[:, clay_idx] += cons_arr[None, :] * U
+
+        settlement_primary = contributions.sum(axis=1)
+        layer_contributions = {i: contributions[:, i] for i in range(n_layers)}
+
+        # Add secondary compression (creep) if requested
+        if include_secondary:
+            # Secondary compression starts after primary consolidation
+            # S_secondary = C_alpha * H * log10(t/t_p)
+            # where t_p is time for primary consolidation (typically at U = 90%)
+
+            # Tv for 90% consolidation ≈ 0.848, reusing the per-layer rate
+            with np.errstate(divide='ignore', invalid='ignore'):
+                t_p_seconds = 0.848 / alpha
+            t_p_years = t_p_seconds / _SEC_PER_YEAR
+            # Non-finite or underflowed t90 means the comparison below
+            # should simply never fire
+            t_p_years = np.where(np.isfinite(t_p_years) & (t_p_years > 0),
+                                 t_p_years, np.inf)
+
+            C_alpha = c_alpha * Cc_arr  # Secondary compression index
+            ratio = time_points[:, None] / t_p_years[None, :]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                # Secondary compression only occurs after primary
+                S_secondary = np.where(
+                    ratio > 1.0,
+                    (C_alpha[None, :] * H_arr[None, :] / (1 + e0)) * np.log10(ratio),
+                    0.0)
+            settlement_with_secondary = settlement_primary + S_secondary.sum(axis=1) * 1000
+        else:
+            settlement_with_secondary = settlement_primary
+
+        # Return curves as numpy arrays: Plotly serializes ndarrays through
+        # its typed-array fast path, and callers can index them directly.
         return {
-            'time_years': time_points.tolist(),
+            'time_years': time_points,
             'settlement_primary_mm': settlement_primary,
             'settlement_total_mm': settlement_with_secondary,
             'immediate_settlement_mm': immediate['total_settlement_mm'],
@@ -504,14 +662,14 @@ class SettlementCalculator:
         """
         # Time factor for different degrees of consolidation
         if target_degree < 0.5:
-            Tv_target = (np.pi / 4) * (target_degree ** 2)
+            Tv_target = (math.pi / 4) * (target_degree ** 2)
         elif target_degree < 0.60:
             Tv_target = 0.197
         elif target_degree < 0.90:
             # Interpolate
-            Tv_target = -0.933 * np.log10(1 - target_degree)
+            Tv_target = -0.933 * math.log10(1 - target_degree)
         else:
-            Tv_target = -0.933 * np.log10(1 - target_degree)
+            Tv_target = -0.933 * math.log10(1 - target_degree)
         
         layer_times = []
         
@@ -541,12 +699,12 @@ class SettlementCalculator:
             sigma_v_prime = 18.0 * depth - 9.81 * max(0, depth - 2.0)
             
             e0 = 0.8
-            mv = Cc / ((1 + e0) * sigma_v_prime * np.log(10))
+            mv = Cc / ((1 + e0) * sigma_v_prime * _LN10)
             cv = k / (gamma_w * mv)  # m²/s
             
             # Time for target consolidation
             time_seconds = Tv_target * (H_drainage ** 2) / cv
-            time_years = time_seconds / (365.25 * 24 * 3600)
+            time_years = time_seconds / _SEC_PER_YEAR
             
             layer_times.append({
                 'layer_number': layer['layer_number'],
@@ -1,6 +1,41 @@
+import functools
 import numpy as np
 import pandas as pd
-from typing import List, Dict, Tuple, Optional
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Tuple, Optional
+
+@functools.lru_cache(maxsize=None)
+def _compute_Ic_contours(Qt_range: Tuple[float, float], num_points: int,
+                         Ic_values: Tuple[float, ...]) -> Dict[float, np.ndarray]:
+    """
+    Ic contour lines on the Qt-Fr chart, shared by both Robertson charts.
+
+    Ic = sqrt((3.47 - log10(Qt))^2 + (log10(Fr) + 1.22)^2), solved for Fr:
+    Fr = 10^(sqrt(Ic^2 - (3.47 - log10(Qt))^2) - 1.22)
+
+    Results are cached per (Qt_range, num_points, Ic_values) and handed
+    out read-only — the geometry is fixed, so repeat plot refreshes
+    reuse the same arrays.
+    """
+    Qt_array = np.logspace(np.log10(Qt_range[0]), np.log10(Qt_range[1]), num_points)
+    log_Qt = np.log10(Qt_array)
+    offset = (3.47 - log_Qt) ** 2
+
+    # All contours in one (n_Ic, num_points) block: a single sqrt with
+    # invalid lanes left NaN, instead of a fresh mask and NaN fill per Ic
+    Ic_arr = np.asarray(Ic_values, dtype=np.float64)
+    discriminant = Ic_arr[:, None] ** 2 - offset
+    sqrt_disc = np.full(discriminant.shape, np.nan)
+    np.sqrt(discriminant, where=discriminant >= 0, out=sqrt_disc)
+    Fr_block = 10 ** (sqrt_disc - 1.22)
+
+    contours = {}
+    for i, Ic in enumerate(Ic_values):
+        arr = np.column_stack([Qt_array, Fr_block[i]])
+        arr.flags.writeable = False
+        contours[Ic] = arr
+    return contours
+
 
 class SoilLayering:
     """
@@ -22,220 +57,300 @@ class SoilLayering:
         """
         if len(df) == 0:
             return pd.DataFrame()
-        
-        layers = []
-        current_layer_start = 0
-        current_layer_Ic = df['Ic'].iloc[0]
-        current_layer_soil_type = df['soil_type'].iloc[0]
-        
+
         # Define Ic thresholds for layer boundaries
         Ic_threshold = 0.3  # Change of 0.3 in Ic suggests different material
-        
-        for i in range(1, len(df)):
-            Ic_change = abs(df['Ic'].iloc[i] - current_layer_Ic)
-            depth_diff = df['depth'].iloc[i] - df['depth'].iloc[current_layer_start]
-            
-            # Check if we should create a new layer
-            if Ic_change > Ic_threshold and depth_diff >= self.min_layer_thickness:
-                # Store current layer
-                layer = self._create_layer(df, current_layer_start, i)
-                layers.append(layer)
-                
-                # Start new layer
-                current_layer_start = i
-                current_layer_Ic = df['Ic'].iloc[i]
-                current_layer_soil_type = df['soil_type'].iloc[i]
-        
-        # Add the last layer
-        layer = self._create_layer(df, current_layer_start, len(df))
-        layers.append(layer)
-        
-        return pd.DataFrame(layers)
-    
-    def _create_layer(self, df: pd.DataFrame, start_idx: int, end_idx: int) -> Dict:
-        """
-        Create a layer dictionary from a DataFrame slice.
+
+        # The reference Ic/depth update whenever a boundary is accepted,
+        # so the scan is inherently sequential — but running it over raw
+        # NumPy arrays avoids a pandas .iloc round trip per sample
+        Ic = df['Ic'].to_numpy(dtype=np.float64)
+        depth = df['depth'].to_numpy(dtype=np.float64)
+
+        boundaries = [0]
+        ref_Ic = Ic[0]
+        ref_depth = depth[0]
+        for i in range(1, len(Ic)):
+            if (abs(Ic[i] - ref_Ic) > Ic_threshold
+                    and depth[i] - ref_depth >= self.min_layer_thickness):
+                boundaries.append(i)
+                ref_Ic = Ic[i]
+                ref_depth = depth[i]
+        boundaries.append(len(Ic))
+
+        # Fold the thin-layer merge into the same pass: drop the boundary
+        # after any segment thinner than the minimum (except the last), so
+        # no layer is materialized just to be merged away again. Sample
+        # means over the fused segment are the uniform-spacing equivalent
+        # of the old thickness-weighted average.
+        accepted = [boundaries[0]]
+        j = 0
+        while j < len(boundaries) - 1:
+            start, end = boundaries[j], boundaries[j + 1]
+            thickness = depth[end - 1] - depth[start]
+            if thickness < self.min_layer_thickness and j < len(boundaries) - 2:
+                # Fuse with the next segment and skip its boundary
+                accepted.append(boundaries[j + 2])
+                j += 2
+            else:
+                accepted.append(end)
+                j += 1
+        bounds = np.asarray(accepted)
+
+        return self._build_layers(df, bounds)
+
+    @staticmethod
+    def _build_layers(df: pd.DataFrame, bounds: np.ndarray) -> pd.DataFrame:
         """
-        layer_data = df.iloc[start_idx:end_idx]
-        
-        return {
+        Aggregate all layers at once from boundary indices.
+
+        Per-layer means are segment sums via np.add.reduceat divided by
+        segment lengths — one reduction per column instead of one pandas
+        .mean() per column per layer. NaNs are excluded per column, matching
+        pandas' skipna mean (all-NaN segments stay NaN).
+        """
+        n_layers = len(bounds) - 1
+        counts = np.diff(bounds)
+        starts = bounds[:-1]
+
+        # One contiguous float block and one reduceat for every averaged
+        # column at once instead of a reduction per column
+        agg_cols = ['qc', 'qt', 'fs', 'Ic', 'Qt1', 'Fr', 'Rf', 'sigma_vo_prime']
+        mat = df[agg_cols].to_numpy(dtype=np.float64)
+        valid = ~np.isnan(mat)
+        sums = np.add.reduceat(np.where(valid, mat, 0.0), starts, axis=0)
+        valid_counts = np.add.reduceat(valid.astype(np.float64), starts, axis=0)
+        with np.errstate(invalid='ignore'):
+            means = sums / valid_counts
+        avg = dict(zip(agg_cols, means.T))
+
+        depth = df['depth'].to_numpy(dtype=np.float64)
+        top_depth = depth[starts]
+        bottom_depth = depth[bounds[1:] - 1]
+
+        # Per-layer soil-type mode: count (layer, type) pairs in one
+        # scatter-add, then take the most frequent per row. np.unique
+        # gives sorted codes, so argmax ties resolve to the smallest
+        # value like Series.mode()[0]
+        types, codes = np.unique(df['soil_type'].to_numpy(), return_inverse=True)
+        layer_id = np.repeat(np.arange(n_layers), counts)
+        type_counts = np.zeros((n_layers, len(types)), dtype=np.int64)
+        np.add.at(type_counts, (layer_id, codes), 1)
+        soil_type = types[type_counts.argmax(axis=1)]
+
+        return pd.DataFrame({
             'layer_number': None,  # Will be assigned later
-            'top_depth': layer_data['depth'].iloc[0],
-            'bottom_depth': layer_data['depth'].iloc[-1],
-            'thickness': layer_data['depth'].iloc[-1] - layer_data['depth'].iloc[0],
-            'avg_qc': layer_data['qc'].mean(),
-            'avg_qt': layer_data['qt'].mean(),
-            'avg_fs': layer_data['fs'].mean(),
-            'avg_Ic': layer_data['Ic'].mean(),
-            'avg_Qt': layer_data['Qt1'].mean(),
-            'avg_Fr': layer_data['Fr'].mean(),
-            'avg_Rf': layer_data['Rf'].mean(),
-            'soil_type': layer_data['soil_type'].mode()[0] if len(layer_data) > 0 else "Unknown",
-            'avg_sigma_vo_prime': layer_data['sigma_vo_prime'].mean()
-        }
-    
+            'top_depth': top_depth,
+            'bottom_depth': bottom_depth,
+            'thickness': bottom_depth - top_depth,
+            'avg_qc': avg['qc'],
+            'avg_qt': avg['qt'],
+            'avg_fs': avg['fs'],
+            'avg_Ic': avg['Ic'],
+            'avg_Qt': avg['Qt1'],
+            'avg_Fr': avg['Fr'],
+            'avg_Rf': avg['Rf'],
+            'soil_type': soil_type,
+            'avg_sigma_vo_prime': avg['sigma_vo_prime']
+        })
+
+
     def merge_thin_layers(self, layers_df: pd.DataFrame) -> pd.DataFrame:
         """
         Merge layers thinner than minimum thickness with adjacent layers.
         """
         if len(layers_df) == 0:
             return layers_df
-        
-        merged = []
+
+        # Work on plain column arrays: the walk reads NumPy scalars and
+        # writes into preallocated outputs, with none of the per-row
+        # Series/dict round trips .iloc[i].to_dict() used to pay for
+        cols = list(layers_df.columns)
+        arrs = {c: layers_df[c].to_numpy() for c in cols}
+        out = {c: np.empty(len(layers_df), dtype=arrs[c].dtype) for c in cols}
+
+        weighted_cols = [c for c in ('avg_qc', 'avg_qt', 'avg_fs', 'avg_Ic',
+                                     'avg_Qt', 'avg_Fr', 'avg_Rf',
+                                     'avg_sigma_vo_prime') if c in arrs]
+        thickness = arrs['thickness']
+
+        n = len(layers_df)
         i = 0
-        
-        while i < len(layers_df):
-            current = layers_df.iloc[i].to_dict()
-            
-            # Check if layer is too thin
-            if current['thickness'] < self.min_layer_thickness and i < len(layers_df) - 1:
-                # Merge with next layer
-                next_layer = layers_df.iloc[i + 1].to_dict()
-                merged_layer = self._merge_two_layers(current, next_layer)
-                merged.append(merged_layer)
+        k = 0
+        while i < n:
+            # Carry the current layer's values (layer_number, top_depth,
+            # soil_type, any extra columns), then overwrite what merging
+            # changes
+            for c in cols:
+                out[c][k] = arrs[c][i]
+
+            if thickness[i] < self.min_layer_thickness and i < n - 1:
+                # Merge with next layer by thickness-weighted averaging
+                total = thickness[i] + thickness[i + 1]
+                w1 = thickness[i] / total
+                w2 = thickness[i + 1] / total
+                for c in weighted_cols:
+                    out[c][k] = w1 * arrs[c][i] + w2 * arrs[c][i + 1]
+                out['bottom_depth'][k] = arrs['bottom_depth'][i + 1]
+                out['thickness'][k] = total
                 i += 2  # Skip the next layer as it's been merged
             else:
-                merged.append(current)
                 i += 1
-        
-        result = pd.DataFrame(merged)
-        
+            k += 1
+
+        result = pd.DataFrame({c: out[c][:k] for c in cols})
+
         # Renumber layers
-        if len(result) > 0:
-            result['layer_number'] = range(1, len(result) + 1)
-        
+        result['layer_number'] = range(1, k + 1)
+
         return result
     
-    def _merge_two_layers(self, layer1: Dict, layer2: Dict) -> Dict:
-        """
-        Merge two adjacent layers by weighted averaging.
-        """
-        total_thickness = layer1['thickness'] + layer2['thickness']
-        w1 = layer1['thickness'] / total_thickness
-        w2 = layer2['thickness'] / total_thickness
-        
-        return {
-            'layer_number': layer1['layer_number'],
-            'top_depth': layer1['top_depth'],
-            'bottom_depth': layer2['bottom_depth'],
-            'thickness': total_thickness,
-            'avg_qc': w1 * layer1['avg_qc'] + w2 * layer2['avg_qc'],
-            'avg_qt': w1 * layer1['avg_qt'] + w2 * layer2['avg_qt'],
-            'avg_fs': w1 * layer1['avg_fs'] + w2 * layer2['avg_fs'],
-            'avg_Ic': w1 * layer1['avg_Ic'] + w2 * layer2['avg_Ic'],
-            'avg_Qt': w1 * layer1['avg_Qt'] + w2 * layer2['avg_Qt'],
-            'avg_Fr': w1 * layer1['avg_Fr'] + w2 * layer2['avg_Fr'],
-            'avg_Rf': w1 * layer1['avg_Rf'] + w2 * layer2['avg_Rf'],
-            'soil_type': layer1['soil_type'],  # Use first layer's type
-            'avg_sigma_vo_prime': w1 * layer1['avg_sigma_vo_prime'] + w2 * layer2['avg_sigma_vo_prime']
-        }
-    
     def process_layering(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Complete layering process: identify, merge thin layers, and number.
+        Complete layering process: identify (with thin layers fused in
+        the same pass) and number.
         """
         layers = self.identify_layers(df)
-        layers = self.merge_thin_layers(layers)
-        
+
         if len(layers) > 0:
             layers['layer_number'] = range(1, len(layers) + 1)
-        
+
         return layers
 
 
+# Zone definitions are immutable reference data; built once at import and
+# served through read-only views so plotting passes don't rebuild the dicts
+_ZONES_2009 = MappingProxyType({
+    1: {
+        'name': 'Sensitive, fine grained',
+        'Ic_range': (3.60, 4.0),
+        'color': '#8B4513'
+    },
+    2: {
+        'name': 'Organic soils - clay',
+        'Ic_range': (3.60, 4.0),
+        'color': '#654321'
+    },
+    3: {
+        'name': 'Clays: silty clay to clay',
+        'Ic_range': (2.95, 3.60),
+        'color': '#A0522D'
+    },
+    4: {
+        'name': 'Silt mixtures: clayey silt to silty clay',
+        'Ic_range': (2.60, 2.95),
+        'color': '#CD853F'
+    },
+    5: {
+        'name': 'Sand mixtures: silty sand to sandy silt',
+        'Ic_range': (2.05, 2.60),
+        'color': '#DEB887'
+    },
+    6: {
+        'name': 'Sands: clean sand to silty sand',
+        'Ic_range': (1.31, 2.05),
+        'color': '#F4A460'
+    },
+    7: {
+        'name': 'Gravelly sand to dense sand',
+        'Ic_range': (0.0, 1.31),
+        'color': '#FFD700'
+    }
+})
+
+
 class RobertsonClassification:
     """
     Robertson (2009) soil classification chart implementation.
     """
-    
+
     @staticmethod
-    def get_classification_zones() -> Dict[int, Dict]:
+    def get_classification_zones() -> Mapping[int, Dict]:
         """
         Returns the Robertson (2009) soil behavior type zone definitions.
         """
-        return {
-            1: {
-                'name': 'Sensitive, fine grained',
-                'Ic_range': (3.60, 4.0),
-                'color': '#8B4513'
-            },
-            2: {
-                'name': 'Organic soils - clay',
-                'Ic_range': (3.60, 4.0),
-                'color': '#654321'
-            },
-            3: {
-                'name': 'Clays: silty clay to clay',
-                'Ic_range': (2.95, 3.60),
-                'color': '#A0522D'
-            },
-            4: {
-                'name': 'Silt mixtures: clayey silt to silty clay',
-                'Ic_range': (2.60, 2.95),
-                'color': '#CD853F'
-            },
-            5: {
-                'name': 'Sand mixtures: silty sand to sandy silt',
-                'Ic_range': (2.05, 2.60),
-                'color': '#DEB887'
-            },
-            6: {
-                'name': 'Sands: clean sand to silty sand',
-                'Ic_range': (1.31, 2.05),
-                'color': '#F4A460'
-            },
-            7: {
-                'name': 'Gravelly sand to dense sand',
-                'Ic_range': (0.0, 1.31),
-                'color': '#FFD700'
-            }
-        }
-    
-    @staticmethod
-    def get_zone_from_Ic(Ic: float) -> int:
+        return _ZONES_2009
+
+    # Zone boundaries in ascending Ic order and the zone for each bin;
+    # searchsorted on these replaces the scalar branching ladder
+    _IC_EDGES = np.array([1.31, 2.05, 2.60, 2.95, 3.60, 4.0])
+    _IC_ZONES = np.array([7, 6, 5, 4, 3, 3, 2])
+
+    @classmethod
+    def get_zone_from_Ic_array(cls, Ic: np.ndarray) -> np.ndarray:
+        """
+        Get Robertson zone numbers for a whole array of Ic values.
+        """
+        return cls._IC_ZONES[np.searchsorted(cls._IC_EDGES, Ic, side='right')]
+
+    @classmethod
+    def get_zone_from_Ic(cls, Ic: float) -> int:
         """
         Get Robertson zone number from Ic value.
         """
-        if Ic >= 3.60:
-            return 3 if Ic < 4.0 else 2
-        elif Ic >= 2.95:
-            return 3
-        elif Ic >= 2.60:
-            return 4
-        elif Ic >= 2.05:
-            return 5
-        elif Ic >= 1.31:
-            return 6
-        else:
-            return 7
+        return int(cls._IC_ZONES[np.searchsorted(cls._IC_EDGES, Ic, side='right')])
     
     @staticmethod
-    def calculate_Ic_contours(Qt_range: Tuple[float, float], 
+    def calculate_Ic_contours(Qt_range: Tuple[float, float],
                               num_points: int = 100) -> Dict[float, np.ndarray]:
         """
         Calculate Ic contour lines for plotting on Qt-Fr chart.
-        
-        Ic = sqrt((3.47 - log10(Qt))^2 + (log10(Fr) + 1.22)^2)
+        Cached per argument set; the returned arrays are read-only.
         """
-        Ic_values = [1.31, 2.05, 2.60, 2.95, 3.60]
-        contours = {}
-        
-        Qt_array = np.logspace(np.log10(Qt_range[0]), np.log10(Qt_range[1]), num_points)
-        
-        for Ic in Ic_values:
-            # Solve for Fr from Ic equation
-            # Fr = 10^(sqrt(Ic^2 - (3.47 - log10(Qt))^2) - 1.22)
-            log_Qt = np.log10(Qt_array)
-            discriminant = Ic**2 - (3.47 - log_Qt)**2
-            
-            # Only calculate where discriminant is positive
-            valid_idx = discriminant >= 0
-            Fr_array = np.full_like(Qt_array, np.nan)
-            Fr_array[valid_idx] = 10**(np.sqrt(discriminant[valid_idx]) - 1.22)
-            
-            contours[Ic] = np.column_stack([Qt_array, Fr_array])
-        
-        return contours
+        return _compute_Ic_contours(tuple(map(float, Qt_range)), num_points,
+                                    (1.31, 2.05, 2.60, 2.95, 3.60))
+
+
+_ZONES_1990 = MappingProxyType({
+    1: {
+        'name': 'Sensitive fine-grained',
+        'Ic_range': (3.60, 5.0),
+        'color': '#8B4513'
+    },
+    2: {
+        'name': 'Clay - organic soil',
+        'Ic_range': (2.95, 3.60),
+        'color': '#654321'
+    },
+    3: {
+        'name': 'Clay to silty clay',
+        'Ic_range': (2.60, 2.95),
+        'color': '#A0522D'
+    },
+    4: {
+        'name': 'Silt mixtures - clayey silt to silty clay',
+        'Ic_range': (2.05, 2.60),
+        'color': '#CD853F'
+    },
+    5: {
+        'name': 'Sand mixtures - silty sand to sandy silt',
+        'Ic_range': (1.31, 2.05),
+        'color': '#DEB887'
+    },
+    6: {
+        'name': 'Sands - clean sand to silty sand',
+        'Ic_range': (0.0, 1.31),
+        'color': '#F4A460'
+    },
+    7: {
+        'name': 'Dense sand to gravelly sand',
+        'Ic_range': (0.0, 1.31),
+        'color': '#FFD700',
+        'Qt_threshold': 100
+    },
+    8: {
+        'name': 'Stiff sand to clayey sand',
+        'Ic_range': (1.31, 2.05),
+        'color': '#FFA500',
+        'overconsolidated': True
+    },
+    9: {
+        'name': 'Stiff fine-grained',
+        'Ic_range': (2.05, 5.0),
+        'color': '#FF8C00',
+        'overconsolidated': True
+    }
+})
 
 
 class Robertson1990Classification:
@@ -243,63 +358,14 @@ class Robertson1990Classification:
     Robertson (1990) normalized CPT soil classification chart implementation.
     Uses stress-normalized parameters and 9 soil behavior type zones.
     """
-    
+
     @staticmethod
-    def get_classification_zones() -> Dict[int, Dict]:
+    def get_classification_zones() -> Mapping[int, Dict]:
         """
         Returns the Robertson (1990) soil behavior type zone definitions.
         """
-        return {
-            1: {
-                'name': 'Sensitive fine-grained',
-                'Ic_range': (3.60, 5.0),
-                'color': '#8B4513'
-            },
-            2: {
-                'name': 'Clay - organic soil',
-                'Ic_range': (2.95, 3.60),
-                'color': '#654321'
-            },
-            3: {
-                'name': 'Clay to silty clay',
-                'Ic_range': (2.60, 2.95),
-                'color': '#A0522D'
-            },
-            4: {
-                'name': 'Silt mixtures - clayey silt to silty clay',
-                'Ic_range': (2.05, 2.60),
-                'color': '#CD853F'
-            },
-            5: {
-                'name': 'Sand mixtures - silty sand to sandy silt',
-                'Ic_range': (1.31, 2.05),
-                'color': '#DEB887'
-            },
-            6: {
-                'name': 'Sands - clean sand to silty sand',
-                'Ic_range': (0.0, 1.31),
-                'color': '#F4A460'
-            },
-            7: {
-                'name': 'Dense sand to gravelly sand',
-                'Ic_range': (0.0, 1.31),
-                'color': '#FFD700',
-                'Qt_threshold': 100
-            },
-            8: {
-                'name': 'Stiff sand to clayey sand',
-                'Ic_range': (1.31, 2.05),
-                'color': '#FFA500',
-                'overconsolidated': True
-            },
-            9: {
-                'name': 'Stiff fine-grained',
-                'Ic_range': (2.05, 5.0),
-                'color': '#FF8C00',
-                'overconsolidated': True
-            }
-        }
-    
+        return _ZONES_1990
+
     @staticmethod
     def classify_soil_type(Qt: float, Fr: float, Ic: float) -> str:
         """
@@ -328,28 +394,95 @@ class Robertson1990Classification:
                 return 'Sands - clean sand to silty sand'
     
     @staticmethod
-    def calculate_Ic_contours(Qt_range: Tuple[float, float], 
+    def classify_soil_type_vec(Qt: np.ndarray, Fr: np.ndarray, Ic: np.ndarray) -> np.ndarray:
+        """
+        Vectorized version of classify_soil_type for whole CPT profiles.
+
+        Applies the same zone logic with np.select so classification of an
+        N-sample sounding is a handful of array operations instead of N
+        Python calls.
+        """
+        Qt = np.asarray(Qt)
+        Ic = np.asarray(Ic)
+
+        conditions = [
+            Ic >= 3.60,
+            Ic >= 2.95,
+            Ic >= 2.60,
+            (Ic >= 2.05) & (Qt > 50),
+            Ic >= 2.05,
+            (Ic >= 1.31) & (Qt > 50),
+            Ic >= 1.31,
+            Qt > 100
+        ]
+        choices = [
+            'Sensitive fine-grained',
+            'Clay - organic soil',
+            'Clay to silty clay',
+            'Stiff fine-grained',
+            'Silt mixtures - clayey silt to silty clay',
+            'Stiff sand to clayey sand',
+            'Sand mixtures - silty sand to sandy silt',
+            'Dense sand to gravelly sand'
+        ]
+        return np.select(conditions, choices, default='Sands - clean sand to silty sand')
+
+    @staticmethod
+    def calculate_Ic_contours(Qt_range: Tuple[float, float],
                               num_points: int = 100) -> Dict[float, np.ndarray]:
         """
         Calculate Ic contour lines for Robertson 1990 classification.
-        Same formula as Robertson 2009.
+        Same formula as Robertson 2009; cached, arrays read-only.
         """
-        Ic_values = [1.31, 2.05, 2.60, 2.95, 3.60]
-        contours = {}
-        
-        Qt_array = np.logspace(np.log10(Qt_range[0]), np.log10(Qt_range[1]), num_points)
-        
-        for Ic in Ic_values:
-            log_Qt = np.log10(Qt_array)
-            discriminant = Ic**2 - (3.47 - log_Qt)**2
-            
-            valid_idx = discriminant >= 0
-            Fr_array = np.full_like(Qt_array, np.nan)
-            Fr_array[valid_idx] = 10**(np.sqrt(discriminant[valid_idx]) - 1.22)
-            
-            contours[Ic] = np.column_stack([Qt_array, Fr_array])
-        
-        return contours
+        return _compute_Ic_contours(tuple(map(float, Qt_range)), num_points,
+                                    (1.31, 2.05, 2.60, 2.95, 3.60))
+
+
+# Zone code -> name lookup for the vectorized Schneider classifier; the
+# ladder order below must match classify_soil_type
+_SCHNEIDER_NAMES = np.array([
+    'Drained sands',
+    'Transitional soils',
+    'Clays - high friction',
+    'Clays - standard',
+    'Sensitive and cemented clays',
+])
+_SCHNEIDER_CODES = np.arange(len(_SCHNEIDER_NAMES), dtype=np.uint8)
+
+
+_ZONES_SCHNEIDER = MappingProxyType({
+    '1a': {
+        'name': 'Clays - high friction',
+        'description': 'Claylike soils with higher friction ratios',
+        'color': '#8B4513',
+        'F_min': 2.0
+    },
+    '1b': {
+        'name': 'Clays - standard',
+        'description': 'Standard claylike soils',
+        'color': '#A0522D',
+        'F_range': (1.0, 2.0)
+    },
+    '1c': {
+        'name': 'Sensitive and cemented clays',
+        'description': 'Sensitive, structured or cemented clays',
+        'color': '#654321',
+        'F_max': 1.0
+    },
+    '2': {
+        'name': 'Drained sands',
+        'description': 'Essentially drained sands and gravels',
+        'color': '#FFD700',
+        'Q_min': 20,
+        'drainage': 'drained'
+    },
+    '3': {
+        'name': 'Transitional soils',
+        'description': 'Partially drained transitional soils (silts)',
+        'color': '#DEB887',
+        'drainage': 'partial'
+    }
+})
 
 
 class Schneider2008Classification:
@@ -357,46 +490,14 @@ class Schneider2008Classification:
     Schneider et al. (2008) CPTu soil classification chart implementation.
     Focuses on drainage conditions and uses Q-F and Q-Bq charts.
     """
-    
+
     @staticmethod
-    def get_classification_zones() -> Dict[str, Dict]:
+    def get_classification_zones() -> Mapping[str, Dict]:
         """
         Returns the Schneider (2008) soil behavior type zone definitions.
         """
-        return {
-            '1a': {
-                'name': 'Clays - high friction',
-                'description': 'Claylike soils with higher friction ratios',
-                'color': '#8B4513',
-                'F_min': 2.0
-            },
-            '1b': {
-                'name': 'Clays - standard',
-                'description': 'Standard claylike soils',
-                'color': '#A0522D',
-                'F_range': (1.0, 2.0)
-            },
-            '1c': {
-                'name': 'Sensitive and cemented clays',
-                'description': 'Sensitive, structured or cemented clays',
-                'color': '#654321',
-                'F_max': 1.0
-            },
-            '2': {
-                'name': 'Drained sands',
-                'description': 'Essentially drained sands and gravels',
-                'color': '#FFD700',
-                'Q_min': 20,
-                'drainage': 'drained'
-            },
-            '3': {
-                'name': 'Transitional soils',
-                'description': 'Partially drained transitional soils (silts)',
-                'color': '#DEB887',
-                'drainage': 'partial'
-            }
-        }
-    
+        return _ZONES_SCHNEIDER
+
     @staticmethod
     def classify_soil_type(Q: float, F: float, Bq: Optional[float] = None) -> str:
         """
@@ -433,25 +534,49 @@ class Schneider2008Classification:
             return 'Transitional soils'
     
     @staticmethod
+    def classify_soil_type_vec(Q: np.ndarray, F: np.ndarray) -> np.ndarray:
+        """
+        Vectorized version of classify_soil_type for whole CPT profiles.
+
+        The branch ladder is resolved to small integer zone codes first;
+        one fancy-indexing pass into the name table then materializes the
+        strings, instead of np.select broadcasting string choices.
+        """
+        Q = np.asarray(Q)
+        F = np.asarray(F)
+
+        conditions = [
+            (Q > 20) & (F < 2.0),
+            (Q > 10) & (F < 4.0),
+            (Q < 20) & (F >= 2.0),
+            (Q < 20) & (F >= 1.0),
+            Q < 20
+        ]
+        codes = np.select(conditions, _SCHNEIDER_CODES, default=1)
+        return _SCHNEIDER_NAMES[codes]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
     def calculate_zone_boundaries() -> Dict[str, np.ndarray]:
         """
         Calculate zone boundary lines for Schneider 2008 Q-F chart.
+        Cached: the geometry is constant, and callers get the same
+        read-only arrays on every call.
         """
         boundaries = {}
-        
-        # Q range for plotting
-        Q_array = np.logspace(0, 3, 100)  # 1 to 1000
-        
+
         # Boundary between zones 1 and 2/3 (Q = 20)
         boundaries['sand_boundary'] = np.array([[20, 0.1], [20, 10]])
-        
+
         # Boundary between zones 2 and 3 (Q = 10, F = 2)
         boundaries['transitional_boundary'] = np.array([[10, 0.1], [10, 4]])
-        
+
         # Zone 1 subdivisions based on F values
         boundaries['zone_1a_1b'] = np.array([[0.1, 2.0], [20, 2.0]])
         boundaries['zone_1b_1c'] = np.array([[0.1, 1.0], [20, 1.0]])
-        
+
+        for arr in boundaries.values():
+            arr.flags.writeable = False
         return boundaries
 
 
@@ -469,41 +594,47 @@ class ClassificationComparator:
         Returns a DataFrame with both classifications and agreement statistics.
         """
         comparison = data.copy()
-        
-        if method1 == 'Robertson2009':
-            comparison['method1_soil_type'] = data['soil_type']
-        elif method1 == 'Robertson1990':
-            comparison['method1_soil_type'] = data.apply(
-                lambda row: Robertson1990Classification.classify_soil_type(
-                    row['Qt1'], row['Fr'], row['Ic']
-                ), axis=1
-            )
-        elif method1 == 'Schneider2008':
-            comparison['method1_soil_type'] = data.apply(
-                lambda row: Schneider2008Classification.classify_soil_type(
-                    row['Qt1'], row['Fr']
-                ), axis=1
-            )
-        
-        if method2 == 'Robertson2009':
-            comparison['method2_soil_type'] = data['soil_type']
-        elif method2 == 'Robertson1990':
-            comparison['method2_soil_type'] = data.apply(
-                lambda row: Robertson1990Classification.classify_soil_type(
-                    row['Qt1'], row['Fr'], row['Ic']
-                ), axis=1
-            )
-        elif method2 == 'Schneider2008':
-            comparison['method2_soil_type'] = data.apply(
-                lambda row: Schneider2008Classification.classify_soil_type(
-                    row['Qt1'], row['Fr']
-                ), axis=1
-            )
-        
-        # Calculate agreement
-        comparison['agreement'] = comparison['method1_soil_type'] == comparison['method2_soil_type']
-        
+
+        if method1 == method2:
+            # Same method in both slots: classify once, agreement is
+            # trivially True everywhere
+            classified = pd.Categorical(
+                ClassificationComparator._classify(data, method1))
+            comparison['method1_soil_type'] = classified
+            comparison['method2_soil_type'] = classified
+            comparison['agreement'] = True
+            return comparison
+
+        m1 = np.asarray(ClassificationComparator._classify(data, method1))
+        m2 = np.asarray(ClassificationComparator._classify(data, method2))
+
+        # Encode both columns against one shared category table so the
+        # agreement check is an int8 code compare, not an elementwise
+        # string compare
+        cats = pd.CategoricalDtype(np.union1d(np.unique(m1), np.unique(m2)))
+        c1 = pd.Categorical(m1, dtype=cats)
+        c2 = pd.Categorical(m2, dtype=cats)
+        comparison['method1_soil_type'] = c1
+        comparison['method2_soil_type'] = c2
+        comparison['agreement'] = c1.codes == c2.codes
+
         return comparison
+
+    @staticmethod
+    def _classify(data: pd.DataFrame, method: str):
+        """
+        Classify every sample with the named method's vectorized
+        classifier — one array pass instead of a per-row apply.
+        """
+        if method == 'Robertson2009':
+            return data['soil_type']
+        if method == 'Robertson1990':
+            return Robertson1990Classification.classify_soil_type_vec(
+                data['Qt1'].to_numpy(), data['Fr'].to_numpy(), data['Ic'].to_numpy())
+        if method == 'Schneider2008':
+            return Schneider2008Classification.classify_soil_type_vec(
+                data['Qt1'].to_numpy(), data['Fr'].to_numpy())
+        raise ValueError(f"Unknown classification method: {method}")
     
     @staticmethod
     def get_agreement_statistics(comparison: pd.DataFrame) -> Dict:
@@ -120,33 +120,22 @@ class SoilPropertyDatabase:
                 'description': 'Very dense clean sand, negligible compressibility'
             }
         }
-    
-    def get_typical_properties(self, soil_type: str) -> Dict:
-        """Get typical property ranges for a soil type."""
-        return self.soil_properties.get(soil_type, None)
-    
-    def get_soil_type_from_ic(self, Ic: float) -> str:
-        """Determine soil type from Soil Behavior Type Index (Ic)."""
-        for soil_type, props in self.soil_properties.items():
-            ic_min, ic_max = props['Ic_range']
-            if ic_min <= Ic <= ic_max:
-                return soil_type
-        return "Unknown"
-    
-    def validate_parameter(self, soil_type: str, parameter_name: str, value: float) -> Tuple[bool, str]:
-        """
-        Validate if a calculated parameter falls within typical ranges.
-        
-        Returns:
-        - (True, "within range") if value is typical
-        - (False, warning_message) if value is outside typical range
-        """
-        props = self.get_typical_properties(soil_type)
-        if props is None:
-            return (True, "Unknown soil type")
-        
-        # Map parameter names to database keys
-        param_map = {
+
+        # Vectorized lookup tables: parameter columns in warning order and
+        # a (n_soiltypes, n_params, 2) min/max array indexed by soil type
+        self._param_columns = ['youngs_modulus', 'compression_index',
+                               'recompression_index', 'OCR', 'permeability',
+                               'friction_angle', 'undrained_shear_strength']
+        self._param_display = ['E', 'Cc', 'Cr', 'OCR', 'k', 'φ', 'cu']
+        self._soil_type_index = {name: i for i, name in enumerate(self.soil_properties)}
+        self._ranges = np.array([
+            [props[f'{col}_range'] for col in self._param_columns]
+            for props in self.soil_properties.values()
+        ])
+
+        # Flat (soil_type, parameter_alias) -> (min, max) table so
+        # validate_parameter is a single hashmap lookup per call
+        param_aliases = {
             'youngs_modulus': 'youngs_modulus_range',
             'E': 'youngs_modulus_range',
             'compression_index': 'compression_index_range',
@@ -163,12 +152,101 @@ class SoilPropertyDatabase:
             'unit_weight': 'unit_weight_range',
             'gamma': 'unit_weight_range'
         }
+        self._flat_ranges: Dict[Tuple[str, str], Tuple[float, float]] = {}
+        for soil_type, props in self.soil_properties.items():
+            for alias, range_key in param_aliases.items():
+                if range_key in props:
+                    self._flat_ranges[(soil_type, alias)] = props[range_key]
+
+        # Canonical-form -> database key resolution so the name variants
+        # other classifiers emit ("Sensitive fine-grained", "Clays -
+        # standard", ...) still hit their reference ranges instead of
+        # silently failing every lookup
+        self._alias_to_type = {self._canonicalize(name): name
+                               for name in self.soil_properties}
+        self._alias_to_type.update({
+            self._canonicalize(alias): target for alias, target in {
+                # Robertson (1990) vocabulary
+                'Clay - organic soil': 'Organic soil',
+                'Clay to silty clay': 'Silty clay to clay',
+                'Silt mixtures - clayey silt to silty clay': 'Clayey silt to silty clay',
+                'Sand mixtures - silty sand to sandy silt': 'Silty sand to sandy silt',
+                'Sands - clean sand to silty sand': 'Sand to silty sand',
+                'Dense sand to gravelly sand': 'Sand',
+                'Stiff sand to clayey sand': 'Sand to silty sand',
+                'Stiff fine-grained': 'Clay',
+                # Robertson (2009) vocabulary
+                'Clays: silty clay to clay': 'Silty clay to clay',
+                'Gravelly sand to dense sand': 'Sand',
+                'Organic soils - clay': 'Organic soil',
+                # Schneider (2008) vocabulary
+                'Drained sands': 'Sand',
+                'Transitional soils': 'Sandy silt to clayey silt',
+                'Clays - high friction': 'Clay',
+                'Clays - standard': 'Clay',
+                'Sensitive and cemented clays': 'Sensitive fine grained',
+            }.items()
+        })
+
+        # Sorted Ic breakpoints with the winning soil type per bin (the
+        # declaration order above breaks ties on shared edges, e.g. 3.6)
+        self._ic_breakpoints = np.array([0.0, 1.31, 1.8, 2.05, 2.6, 2.95, 3.6])
+        self._ic_soil_types = np.array([
+            'Sand', 'Sand to silty sand', 'Silty sand to sandy silt',
+            'Sandy silt to clayey silt', 'Clayey silt to silty clay',
+            'Clay', 'Sensitive fine grained'
+        ])
+
+    @staticmethod
+    def _canonicalize(name: str) -> str:
+        """Normalize a soil type name: lowercase, hyphens and punctuation
+        to spaces, whitespace collapsed."""
+        cleaned = ''.join(c if c.isalnum() else ' ' for c in name.lower())
+        return ' '.join(cleaned.split())
+
+    def _resolve_soil_type(self, soil_type: str) -> str:
+        """Map a (possibly variant) soil type name to its database key,
+        or None when no known form matches."""
+        if soil_type in self.soil_properties:
+            return soil_type
+        return self._alias_to_type.get(self._canonicalize(soil_type))
+
+    def get_typical_properties(self, soil_type: str) -> Dict:
+        """Get typical property ranges for a soil type."""
+        key = self._resolve_soil_type(soil_type)
+        return self.soil_properties[key] if key is not None else None
+    
+    def get_soil_type_from_ic(self, Ic: float) -> str:
+        """Determine soil type from Soil Behavior Type Index (Ic)."""
+        if Ic < 0.0 or Ic > 4.0:
+            return "Unknown"
+        idx = np.searchsorted(self._ic_breakpoints, Ic, side='right') - 1
+        return str(self._ic_soil_types[idx])
+
+    def get_soil_types_from_ic_array(self, Ic: np.ndarray) -> np.ndarray:
+        """Vectorized get_soil_type_from_ic for whole profiles."""
+        Ic = np.asarray(Ic)
+        idx = np.searchsorted(self._ic_breakpoints, Ic, side='right') - 1
+        types = self._ic_soil_types[np.clip(idx, 0, len(self._ic_soil_types) - 1)]
+        return np.where((Ic < 0.0) | (Ic > 4.0), 'Unknown', types)
+    
+    def validate_parameter(self, soil_type: str, parameter_name: str, value: float) -> Tuple[bool, str]:
+        """
+        Validate if a calculated parameter falls within typical ranges.
         
-        range_key = param_map.get(parameter_name)
-        if range_key is None or range_key not in props:
+        Returns:
+        - (True, "within range") if value is typical
+        - (False, warning_message) if value is outside typical range
+        """
+        key = self._resolve_soil_type(soil_type)
+        if key is None:
+            return (True, "Unknown soil type")
+
+        rng = self._flat_ranges.get((key, parameter_name))
+        if rng is None:
             return (True, f"Parameter '{parameter_name}' not in database")
-        
-        min_val, max_val = props[range_key]
+
+        min_val, max_val = rng
         
         # Allow some tolerance for boundary cases
         tolerance = 0.2  # 20% tolerance
@@ -182,59 +260,120 @@ class SoilPropertyDatabase:
         else:
             return (False, f"⚠️ Outside typical range: expected {min_val:.2e} to {max_val:.2e}, got {value:.2e}")
     
+    @staticmethod
+    def _format_range(values: np.ndarray, fmt: str) -> pd.Series:
+        """Format an (N, 2) min/max array as 'min - max' strings."""
+        return (pd.Series(values[:, 0]).map(fmt.format) + ' - '
+                + pd.Series(values[:, 1]).map(fmt.format))
+
     def get_database_summary(self) -> pd.DataFrame:
         """Get a summary dataframe of all soil types and their properties."""
-        data = []
-        for soil_type, props in self.soil_properties.items():
-            data.append({
-                'Soil Type': soil_type,
-                'Ic Range': f"{props['Ic_range'][0]:.2f} - {props['Ic_range'][1]:.2f}",
-                'E (kPa)': f"{props['youngs_modulus_range'][0]:.0f} - {props['youngs_modulus_range'][1]:.0f}",
-                'Cc': f"{props['compression_index_range'][0]:.3f} - {props['compression_index_range'][1]:.3f}",
-                'φ (°)': f"{props['friction_angle_range'][0]:.0f} - {props['friction_angle_range'][1]:.0f}" if props['friction_angle_range'][0] > 0 else "N/A",
-                'Description': props['description']
-            })
-        
-        return pd.DataFrame(data)
+        props = list(self.soil_properties.values())
+        ic = np.array([p['Ic_range'] for p in props])
+        E = np.array([p['youngs_modulus_range'] for p in props])
+        Cc = np.array([p['compression_index_range'] for p in props])
+        phi = np.array([p['friction_angle_range'] for p in props])
+
+        return pd.DataFrame({
+            'Soil Type': list(self.soil_properties),
+            'Ic Range': self._format_range(ic, '{:.2f}'),
+            'E (kPa)': self._format_range(E, '{:.0f}'),
+            'Cc': self._format_range(Cc, '{:.3f}'),
+            'φ (°)': np.where(phi[:, 0] > 0,
+                              self._format_range(phi, '{:.0f}'), 'N/A'),
+            'Description': [p['description'] for p in props]
+        })
     
+    _WARNING_COLUMNS = ['layer_number', 'soil_type', 'parameter', 'value',
+                        'min', 'max', 'near_boundary', 'message']
+
+    def validate_all_parameters(self, layer_params: pd.DataFrame) -> pd.DataFrame:
+        """
+        Validate every layer parameter against typical database ranges.
+
+        Returns one row per out-of-range value, built columnar from the
+        (n_layers, n_params) range check — no per-warning dict
+        accumulation. Columns: layer_number, soil_type, parameter, value,
+        min, max, near_boundary, message.
+        """
+        empty = pd.DataFrame(columns=self._WARNING_COLUMNS)
+
+        present = [c for c in self._param_columns if c in layer_params.columns]
+        if len(layer_params) == 0 or not present or 'soil_type' not in layer_params.columns:
+            return empty
+
+        # Unknown soil types have no reference ranges and produce no warnings
+        # Resolve each distinct name once (handles classifier variants),
+        # then map the whole column through the small dict
+        idx_by_name = {
+            name: self._soil_type_index.get(self._resolve_soil_type(name))
+            for name in layer_params['soil_type'].unique()
+        }
+        soil_idx_series = layer_params['soil_type'].map(idx_by_name)
+        known = soil_idx_series.notna().to_numpy()
+        if not known.any():
+            return empty
+
+        sub = layer_params.loc[known]
+        soil_idx = soil_idx_series.to_numpy()[known].astype(int)
+        col_idx = np.array([self._param_columns.index(c) for c in present])
+
+        vals = sub[present].to_numpy(dtype=float)
+        lo = self._ranges[soil_idx[:, None], col_idx, 0]
+        hi = self._ranges[soil_idx[:, None], col_idx, 1]
+
+        out_of_range = (vals < lo) | (vals > hi)
+
+        # Strength parameters are only meaningful when positive
+        for special in ('friction_angle', 'undrained_shear_strength'):
+            if special in present:
+                j = present.index(special)
+                out_of_range[:, j] &= vals[:, j] > 0
+
+        # Same 20% tolerance as validate_parameter for boundary cases
+        tolerance = 0.2
+        near_boundary = (vals >= lo * (1 - tolerance)) & (vals <= hi * (1 + tolerance))
+
+        if 'layer_number' in sub.columns:
+            layer_nums = sub['layer_number'].to_numpy()
+        else:
+            layer_nums = sub.index.to_numpy() + 1
+        soil_types = sub['soil_type'].to_numpy()
+
+        rows, cols = np.where(out_of_range)
+        w_min = lo[rows, cols]
+        w_max = hi[rows, cols]
+        w_val = vals[rows, cols]
+        w_near = near_boundary[rows, cols]
+
+        fmt = '{:.2e}'.format
+        min_s = pd.Series(w_min).map(fmt)
+        max_s = pd.Series(w_max).map(fmt)
+        message = np.where(
+            w_near,
+            '⚠️ Near boundary: typical range is ' + min_s + ' to ' + max_s,
+            '⚠️ Outside typical range: expected ' + min_s + ' to ' + max_s
+            + ', got ' + pd.Series(w_val).map(fmt))
+
+        return pd.DataFrame({
+            'layer_number': layer_nums[rows],
+            'soil_type': soil_types[rows],
+            'parameter': np.asarray(self._param_display)[col_idx[cols]],
+            'value': w_val,
+            'min': w_min,
+            'max': w_max,
+            'near_boundary': w_near,
+            'message': message
+        })
+
     def compare_layer_properties(self, layer_params: pd.DataFrame) -> List[Dict]:
         """
         Compare calculated layer properties against typical database ranges.
-        
-        Returns list of warnings for parameters outside typical ranges.
+
+        Returns list of warnings for parameters outside typical ranges;
+        thin record view over validate_all_parameters for callers that
+        still want dicts.
         """
-        warnings = []
-        
-        for idx, layer in layer_params.iterrows():
-            soil_type = layer.get('soil_type', 'Unknown')
-            layer_num = layer.get('layer_number', idx + 1)
-            
-            # Check each parameter
-            parameters_to_check = [
-                ('youngs_modulus', 'E'),
-                ('compression_index', 'Cc'),
-                ('recompression_index', 'Cr'),
-                ('OCR', 'OCR'),
-                ('permeability', 'k')
-            ]
-            
-            if 'friction_angle' in layer and layer['friction_angle'] > 0:
-                parameters_to_check.append(('friction_angle', 'φ'))
-            if 'undrained_shear_strength' in layer and layer['undrained_shear_strength'] > 0:
-                parameters_to_check.append(('undrained_shear_strength', 'cu'))
-            
-            for param_key, param_display in parameters_to_check:
-                if param_key in layer:
-                    value = layer[param_key]
-                    is_valid, message = self.validate_parameter(soil_type, param_key, value)
-                    
-                    if not is_valid:
-                        warnings.append({
-                            'layer_number': layer_num,
-                            'soil_type': soil_type,
-                            'parameter': param_display,
-                            'value': value,
-                            'message': message
-                        })
-        
-        return warnings
+        flags = self.validate_all_parameters(layer_params)
+        return flags[['layer_number', 'soil_type', 'parameter',
+                      'value', 'message']].to_dict('records')
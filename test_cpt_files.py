@@ -51,6 +51,17 @@ sample_data = """0.082  0.01    0       0
 3.199   28.87   0.512   -5.535
 3.281   32.53   0.503   -3.994"""
 
+def parse_sample_direct():
+    """
+    Parse sample_data straight through the pandas C engine — a fast
+    pre-parsed baseline for the numeric stages and a cross-check for
+    the processor's own parser.
+    """
+    df = pd.read_csv(StringIO(sample_data), sep=r'\s+', header=None,
+                     engine='c', dtype='float64')
+    df.columns = ['depth', 'qc', 'fs', 'u2']
+    return df
+
 def test_file_processing():
     print("=" * 70)
     print("TESTING CPT FILE PROCESSING")
@@ -74,6 +85,12 @@ def test_file_processing():
         df = processor.parse_text(mock_file)
         print(f"   ✓ Successfully parsed {len(df)} rows")
         print(f"   ✓ Columns: {list(df.columns)}")
+
+        # Cross-check against a direct C-engine parse of the same text
+        baseline = parse_sample_direct()
+        pd.testing.assert_frame_equal(
+            df[['depth', 'qc', 'fs', 'u2']], baseline, check_dtype=False)
+        print(f"   ✓ Parser output matches direct C-engine parse")
         print(f"   ✓ Depth range: {df['depth'].min():.2f}m to {df['depth'].max():.2f}m")
         print(f"   ✓ qc range: {df['qc'].min():.2f} to {df['qc'].max():.2f} kPa")
         print(f"\n   Sample data (first 5 rows):")
@@ -111,6 +128,15 @@ def test_file_processing():
         print(f"   ✓ Soil types identified in data:")
         for soil, count in soil_types.items():
             print(f"      - {soil}: {count} points")
+
+        # Every classification name the processor can emit must resolve
+        # in the soil property database (validation tab depends on it)
+        from soil_database import SoilPropertyDatabase
+        soil_db = SoilPropertyDatabase()
+        unresolved = [name for name in CPTProcessor._SOIL_TYPES
+                      if soil_db._resolve_soil_type(name) is None]
+        assert not unresolved, f"Unresolved soil types: {unresolved}"
+        print(f"   ✓ All classification names resolve in the soil database")
     except Exception as e:
         print(f"   ✗ ERROR: {e}")
         import traceback
@@ -40,6 +40,79 @@ class CPT3DVisualizer:
             'Very stiff sand to clayey sand': 8,
             'Very stiff, over-consolidated or cemented': 9
         }
+
+        # Reverse lookup: numeric soil code -> color, for plan-view
+        # markers derived from interpolated (numeric) values
+        self._numeric_to_color = {v: self.soil_colors[k]
+                                  for k, v in self.soil_type_numeric.items()}
+
+        # Delaunay triangulations keyed by CPT coordinates: sliding the
+        # depth slider re-interpolates over the same points, so the
+        # expensive triangulation is built once per layout
+        self._tri_cache = {}
+
+        # Interpolated cross-section grids keyed by section geometry and
+        # sounding content hashes; bounded like the triangulation cache
+        self._section_cache = {}
+
+        # Unit meshgrids per size, scaled to plot extents on demand.
+        # float32 is plenty for plot geometry (Plotly downcasts for JSON
+        # anyway) and halves the grid memory traffic
+        self._unit_grids = {}
+
+    def _scaled_grid(self, x_min, x_max, y_min, y_max, size):
+        """(size, size) float32 meshgrid spanning the given extents,
+        built by scaling a cached unit grid."""
+        grid = self._unit_grids.get(size)
+        if grid is None:
+            unit = np.linspace(0.0, 1.0, size, dtype=np.float32)
+            grid = np.meshgrid(unit, unit)
+            self._unit_grids[size] = grid
+        unit_x, unit_y = grid
+        xi = np.float32(x_min) + np.float32(x_max - x_min) * unit_x
+        yi = np.float32(y_min) + np.float32(y_max - y_min) * unit_y
+        return xi, yi
+
+    def _get_triangulation(self, x_coords, y_coords):
+        """Build (or fetch) the Delaunay triangulation for a CPT layout."""
+        from scipy.spatial import Delaunay
+
+        key = (tuple(x_coords), tuple(y_coords))
+        tri = self._tri_cache.get(key)
+        if tri is None:
+            tri = Delaunay(np.column_stack([x_coords, y_coords]))
+            if len(self._tri_cache) >= 8:
+                self._tri_cache.pop(next(iter(self._tri_cache)))
+            self._tri_cache[key] = tri
+        return tri
+
+    def _interpolate_grid(self, x_coords, y_coords, values, xi, yi, method):
+        """
+        griddata equivalent that reuses a cached triangulation, so only
+        the cheap per-value interpolator is rebuilt between depth slices.
+        """
+        from scipy.interpolate import (CloughTocher2DInterpolator,
+                                       LinearNDInterpolator)
+
+        # Contiguous float64 values up front, so Qhull/the interpolators
+        # don't make hidden copies of list or downcast inputs
+        values = np.ascontiguousarray(values, dtype=np.float64)
+
+        if method == 'nearest':
+            # Direct KD-tree query: nearest-neighbour needs no Delaunay
+            # structure, and with the 1-2 anchor points this branch
+            # serves, tree build plus query is essentially free
+            from scipy.spatial import cKDTree
+            tree = cKDTree(np.column_stack([x_coords, y_coords]))
+            _, idx = tree.query(np.column_stack([np.ravel(xi), np.ravel(yi)]))
+            return values[idx].reshape(np.shape(xi))
+
+        tri = self._get_triangulation(x_coords, y_coords)
+        if method == 'cubic':
+            interp = CloughTocher2DInterpolator(tri, values)
+        else:
+            interp = LinearNDInterpolator(tri, values)
+        return interp(xi, yi)
     
     def create_3d_soil_profile(self, cpt_locations):
         """
@@ -60,38 +133,51 @@ class CPT3DVisualizer:
             3D visualization figure
         """
         fig = go.Figure()
-        
-        # Add each CPT as a 3D scatter trace
+
+        # Batch all CPTs into one trace: per-trace overhead dominates
+        # rendering when many soundings are loaded, so pre-allocate
+        # structure-of-arrays buffers and fill them in one pass.
+        # float32 coordinates: plot geometry precision, half the bytes
+        total_points = sum(len(cpt_info['data']) for cpt_info in cpt_locations.values())
+        x_points = np.empty(total_points, dtype=np.float32)
+        y_points = np.empty(total_points, dtype=np.float32)
+        z_points = np.empty(total_points, dtype=np.float32)
+        colors = np.empty(total_points, dtype=object)
+        texts = np.empty(total_points, dtype=object)
+
+        offset = 0
         for cpt_name, cpt_info in cpt_locations.items():
-            x_coord = cpt_info['x']
-            y_coord = cpt_info['y']
             data = cpt_info['data']
-            
-            # Create arrays for 3D plotting
-            x_points = np.full(len(data), x_coord)
-            y_points = np.full(len(data), y_coord)
-            z_points = -data['depth'].values  # Negative for downward depth
-            
-            # Map soil types to colors
-            colors = [self.soil_colors.get(st, '#808080') for st in data['soil_type']]
-            
-            # Add scatter trace for this CPT
-            fig.add_trace(go.Scatter3d(
-                x=x_points,
-                y=y_points,
-                z=z_points,
-                mode='markers',
-                marker=dict(
-                    size=4,
-                    color=colors,
-                    line=dict(width=0.5, color='white')
-                ),
-                name=cpt_name,
-                text=[f"Depth: {d:.2f}m<br>Soil: {st}" 
-                      for d, st in zip(data['depth'], data['soil_type'])],
-                hoverinfo='text'
-            ))
-        
+            n = len(data)
+            sl = slice(offset, offset + n)
+
+            x_points[sl] = cpt_info['x']
+            y_points[sl] = cpt_info['y']
+            z_points[sl] = -data['depth'].values  # Negative for downward depth
+
+            # Map soil types to colors and hover text as whole columns
+            colors[sl] = data['soil_type'].map(self.soil_colors).fillna('#808080').to_numpy()
+            texts[sl] = (f"{cpt_name}<br>Depth: "
+                         + data['depth'].map('{:.2f}'.format)
+                         + 'm<br>Soil: ' + data['soil_type'].astype(str)).to_numpy()
+            offset += n
+
+        # Single scatter trace covering every CPT
+        fig.add_trace(go.Scatter3d(
+            x=x_points,
+            y=y_points,
+            z=z_points,
+            mode='markers',
+            marker=dict(
+                size=4,
+                color=colors,
+                line=dict(width=0.5, color='white')
+            ),
+            name='CPT soundings',
+            text=texts,
+            hoverinfo='text'
+        ))
+
         # Update layout
         fig.update_layout(
             title='3D Spatial CPT Soil Profile Visualization',
@@ -104,9 +190,9 @@ class CPT3DVisualizer:
                 )
             ),
             height=700,
-            showlegend=True
+            showlegend=False
         )
-        
+
         return fig
     
     def create_layer_surfaces(self, cpt_locations, target_layers=None):
@@ -126,56 +212,39 @@ class CPT3DVisualizer:
             3D surface visualization
         """
         fig = go.Figure()
-        
-        # Extract coordinates and layer data
-        x_coords = []
-        y_coords = []
-        layer_depths = {}
-        
-        for cpt_name, cpt_info in cpt_locations.items():
-            x_coords.append(cpt_info['x'])
-            y_coords.append(cpt_info['y'])
-            
-            # Get layer top/bottom depths
-            layers = cpt_info['layers']
-            for i, layer in enumerate(layers):
-                layer_key = f"layer_{i}"
-                if layer_key not in layer_depths:
-                    layer_depths[layer_key] = {
-                        'top': [],
-                        'bottom': [],
-                        'soil_type': layer['soil_type']
-                    }
-                layer_depths[layer_key]['top'].append(layer['depth_top'])
-                layer_depths[layer_key]['bottom'].append(layer['depth_bottom'])
-        
-        # Convert to arrays
-        x_coords = np.array(x_coords)
-        y_coords = np.array(y_coords)
-        
+
+        # CPT coordinates
+        x_coords = np.array([info['x'] for info in cpt_locations.values()])
+        y_coords = np.array([info['y'] for info in cpt_locations.values()])
+
+        # Materialize every layer of every CPT into one frame and group
+        # by layer index, instead of growing per-layer Python lists
+        layers_df = pd.DataFrame([
+            {'x': info['x'], 'y': info['y'], 'layer': i,
+             'top': layer['depth_top'], 'bottom': layer['depth_bottom'],
+             'soil_type': layer['soil_type']}
+            for info in cpt_locations.values()
+            for i, layer in enumerate(info['layers'])
+        ], columns=['x', 'y', 'layer', 'top', 'bottom', 'soil_type'])
+
         # Create grid for interpolation
         if len(x_coords) >= 3:
-            xi = np.linspace(x_coords.min(), x_coords.max(), 50)
-            yi = np.linspace(y_coords.min(), y_coords.max(), 50)
-            xi, yi = np.meshgrid(xi, yi)
-            
+            xi, yi = self._scaled_grid(x_coords.min(), x_coords.max(),
+                                       y_coords.min(), y_coords.max(), 50)
+
             # Interpolate layer surfaces
-            from scipy.interpolate import griddata
-            
-            for layer_key, layer_data in layer_depths.items():
+            for li, group in layers_df.groupby('layer', sort=True):
+                layer_key = f"layer_{li}"
                 if target_layers and layer_key not in target_layers:
                     continue
-                
+
                 # Interpolate top surface
-                z_top = griddata(
-                    (x_coords, y_coords),
-                    -np.array(layer_data['top']),
-                    (xi, yi),
-                    method='linear'
-                )
-                
+                z_top = self._interpolate_grid(
+                    group['x'].to_numpy(), group['y'].to_numpy(),
+                    -group['top'].to_numpy(), xi, yi, method='linear')
+
                 # Get color for this soil type
-                soil_type = layer_data['soil_type']
+                soil_type = group['soil_type'].iloc[0]
                 color = self.soil_colors.get(soil_type, '#808080')
                 
                 # Add surface
@@ -191,8 +260,9 @@ class CPT3DVisualizer:
                 ))
         else:
             # Not enough points for surface interpolation, add vertical columns
+            names = list(cpt_locations)
             for i, (x, y) in enumerate(zip(x_coords, y_coords)):
-                cpt_name = list(cpt_locations.keys())[i]
+                cpt_name = names[i]
                 layers = cpt_locations[cpt_name]['layers']
                 
                 for j, layer in enumerate(layers):
@@ -226,6 +296,53 @@ class CPT3DVisualizer:
         
         return fig
     
+    def _section_grid(self, cpt_locations, start_point, end_point, num_points):
+        """
+        Interpolate the soil-code grid for one cross-section line.
+
+        Returns (distance, depth_points, soil_grid).
+        """
+        from scipy.spatial import cKDTree
+
+        # Create line between points
+        x_line = np.linspace(start_point[0], end_point[0], num_points)
+        y_line = np.linspace(start_point[1], end_point[1], num_points)
+        distance = np.sqrt((x_line - start_point[0])**2 + (y_line - start_point[1])**2)
+
+        # Collect all depth data from CPTs: one concat of per-CPT column
+        # blocks instead of growing four Python lists row by row
+        all_pts = pd.concat(
+            [info['data'].assign(x=info['x'], y=info['y'])[['x', 'y', 'depth', 'soil_type']]
+             for info in cpt_locations.values()],
+            ignore_index=True)
+        x_coords = all_pts['x'].to_numpy()
+        y_coords = all_pts['y'].to_numpy()
+        depths = all_pts['depth'].to_numpy()
+
+        # Convert to numeric soil types for interpolation; int8 codes
+        # keep the section grid 8x smaller than float64, and the column
+        # map replaces a per-element Python dict lookup
+        soil_numeric = (all_pts['soil_type'].map(self.soil_type_numeric)
+                        .fillna(5).to_numpy(dtype=np.int8))
+
+        # Create depth points for interpolation
+        max_depth = depths.max()
+        depth_points = np.linspace(0, max_depth, 100)
+
+        # Nearest-neighbour interpolation over the whole section in one
+        # batched KD-tree query — one tree build and one vectorized
+        # lookup instead of a griddata call (and tree rebuild) per depth
+        tree = cKDTree(np.column_stack([x_coords, y_coords, depths]))
+        section_points = np.column_stack([
+            np.tile(x_line, len(depth_points)),
+            np.tile(y_line, len(depth_points)),
+            np.repeat(depth_points, num_points)
+        ])
+        _, nearest_idx = tree.query(section_points)
+        soil_grid = soil_numeric[nearest_idx].reshape(len(depth_points), num_points)
+
+        return distance, depth_points, soil_grid
+
     def create_cross_section(self, cpt_locations, start_point, end_point, num_points=100):
         """
         Create a 2D cross-section view between two points.
@@ -246,54 +363,25 @@ class CPT3DVisualizer:
         fig : plotly figure
             Cross-section visualization
         """
-        from scipy.interpolate import griddata
-        
-        # Create line between points
-        x_line = np.linspace(start_point[0], end_point[0], num_points)
-        y_line = np.linspace(start_point[1], end_point[1], num_points)
-        distance = np.sqrt((x_line - start_point[0])**2 + (y_line - start_point[1])**2)
-        
-        # Collect all depth data from CPTs
-        x_coords = []
-        y_coords = []
-        depths = []
-        soil_types = []
-        
-        for cpt_name, cpt_info in cpt_locations.items():
-            data = cpt_info['data']
-            n_points = len(data)
-            x_coords.extend([cpt_info['x']] * n_points)
-            y_coords.extend([cpt_info['y']] * n_points)
-            depths.extend(data['depth'].values)
-            soil_types.extend(data['soil_type'].values)
-        
-        # Convert to numeric soil types for interpolation
-        soil_numeric = [self.soil_type_numeric.get(st, 5) for st in soil_types]
-        
-        # Create depth points for interpolation
-        max_depth = max(depths)
-        depth_points = np.linspace(0, max_depth, 100)
-        
-        # Create 2D grid for cross-section
-        distance_grid, depth_grid = np.meshgrid(distance, depth_points)
-        
-        # Interpolate soil types along the cross-section
-        soil_values = []
-        for d in depth_points:
-            depth_array = np.full(num_points, d)
-            points_3d = np.column_stack([x_line, y_line, depth_array])
-            
-            # Interpolate at these points
-            interpolated = griddata(
-                (x_coords, y_coords, depths),
-                soil_numeric,
-                (x_line, y_line, depth_array),
-                method='nearest'
-            )
-            soil_values.append(interpolated)
-        
-        soil_grid = np.array(soil_values)
-        
+        # Redrawing the same section over the same soundings is common
+        # with slider-driven dashboards: memoize the interpolated grid
+        # on the section geometry plus a content hash of each sounding
+        cache_key = (
+            tuple(map(float, start_point)), tuple(map(float, end_point)), num_points,
+            tuple((name, info['x'], info['y'],
+                   int(pd.util.hash_pandas_object(
+                       info['data'][['depth', 'soil_type']], index=False).sum()))
+                  for name, info in cpt_locations.items())
+        )
+        cached = self._section_cache.get(cache_key)
+        if cached is None:
+            cached = self._section_grid(cpt_locations, start_point, end_point,
+                                        num_points)
+            if len(self._section_cache) >= 8:
+                self._section_cache.pop(next(iter(self._section_cache)))
+            self._section_cache[cache_key] = cached
+        distance, depth_points, soil_grid = cached
+
         # Create figure
         fig = go.Figure()
         
@@ -307,13 +395,15 @@ class CPT3DVisualizer:
             hovertemplate='Distance: %{x:.1f}m<br>Depth: %{y:.2f}m<extra></extra>'
         ))
         
-        # Mark CPT locations on the cross-section
-        for cpt_name, cpt_info in cpt_locations.items():
-            x_dist = np.sqrt((cpt_info['x'] - start_point[0])**2 + 
-                           (cpt_info['y'] - start_point[1])**2)
-            
-            # Check if CPT is close to the line
-            if min(abs(distance - x_dist)) < 1.0:
+        # Mark CPT locations on the cross-section: distances and the
+        # proximity check for every CPT in one broadcast
+        cpt_x = np.array([info['x'] for info in cpt_locations.values()])
+        cpt_y = np.array([info['y'] for info in cpt_locations.values()])
+        cpt_dist = np.hypot(cpt_x - start_point[0], cpt_y - start_point[1])
+        near_line = np.abs(cpt_dist[:, None] - distance[None, :]).min(axis=1) < 1.0
+
+        for cpt_name, x_dist, is_near in zip(cpt_locations, cpt_dist, near_line):
+            if is_near:
                 fig.add_trace(go.Scatter(
                     x=[x_dist],
                     y=[0],
@@ -351,18 +441,23 @@ class CPT3DVisualizer:
         fig : plotly figure
             Plan view visualization
         """
-        from scipy.interpolate import griddata
-        
         x_coords = []
         y_coords = []
         soil_at_depth = []
         
         for cpt_name, cpt_info in cpt_locations.items():
             data = cpt_info['data']
-            
-            # Find soil type at the specified depth
-            idx = (data['depth'] - depth_slice).abs().idxmin()
-            soil_type = data.loc[idx, 'soil_type']
+
+            # Find soil type at the specified depth. CPT logs are depth-
+            # sorted, so a binary search plus one neighbour comparison
+            # replaces the full-column abs().idxmin() scan
+            depths_arr = data['depth'].to_numpy()
+            i = np.searchsorted(depths_arr, depth_slice)
+            i = min(i, len(depths_arr) - 1)
+            if i > 0 and (abs(depths_arr[i - 1] - depth_slice)
+                          <= abs(depths_arr[i] - depth_slice)):
+                i -= 1
+            soil_type = data['soil_type'].iloc[i]
             soil_numeric = self.soil_type_numeric.get(soil_type, 5)
             
             x_coords.append(cpt_info['x'])
@@ -371,7 +466,7 @@ class CPT3DVisualizer:
         
         x_coords = np.array(x_coords)
         y_coords = np.array(y_coords)
-        soil_at_depth = np.array(soil_at_depth)
+        soil_at_depth = np.array(soil_at_depth, dtype=np.int8)
         
         # Create figure
         fig = go.Figure()
@@ -381,16 +476,12 @@ class CPT3DVisualizer:
         
         if num_points >= 4:
             # Use cubic interpolation for 4+ points
-            xi = np.linspace(x_coords.min() - 5, x_coords.max() + 5, 100)
-            yi = np.linspace(y_coords.min() - 5, y_coords.max() + 5, 100)
-            xi, yi = np.meshgrid(xi, yi)
+            xi, yi = self._scaled_grid(x_coords.min() - 5, x_coords.max() + 5,
+                                       y_coords.min() - 5, y_coords.max() + 5,
+                                       100)
             
-            zi = griddata(
-                (x_coords, y_coords),
-                soil_at_depth,
-                (xi, yi),
-                method='cubic'
-            )
+            zi = self._interpolate_grid(x_coords, y_coords, soil_at_depth,
+                                        xi, yi, method='cubic')
             
             fig.add_trace(go.Contour(
                 x=xi[0],
@@ -406,16 +497,12 @@ class CPT3DVisualizer:
             ))
         elif num_points == 3:
             # Use linear interpolation for 3 points
-            xi = np.linspace(x_coords.min() - 5, x_coords.max() + 5, 100)
-            yi = np.linspace(y_coords.min() - 5, y_coords.max() + 5, 100)
-            xi, yi = np.meshgrid(xi, yi)
+            xi, yi = self._scaled_grid(x_coords.min() - 5, x_coords.max() + 5,
+                                       y_coords.min() - 5, y_coords.max() + 5,
+                                       100)
             
-            zi = griddata(
-                (x_coords, y_coords),
-                soil_at_depth,
-                (xi, yi),
-                method='linear'
-            )
+            zi = self._interpolate_grid(x_coords, y_coords, soil_at_depth,
+                                        xi, yi, method='linear')
             
             fig.add_trace(go.Heatmap(
                 x=xi[0],
@@ -436,17 +523,14 @@ class CPT3DVisualizer:
                 x_range = 10
                 y_range = 10
             
-            xi = np.linspace(x_coords.min() - x_range/2, x_coords.max() + x_range/2, 100)
-            yi = np.linspace(y_coords.min() - y_range/2, y_coords.max() + y_range/2, 100)
-            xi, yi = np.meshgrid(xi, yi)
+            xi, yi = self._scaled_grid(x_coords.min() - x_range/2,
+                                       x_coords.max() + x_range/2,
+                                       y_coords.min() - y_range/2,
+                                       y_coords.max() + y_range/2, 100)
             
             # Use nearest neighbor interpolation for simple visualization
-            zi = griddata(
-                (x_coords, y_coords),
-                soil_at_depth,
-                (xi, yi),
-                method='nearest'
-            )
+            zi = self._interpolate_grid(x_coords, y_coords, soil_at_depth,
+                                        xi, yi, method='nearest')
             
             fig.add_trace(go.Heatmap(
                 x=xi[0],
@@ -461,10 +545,8 @@ class CPT3DVisualizer:
         cpt_names = list(cpt_locations.keys())
         
         # Create color for markers based on soil type
-        marker_colors = [self.soil_colors.get(
-            [k for k, v in self.soil_type_numeric.items() if v == st][0] if st in self.soil_type_numeric.values() else 'Unknown',
-            '#808080'
-        ) for st in soil_at_depth]
+        marker_colors = [self._numeric_to_color.get(int(round(st)), '#808080')
+                         for st in soil_at_depth]
         
         fig.add_trace(go.Scatter(
             x=x_coords,